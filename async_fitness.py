@@ -0,0 +1,109 @@
+import asyncio
+import logging
+import os
+import signal
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
+
+logger = logging.getLogger('GA_Logger')
+
+
+def _is_async(function):
+    return asyncio.iscoroutinefunction(function) or asyncio.iscoroutinefunction(getattr(function, '__call__', None))
+
+
+class SubprocessEvaluation:
+    """
+    Wartość funkcji celu liczona przez zewnętrzny program: zmienne jednego
+    rozwiązania trafiają w jednej linii na stdin, program wypisuje wartość na stdout.
+    Każda ocena to osobny proces we własnej grupie procesów, zabijanej w całości
+    (razem z procesami potomnymi programu) po przekroczeniu limitu czasu.
+    """
+
+    def __init__(self, command):
+        self.command = list(command)
+
+    async def __call__(self, solution):
+        process = await asyncio.create_subprocess_exec(
+            *self.command, stdin=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE, start_new_session=True)
+        line = ' '.join(repr(float(value)) for value in solution) + '\n'
+        try:
+            stdout, stderr = await process.communicate(line.encode())
+        except asyncio.CancelledError:
+            self._kill(process)
+            await process.wait()
+            raise
+
+        if process.returncode != 0:
+            raise RuntimeError(f"Program {self.command[0]} zakończył się kodem {process.returncode}: "
+                               f"{stderr.decode().strip()}")
+        return float(stdout.split()[0])
+
+    @staticmethod
+    def _kill(process):
+        """
+        Zabija całą grupę procesów oceny (na systemach bez grup procesów tylko proces potomny)
+        """
+        if not hasattr(os, 'killpg'):
+            process.kill()
+            return
+        try:
+            os.killpg(process.pid, signal.SIGKILL)
+        except ProcessLookupError:
+            pass
+
+
+class AsyncEvaluator:
+    """
+    Funkcja celu (..., n) -> (...) oceniająca wiersze macierzy rozwiązań
+    współbieżnie: co najwyżej max_workers ocen naraz, każda z limitem czasu.
+    evaluate to funkcja asynchroniczna (np. SubprocessEvaluation) albo zwykła,
+    uruchamiana w puli wątków. Ocena, która przekroczy limit albo zgłosi błąd,
+    dostaje wartość penalty. Wyniki są zwracane w kolejności wierszy.
+    """
+
+    def __init__(self, evaluate, max_workers=4, timeout=None, penalty=1e10):
+        self.evaluate = evaluate
+        self.max_workers = max_workers
+        self.timeout = timeout
+        self.penalty = penalty
+        self.timeouts = 0
+        self.failures = 0
+
+    def __call__(self, X):
+        X = np.asarray(X, dtype=float)
+        solutions = X.reshape(-1, X.shape[-1])
+        values = asyncio.run(self._evaluate_all(solutions))
+        return np.asarray(values, dtype=float).reshape(X.shape[:-1])
+
+    async def _evaluate_all(self, solutions):
+        semaphore = asyncio.Semaphore(self.max_workers)
+        executor = None if _is_async(self.evaluate) else ThreadPoolExecutor(self.max_workers)
+        try:
+            return await asyncio.gather(*(self._evaluate_one(solution, semaphore, executor)
+                                          for solution in solutions))
+        finally:
+            if executor is not None:
+                # Wątki po przekroczeniu limitu czasu nie są przerywane, tylko porzucane
+                executor.shutdown(wait=False, cancel_futures=True)
+
+    async def _evaluate_one(self, solution, semaphore, executor):
+        async with semaphore:
+            if executor is None:
+                evaluation = self.evaluate(solution)
+            else:
+                evaluation = asyncio.get_running_loop().run_in_executor(executor, self.evaluate, solution)
+            try:
+                return float(await asyncio.wait_for(evaluation, self.timeout))
+            except asyncio.TimeoutError:
+                self.timeouts += 1
+                logger.warning(f"Ocena rozwiązania {solution} przekroczyła {self.timeout} s, "
+                               f"przypisano karę {self.penalty}")
+            except Exception as e:
+                self.failures += 1
+                logger.warning(f"Błąd oceny rozwiązania {solution}: {str(e)}, przypisano karę {self.penalty}")
+            return self.penalty
+
+    def stats(self):
+        return {'evaluation_timeouts': self.timeouts, 'evaluation_failures': self.failures}
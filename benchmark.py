@@ -0,0 +1,368 @@
+import copy
+import logging
+import time
+import numpy as np
+import pygad
+from crossover import Crossover
+from fitness_function import FitnessFunction
+from gene_bounds import GeneBounds
+from mutation import Mutation
+from packed_bits import PackedCrossover, PackedMutation, pack_bits
+from selection import Selection
+
+logging.basicConfig(level=logging.INFO,
+                    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+logger = logging.getLogger('GA_Logger')
+
+
+def _reference_ga(num_genes, gene_type=float, **arguments):
+    """
+    Minimalna instancja pygad.GA dająca dostęp do wbudowanych operatorów.
+    """
+    return pygad.GA(num_generations=1,
+                    num_parents_mating=2,
+                    sol_per_pop=2,
+                    num_genes=num_genes,
+                    gene_type=gene_type,
+                    fitness_func=lambda ga_instance, solution, solution_idx: 0.0,
+                    suppress_warnings=True,
+                    **arguments)
+
+
+def _time_call(func, repeats):
+    """
+    Zwraca najlepszy czas (w sekundach) z `repeats` wywołań funkcji.
+    """
+    best = float('inf')
+    for _ in range(repeats):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+class Benchmark:
+    """
+    Mikro-benchmarki operacji wykonywanych w każdej generacji
+    """
+
+    @staticmethod
+    def decode_binary_loop(binary_solution, max_val, min_val, num_genes, bits_per_gene):
+        """
+        Pierwotny dekoder z pętlami po genach i bitach (punkt odniesienia).
+        """
+        decoded_solution = np.zeros(num_genes)
+        for i in range(num_genes):
+            start_idx = i * bits_per_gene
+            end_idx = start_idx + bits_per_gene
+            gene_bits = binary_solution[start_idx:end_idx]
+
+            decimal_value = 0
+            for bit_idx, bit in enumerate(gene_bits):
+                decimal_value += int(bit) * (2 ** (bits_per_gene - bit_idx - 1))
+
+            max_decimal = 2 ** bits_per_gene - 1
+            gene_value = min_val + ((max_val - min_val) * decimal_value) / max_decimal
+            decoded_solution[i] = gene_value
+
+        return decoded_solution
+
+    @staticmethod
+    def decode_binary(pop_size=1000, num_genes=2, bits_per_gene_values=(20, 32, 64), repeats=5, seed=0):
+        """
+        Porównuje pętlowy dekoder z FitnessFunction.decode_binary_population
+        i sprawdza zgodność wyników.
+        """
+        rng = np.random.default_rng(seed)
+        results = []
+
+        for bits_per_gene in bits_per_gene_values:
+            population = rng.integers(0, 2, size=(pop_size, num_genes * bits_per_gene))
+
+            def loop():
+                return np.array([
+                    Benchmark.decode_binary_loop(solution, 20, -20, num_genes, bits_per_gene)
+                    for solution in population
+                ])
+
+            def vectorized():
+                return FitnessFunction.decode_binary_population(population, 20, -20, num_genes, bits_per_gene)
+
+            if not np.allclose(loop(), vectorized(), rtol=0, atol=1e-12):
+                raise AssertionError(f"Niezgodne wyniki dekodowania dla bits_per_gene={bits_per_gene}")
+
+            loop_time = _time_call(loop, repeats)
+            vectorized_time = _time_call(vectorized, repeats)
+            results.append({
+                'bits_per_gene': bits_per_gene,
+                'loop_time': loop_time,
+                'vectorized_time': vectorized_time,
+                'speedup': loop_time / vectorized_time
+            })
+            logger.info(f"decode_binary bits_per_gene={bits_per_gene}: "
+                        f"loop {loop_time * 1e3:.2f} ms, vectorized {vectorized_time * 1e3:.3f} ms, "
+                        f"speedup x{loop_time / vectorized_time:.0f}")
+
+        return results
+
+    @staticmethod
+    def crossover(pop_sizes=(1000, 10000), num_genes_values=(100, 1000), repeats=3, seed=0):
+        """
+        Porównuje wektorowe operatory z crossover.py z wbudowanymi operatorami PyGAD.
+        """
+        operators = [
+            ('single_point', Crossover.single_point, 'single_point_crossover'),
+            ('two_points', Crossover.two_points, 'two_points_crossover'),
+            ('uniform', Crossover.uniform, 'uniform_crossover'),
+        ]
+        rng = np.random.default_rng(seed)
+        results = []
+
+        for num_genes in num_genes_values:
+            ga_instance = _reference_ga(num_genes)
+            for pop_size in pop_sizes:
+                parents = rng.uniform(-20, 20, size=(pop_size // 2, num_genes))
+                offspring_size = (pop_size, num_genes)
+
+                for name, custom, builtin_name in operators:
+                    builtin = getattr(ga_instance, builtin_name)
+                    custom_time = _time_call(lambda: custom(parents, offspring_size, ga_instance), repeats)
+                    builtin_time = _time_call(lambda: builtin(parents, offspring_size), repeats)
+                    results.append({
+                        'operator': name,
+                        'pop_size': pop_size,
+                        'num_genes': num_genes,
+                        'custom_time': custom_time,
+                        'pygad_time': builtin_time
+                    })
+                    logger.info(f"crossover {name} pop={pop_size} genes={num_genes}: "
+                                f"custom {custom_time * 1e3:.2f} ms, pygad {builtin_time * 1e3:.2f} ms")
+
+        return results
+
+    @staticmethod
+    def mutation(pop_size=5000, num_genes=1000, repeats=3, seed=0):
+        """
+        Czas operatorów z mutation.py i mutacji losowej PyGAD dla dużej populacji.
+        """
+        np.random.seed(seed)
+        ga_instance = _reference_ga(num_genes)
+        offspring = np.random.uniform(-20, 20, size=(pop_size, num_genes))
+        operators = [
+            ('gaussian', lambda: Mutation.gaussian(offspring.copy(), ga_instance)),
+            ('adaptive_gaussian', lambda: Mutation.adaptive_gaussian(offspring.copy(), ga_instance)),
+            ('swap', lambda: Mutation.swap(offspring.copy(), ga_instance)),
+            ('pygad_random', lambda: ga_instance.random_mutation(offspring.copy())),
+            ('copy_only', lambda: offspring.copy()),
+        ]
+        results = []
+
+        for name, func in operators:
+            elapsed = _time_call(func, repeats)
+            results.append({'operator': name, 'pop_size': pop_size, 'num_genes': num_genes, 'time': elapsed})
+            logger.info(f"mutation {name} pop={pop_size} genes={num_genes}: {elapsed * 1e3:.2f} ms")
+
+        return results
+
+    @staticmethod
+    def gene_space(pop_size=100, num_genes=10_000, repeats=3, seed=0):
+        """
+        Mutacja losowa przy 10 tys. genów: PyGAD z gene_space jako listą słowników
+        (wpis dla każdego genu) i ze wspólnym zakresem oraz wektorowa Mutation.random
+        ze wspólnym zakresem i z tablicami low/high z gene_bounds.py.
+        """
+        np.random.seed(seed)
+        low, high = -20.0, 20.0
+        per_gene_space = [{'low': low, 'high': high}] * num_genes
+        pygad_space = _reference_ga(num_genes, gene_space=per_gene_space)
+        pygad_range = _reference_ga(num_genes)
+        global_bounds = _reference_ga(num_genes)
+        GeneBounds(low, high).attach(global_bounds)
+        array_bounds = _reference_ga(num_genes)
+        GeneBounds(np.full(num_genes, low), np.full(num_genes, high)).attach(array_bounds)
+        # Tyle samo mutowanych genów co w pygad (mutation_num_genes na potomka)
+        global_bounds.mutation_rate = array_bounds.mutation_rate = pygad_range.mutation_num_genes / num_genes
+
+        offspring = np.random.uniform(low, high, size=(pop_size, num_genes))
+        operators = [
+            ('pygad_gene_space_dicts', lambda: pygad_space.random_mutation(offspring.copy())),
+            ('pygad_global_range', lambda: pygad_range.random_mutation(offspring.copy())),
+            ('vectorized_global_bounds', lambda: Mutation.random(offspring.copy(), global_bounds)),
+            ('vectorized_array_bounds', lambda: Mutation.random(offspring.copy(), array_bounds)),
+        ]
+        results = []
+        for name, func in operators:
+            elapsed = _time_call(func, repeats)
+            results.append({'operator': name, 'pop_size': pop_size, 'num_genes': num_genes, 'time': elapsed})
+            logger.info(f"random mutation {name} pop={pop_size} genes={num_genes}: {elapsed * 1e3:.2f} ms")
+
+        return results
+
+    @staticmethod
+    def packed_binary(pop_size=1_000_000, num_genes=2, bits_per_gene=20, repeats=3, seed=0):
+        """
+        Pamięć i czas operatorów dla populacji binarnej: jeden gen int64 na bit
+        (tryb 'unpacked') i bity spakowane po 8 w bajcie (tryb 'packed').
+        """
+        np.random.seed(seed)
+        num_bits = num_genes * bits_per_gene
+        ga_instance = _reference_ga(num_bits, gene_type=int)
+        ga_instance.num_bits = num_bits
+        ga_instance.bit_flip_rate = 0.05
+
+        unpacked = np.random.randint(0, 2, size=(pop_size, num_bits))
+        packed = pack_bits(unpacked)
+        parents_unpacked, parents_packed = unpacked[:pop_size // 2], packed[:pop_size // 2]
+        operators = [
+            ('uniform_unpacked', lambda: Crossover.uniform(parents_unpacked, unpacked.shape, ga_instance)),
+            ('uniform_packed', lambda: PackedCrossover.uniform(parents_packed, packed.shape, ga_instance)),
+            ('two_points_unpacked', lambda: Crossover.two_points(parents_unpacked, unpacked.shape, ga_instance)),
+            ('two_points_packed', lambda: PackedCrossover.two_points(parents_packed, packed.shape, ga_instance)),
+            ('decode_unpacked', lambda: FitnessFunction.decode_binary_population(
+                unpacked, 20, -20, num_genes, bits_per_gene, encoding='gray')),
+            ('decode_packed', lambda: FitnessFunction.decode_binary_population(
+                packed, 20, -20, num_genes, bits_per_gene, encoding='gray', packed=True)),
+            ('bit_flip_packed', lambda: PackedMutation.bit_flip(packed.copy(), ga_instance)),
+        ]
+        logger.info(f"binary population pop={pop_size} bits={num_bits}: "
+                    f"unpacked {unpacked.nbytes / 2 ** 20:.1f} MiB, packed {packed.nbytes / 2 ** 20:.1f} MiB "
+                    f"(x{unpacked.nbytes / packed.nbytes:.0f})")
+
+        results = [{'operator': 'memory', 'unpacked_bytes': unpacked.nbytes, 'packed_bytes': packed.nbytes}]
+        for name, func in operators:
+            elapsed = _time_call(func, repeats)
+            results.append({'operator': name, 'pop_size': pop_size, 'num_bits': num_bits, 'time': elapsed})
+            logger.info(f"{name} pop={pop_size} bits={num_bits}: {elapsed * 1e3:.2f} ms")
+
+        return results
+
+    @staticmethod
+    def selection(pop_sizes=(1_000, 10_000, 100_000, 1_000_000), reference_max_pop=10_000, repeats=3, seed=0):
+        """
+        Selekcja num_parents = pop/2 rodziców: wbudowane metody pygad (pętle w Pythonie,
+        ruletka O(pop^2), więc liczone tylko do reference_max_pop) i selection.py.
+        """
+        np.random.seed(seed)
+        methods = [
+            ('tournament', 'tournament_selection', Selection.tournament),
+            ('rws', 'roulette_wheel_selection', Selection.rws),
+            ('sus', 'stochastic_universal_selection', Selection.sus),
+            ('rank', 'rank_selection', Selection.rank),
+        ]
+
+        results = []
+        for pop_size in pop_sizes:
+            num_parents = pop_size // 2
+            fitness = np.random.random(pop_size)
+            ga_instance = _reference_ga(2)
+            ga_instance.population = np.random.random((pop_size, 2))
+            ga_instance.K_tournament = 3
+
+            for name, pygad_method, vectorized in methods:
+                record = {'selection': name, 'pop_size': pop_size}
+                if pop_size <= reference_max_pop:
+                    method = getattr(ga_instance, pygad_method)
+                    record['pygad_time'] = _time_call(lambda: method(fitness, num_parents), 1)
+                record['vectorized_time'] = _time_call(
+                    lambda: vectorized(fitness, num_parents, ga_instance), repeats)
+                results.append(record)
+
+                pygad_text = (f"pygad {record['pygad_time'] * 1e3:.2f} ms, " if 'pygad_time' in record else "")
+                logger.info(f"{name} selection pop={pop_size}: {pygad_text}"
+                            f"vectorized {record['vectorized_time'] * 1e3:.2f} ms")
+
+        return results
+
+    @staticmethod
+    def dtype_policy(pop_size=20_000, num_genes=100, num_generations=20, repeats=3, seed=0):
+        """
+        Polityka typów 'default' i 'compact' na silniku numpy: rozmiar populacji
+        i mediana czasu przebiegu dla genów rzeczywistych (sphere) i bitów.
+        """
+        from config_loader import Main, run_configuration
+        from genetic_algorithm_config import GeneticAlgorithmConfig
+
+        seeds = Main.spawn_seeds(repeats, seed)
+        results = []
+        for label, is_binary in (('real', False), ('binary', True)):
+            for policy in ('default', 'compact'):
+                config = GeneticAlgorithmConfig(
+                    num_generations=num_generations, sol_per_pop=pop_size, num_parents_mating=pop_size // 2,
+                    num_genes=num_genes, gene_type=float, is_binary=is_binary, bits_per_gene=8,
+                    objective='sphere', mutation_type='random', log_interval=0, history_size=0,
+                    backend='numpy', dtype_policy=policy)
+                runs = [run_configuration(config, run_seed, False) for run_seed in seeds]
+                wall_time = float(np.median([stats['wall_time'] for stats in runs]))
+                num_values = num_genes * (config.bits_per_gene if is_binary else 1)
+                itemsize = (1 if is_binary else 4) if policy == 'compact' else 8
+                results.append({'representation': label, 'dtype_policy': policy, 'wall_time': wall_time,
+                                'population_bytes': pop_size * num_values * itemsize})
+                logger.info(f"{label} [{policy}] pop={pop_size} genes={num_values}: "
+                            f"population {pop_size * num_values * itemsize / 2 ** 20:.1f} MiB, "
+                            f"{wall_time * 1e3:.1f} ms")
+
+        return results
+
+    @staticmethod
+    def surrogate(objective='sphere', num_genes=5, num_generations=100, repeats=5, seed=0):
+        """
+        Przebiegi bez modelu zastępczego i z modelem 'knn': liczba ocen prawdziwą
+        funkcją celu i mediana osiągniętej wartości dla tych samych ziaren.
+        """
+        from config_loader import Main, run_configuration
+        from genetic_algorithm_config import GeneticAlgorithmConfig
+
+        seeds = Main.spawn_seeds(repeats, seed)
+        results = []
+        for surrogate in (None, 'knn'):
+            config = GeneticAlgorithmConfig(num_generations=num_generations, num_genes=num_genes, gene_type=float,
+                                            objective=objective, log_interval=0, surrogate=surrogate)
+            runs = [run_configuration(config, run_seed, False) for run_seed in seeds]
+            true_evaluations = float(np.median([stats.get('surrogate_true_evaluations', stats['fitness_evaluations'])
+                                                for stats in runs]))
+            function_value = float(np.median([stats['function_value'] for stats in runs]))
+            results.append({'surrogate': surrogate, 'true_evaluations': true_evaluations,
+                            'function_value': function_value})
+            logger.info(f"{objective} surrogate={surrogate}: {true_evaluations:.0f} true evaluations, "
+                        f"function value median {function_value:.3g}")
+
+        return results
+
+    @staticmethod
+    def backends(config_file='configs.json', repeats=5, seed=0, num_generations=None):
+        """
+        Porównanie silników 'pygad' i 'numpy' na konfiguracjach z pliku: mediana
+        czasu przebiegu i wartości funkcji celu dla tych samych ziaren.
+        """
+        from config_loader import ConfigLoader, Main, run_configuration
+
+        seeds = Main.spawn_seeds(repeats, seed)
+        results = []
+        for config_data in ConfigLoader.load_configs(config_file):
+            for backend in ('pygad', 'numpy'):
+                config = copy.copy(config_data['config'])
+                config.backend = backend
+                config.log_interval = 0
+                if num_generations is not None:
+                    config.num_generations = num_generations
+                runs = [run_configuration(config, run_seed, False) for run_seed in seeds]
+                wall_time = float(np.median([stats['wall_time'] for stats in runs]))
+                function_value = float(np.median([stats['function_value'] for stats in runs]))
+                results.append({'name': config_data['name'], 'backend': backend, 'wall_time': wall_time,
+                                'function_value': function_value})
+                logger.info(f"{config_data['name']} [{backend}]: {wall_time * 1e3:.1f} ms, "
+                            f"function value median {function_value:.3g}")
+
+        return results
+
+
+if __name__ == "__main__":
+    Benchmark.decode_binary()
+    Benchmark.crossover()
+    Benchmark.mutation()
+    Benchmark.gene_space()
+    Benchmark.packed_binary()
+    Benchmark.selection()
+    Benchmark.dtype_policy()
+    Benchmark.surrogate()
+    Benchmark.backends()
@@ -0,0 +1,138 @@
+import json
+import logging
+import os
+import numpy as np
+from surrogate import true_evaluations
+
+logger = logging.getLogger('GA_Logger')
+
+
+def _random_state_arrays(prefix, state):
+    """
+    Rozkłada stan numpy.random.RandomState (MT19937) na tablice do zapisu w .npz
+    """
+    _, keys, pos, has_gauss, cached_gaussian = state
+    return {
+        f'{prefix}_keys': np.asarray(keys, dtype=np.uint32),
+        f'{prefix}_params': np.array([pos, has_gauss], dtype=np.int64),
+        f'{prefix}_gauss': np.array(cached_gaussian, dtype=float)
+    }
+
+
+def _random_state_from_arrays(prefix, data):
+    pos, has_gauss = data[f'{prefix}_params']
+    return ('MT19937', data[f'{prefix}_keys'], int(pos), int(has_gauss), float(data[f'{prefix}_gauss']))
+
+
+class Checkpoint:
+    """
+    Zapis i odtwarzanie stanu przebiegu pygad.GA (populacja, generacja,
+    stany generatorów liczb losowych i historia najlepszych rozwiązań)
+    w pliku .npz.
+    """
+
+    @staticmethod
+    def save(ga_instance, path):
+        """
+        Zapisuje punkt kontrolny atomowo: najpierw do pliku tymczasowego,
+        potem os.replace, więc przerwany zapis nie niszczy poprzedniego pliku.
+        """
+        data = {
+            'population': ga_instance.population,
+            'last_generation_fitness': ga_instance.last_generation_fitness,
+            'generations_completed': np.array(ga_instance.generations_completed),
+            'num_genes': np.array(ga_instance.num_genes),
+            'best_solutions_fitness': np.asarray(ga_instance.best_solutions_fitness, dtype=float),
+            'fitness_evaluations': np.array(getattr(ga_instance, 'total_fitness_evaluations', 0)
+                                            + true_evaluations(ga_instance)),
+        }
+        python_random_generator = getattr(ga_instance, 'python_random_generator', None)
+        if python_random_generator is not None:
+            python_version, python_keys, python_gauss = python_random_generator.getstate()
+            data['python_random_keys'] = np.array(python_keys, dtype=np.int64)
+            data['python_random_params'] = np.array([python_version, -1 if python_gauss is None else 1])
+            data['python_random_gauss'] = np.array(0.0 if python_gauss is None else python_gauss)
+        if ga_instance.save_best_solutions:
+            # Ostatni wpis (bieżąca generacja) pygad doda ponownie po wznowieniu
+            data['best_solutions'] = np.asarray(ga_instance.best_solutions[:-1], dtype=ga_instance.population.dtype)
+        history = getattr(ga_instance, 'history', None)
+        if history is not None:
+            data['history'] = np.asarray(history.data())
+        generator = ga_instance.numpy_random_generator
+        if isinstance(generator, np.random.Generator):
+            # Silnik numpy (numpy_ga.py): stan generatora jako JSON (liczby 128-bitowe)
+            data['numpy_generator_state'] = np.array(json.dumps(generator.bit_generator.state))
+        else:
+            data.update(_random_state_arrays('numpy_random', generator.get_state()))
+        # Własne operatory (crossover.py, mutation.py) korzystają z globalnego np.random
+        data.update(_random_state_arrays('global_random', np.random.get_state()))
+
+        temp_path = f'{path}.tmp'
+        with open(temp_path, 'wb') as f:
+            np.savez_compressed(f, **data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_path, path)
+
+    @staticmethod
+    def load(path):
+        """
+        Wczytuje punkt kontrolny jako słownik tablic
+        """
+        with np.load(path) as data:
+            return {key: data[key] for key in data.files}
+
+    @staticmethod
+    def restore(ga_instance, checkpoint):
+        """
+        Przywraca stan zapisany przez Checkpoint.save w świeżo utworzonej
+        instancji pygad.GA. Zwraca liczbę ukończonych generacji.
+        """
+        population = checkpoint['population']
+        if population.shape != ga_instance.population.shape or int(checkpoint['num_genes']) != ga_instance.num_genes:
+            raise ValueError(f"Punkt kontrolny ma populację {population.shape}, "
+                             f"a konfiguracja {ga_instance.population.shape}")
+
+        generations_completed = int(checkpoint['generations_completed'])
+        ga_instance.population = population.astype(ga_instance.population.dtype)
+        ga_instance.last_generation_fitness = checkpoint['last_generation_fitness']
+        ga_instance.generations_completed = generations_completed
+        ga_instance.best_solutions_fitness = checkpoint['best_solutions_fitness'].tolist()
+        ga_instance.best_solutions_generations = list(range(generations_completed))
+        ga_instance.total_fitness_evaluations = int(checkpoint['fitness_evaluations'])
+        if ga_instance.save_best_solutions and 'best_solutions' in checkpoint:
+            ga_instance.best_solutions = checkpoint['best_solutions'].tolist()
+        history = getattr(ga_instance, 'history', None)
+        if history is not None and 'history' in checkpoint:
+            for row in checkpoint['history']:
+                history.append(row['generation'], row['solution'], row['fitness'])
+
+        generator = ga_instance.numpy_random_generator
+        if isinstance(generator, np.random.Generator):
+            generator.bit_generator.state = json.loads(str(checkpoint['numpy_generator_state']))
+        else:
+            generator.set_state(_random_state_from_arrays('numpy_random', checkpoint))
+        np.random.set_state(_random_state_from_arrays('global_random', checkpoint))
+        if 'python_random_keys' in checkpoint:
+            python_version, has_gauss = checkpoint['python_random_params']
+            python_gauss = float(checkpoint['python_random_gauss']) if has_gauss > 0 else None
+            ga_instance.python_random_generator.setstate(
+                (int(python_version), tuple(int(key) for key in checkpoint['python_random_keys']), python_gauss))
+
+        return generations_completed
+
+    @staticmethod
+    def on_generation(ga_instance):
+        """
+        Zapisuje punkt kontrolny co checkpoint_interval generacji,
+        jeśli ustawiono checkpoint_path.
+        """
+        path = getattr(ga_instance, 'checkpoint_path', None)
+        interval = getattr(ga_instance, 'checkpoint_interval', 0)
+        if not path or not interval or ga_instance.generations_completed % interval != 0:
+            return
+
+        try:
+            Checkpoint.save(ga_instance, path)
+        except OSError as e:
+            logger.error(f"Błąd podczas zapisywania punktu kontrolnego {path}: {str(e)}")
@@ -0,0 +1,156 @@
+import csv
+import json
+import logging
+import os
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+from config_loader import ConfigLoader, BestConfigSelector, Main, run_configuration
+
+logging.basicConfig(level=logging.INFO,
+                    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+logger = logging.getLogger('GA_Logger')
+
+
+class ConfigBenchmark:
+    """
+    Wielokrotne uruchamianie konfiguracji ze stałymi ziarnami i statystyki wyników
+    """
+
+    SUMMARY_FIELDS = [
+        'name', 'runs', 'success_rate',
+        'function_value_mean', 'function_value_median', 'function_value_iqr',
+        'function_value_min', 'function_value_max',
+        'wall_time_mean', 'evaluations_per_second_mean',
+        'generations_to_threshold_median'
+    ]
+
+    @staticmethod
+    def generations_to_threshold(fitness_history, threshold):
+        """
+        Numer pierwszej generacji, w której wartość funkcji celu spadła
+        do progu (None, jeśli próg nie został osiągnięty).
+        """
+        function_values = 1.0 / np.asarray(fitness_history, dtype=float) - 1e-10
+        reached = np.flatnonzero(function_values <= threshold)
+        return int(reached[0]) if reached.size else None
+
+    @staticmethod
+    def run_record(name, repeat, stats, threshold):
+        """
+        Zamienia statystyki pojedynczego przebiegu na rekord raportu
+        """
+        wall_time = float(stats['wall_time'])
+        return {
+            'name': name,
+            'repeat': repeat,
+            'seed': stats['random_seed'],
+            'function_value': float(stats['function_value']),
+            'generations': int(stats['generations']),
+            'stop_reason': stats['stop_reason'],
+            'wall_time': wall_time,
+            'fitness_evaluations': int(stats['fitness_evaluations']),
+            'evaluations_per_second': stats['fitness_evaluations'] / wall_time if wall_time > 0 else float('inf'),
+            'generations_to_threshold': ConfigBenchmark.generations_to_threshold(stats['fitness_history'], threshold)
+        }
+
+    @staticmethod
+    def summarize(name, records, threshold):
+        """
+        Statystyki zbiorcze dla wszystkich przebiegów jednej konfiguracji
+        """
+        values = np.array([record['function_value'] for record in records])
+        q1, median, q3 = np.percentile(values, [25, 50, 75])
+        reached = [record['generations_to_threshold'] for record in records
+                   if record['generations_to_threshold'] is not None]
+
+        return {
+            'name': name,
+            'runs': len(records),
+            'success_rate': float(np.mean(values <= threshold)),
+            'function_value_mean': float(values.mean()),
+            'function_value_median': float(median),
+            'function_value_iqr': float(q3 - q1),
+            'function_value_min': float(values.min()),
+            'function_value_max': float(values.max()),
+            'wall_time_mean': float(np.mean([record['wall_time'] for record in records])),
+            'evaluations_per_second_mean': float(np.mean([record['evaluations_per_second'] for record in records])),
+            'generations_to_threshold_median': float(np.median(reached)) if reached else None
+        }
+
+    @staticmethod
+    def save_report(summary, records, threshold, report_prefix='benchmark_report'):
+        """
+        Zapisuje raport JSON (statystyki i wszystkie przebiegi) oraz CSV ze statystykami
+        """
+        try:
+            with open(f'{report_prefix}.json', 'w') as f:
+                json.dump({'threshold': threshold, 'summary': summary, 'runs': records}, f, indent=2)
+
+            with open(f'{report_prefix}.csv', 'w', newline='') as f:
+                writer = csv.DictWriter(f, fieldnames=ConfigBenchmark.SUMMARY_FIELDS)
+                writer.writeheader()
+                writer.writerows(summary)
+
+            logger.info(f"Raport benchmarku zapisany do plików {report_prefix}.json i {report_prefix}.csv")
+        except Exception as e:
+            logger.error(f"Błąd podczas zapisywania raportu benchmarku: {str(e)}")
+
+    @staticmethod
+    def run(config_file='configs.json', repeats=10, seed=0, max_workers=None,
+            threshold=1e-4, report_prefix='benchmark_report'):
+        """
+        Uruchamia każdą konfigurację `repeats` razy równolegle. Wszystkie
+        konfiguracje dostają ten sam zestaw ziaren, więc są porównywane
+        na tych samych próbach.
+        """
+        if not os.path.exists(config_file):
+            ConfigLoader.save_default_config(config_file)
+
+        # Statystyki wymagają wszystkich konfiguracji naraz (także z przeglądu)
+        configurations = list(ConfigLoader.load_configs(config_file))
+        if not configurations:
+            logger.error("Nie udało się wczytać konfiguracji.")
+            return None
+
+        seeds = Main.spawn_seeds(repeats, seed)
+        tasks = [(config_data, repeat, repeat_seed)
+                 for config_data in configurations
+                 for repeat, repeat_seed in enumerate(seeds)]
+
+        logger.info(f"\n\n=== Benchmark: {len(configurations)} configurations x {repeats} seeds "
+                    f"(max_workers={max_workers}) ===")
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            all_stats = list(executor.map(run_configuration,
+                                          [config_data['config'] for config_data, _, _ in tasks],
+                                          [repeat_seed for _, _, repeat_seed in tasks],
+                                          [False] * len(tasks)))
+
+        records = {config_data['name']: [] for config_data in configurations}
+        best_runs = {}
+        for (config_data, repeat, _), stats in zip(tasks, all_stats):
+            name = config_data['name']
+            records[name].append(ConfigBenchmark.run_record(name, repeat, stats, threshold))
+            if name not in best_runs or stats['function_value'] < best_runs[name]['function_value']:
+                best_runs[name] = stats
+
+        summary = [ConfigBenchmark.summarize(name, name_records, threshold)
+                   for name, name_records in records.items()]
+        all_records = [record for name_records in records.values() for record in name_records]
+        ConfigBenchmark.save_report(summary, all_records, threshold, report_prefix)
+
+        for entry in summary:
+            logger.info(f"Configuration: {entry['name']}")
+            logger.info(f"Function value median: {entry['function_value_median']} "
+                        f"(IQR {entry['function_value_iqr']})")
+            logger.info(f"Success rate: {entry['success_rate']:.2f}")
+            logger.info("---")
+
+        best_name, best_summary = BestConfigSelector.select_best_from_summary(summary)
+        if best_name:
+            logger.info("\n\n=== Best configuration ===")
+            logger.info(f"Configuration: {best_name}")
+            logger.info(f"Success rate: {best_summary['success_rate']:.2f}")
+            logger.info(f"Function value median: {best_summary['function_value_median']}")
+            BestConfigSelector.save_best_config(best_name, best_runs[best_name], statistics=best_summary)
+
+        return summary
@@ -1,8 +1,18 @@
+import copy
+import itertools
 import json
 import os
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+import numpy as np
+from crossover import Crossover
 from mutation import Mutation
+from selection import Selection
 from genetic_algorithm import GeneticAlgorithm
 from genetic_algorithm_config import GeneticAlgorithmConfig
+from islands import IslandModel
+from result_sink import ResultSink
+from sweep import Sweep, SuccessiveHalving
+from visualizer import Visualizer
 import logging
 
 
@@ -14,7 +24,8 @@ class ConfigLoader:
     @staticmethod
     def load_configs(config_file):
         """
-        Wczytuje konfiguracje z pliku JSON
+        Wczytuje konfiguracje z pliku JSON: listę konfiguracji albo specyfikację
+        przeglądu (sweep.py), która jest rozwijana leniwie przez generator
         """
         if not os.path.exists(config_file):
             logging.error(f"Plik konfiguracyjny {config_file} nie istnieje!")
@@ -24,29 +35,14 @@ class ConfigLoader:
             with open(config_file, 'r') as f:
                 configs_json = json.load(f)
 
+            if isinstance(configs_json, dict):
+                return ConfigLoader.sweep_configs(configs_json)
+
             configurations = []
             for config_json in configs_json:
-                # Konwersja gene_type z string na odpowiedni typ
-                if 'gene_type' in config_json:
-                    if config_json['gene_type'] == 'float':
-                        config_json['gene_type'] = float
-                    elif config_json['gene_type'] == 'int':
-                        config_json['gene_type'] = int
-
-                # Konwersja mutation_type z string na odpowiednią funkcję
-                if 'mutation_type' in config_json:
-                    if config_json['mutation_type'] == 'gaussian':
-                        config_json['mutation_type'] = Mutation.gaussian
-                    elif config_json['mutation_type'] == 'swap':
-                        config_json['mutation_type'] = Mutation.swap
-                    # inne typy mutacji pozostają jako string
-
-                # Tworzenie obiektu konfiguracji
-                config = GeneticAlgorithmConfig(**{k: v for k, v in config_json.items() if k != 'name'})
-
                 configurations.append({
                     'name': config_json['name'],
-                    'config': config
+                    'config': ConfigLoader.config_from_json(config_json)
                 })
 
             return configurations
@@ -55,100 +51,112 @@ class ConfigLoader:
             logging.error(f"Błąd podczas wczytywania pliku konfiguracyjnego: {str(e)}")
             return []
 
+    @staticmethod
+    def config_from_json(config_json):
+        """
+        Tworzy GeneticAlgorithmConfig ze słownika JSON (nazwy typów i operatorów jako stringi)
+        """
+        config_json = dict(config_json)
+
+        # Konwersja gene_type z string na odpowiedni typ
+        if 'gene_type' in config_json:
+            if config_json['gene_type'] == 'float':
+                config_json['gene_type'] = float
+            elif config_json['gene_type'] == 'int':
+                config_json['gene_type'] = int
+
+        # Konwersja mutation_type z string na odpowiednią funkcję
+        if 'mutation_type' in config_json:
+            if config_json['mutation_type'] == 'gaussian':
+                config_json['mutation_type'] = Mutation.gaussian
+            elif config_json['mutation_type'] == 'adaptive_gaussian':
+                config_json['mutation_type'] = Mutation.adaptive_gaussian
+            elif config_json['mutation_type'] == 'swap':
+                config_json['mutation_type'] = Mutation.swap
+            elif config_json['mutation_type'] == 'custom_random':
+                config_json['mutation_type'] = Mutation.random
+            # inne typy mutacji pozostają jako string
+
+        # Konwersja parent_selection_type z string na wektorową selekcję (custom_*)
+        if 'parent_selection_type' in config_json:
+            if config_json['parent_selection_type'] == 'custom_tournament':
+                config_json['parent_selection_type'] = Selection.tournament
+            elif config_json['parent_selection_type'] == 'custom_rws':
+                config_json['parent_selection_type'] = Selection.rws
+            elif config_json['parent_selection_type'] == 'custom_sus':
+                config_json['parent_selection_type'] = Selection.sus
+            elif config_json['parent_selection_type'] == 'custom_rank':
+                config_json['parent_selection_type'] = Selection.rank
+            # pozostałe typy selekcji to wbudowane operatory PyGAD
+
+        # Konwersja crossover_type z string na własny operator (custom_*)
+        if 'crossover_type' in config_json:
+            if config_json['crossover_type'] == 'custom_single_point':
+                config_json['crossover_type'] = Crossover.single_point
+            elif config_json['crossover_type'] == 'custom_two_points':
+                config_json['crossover_type'] = Crossover.two_points
+            elif config_json['crossover_type'] == 'custom_uniform':
+                config_json['crossover_type'] = Crossover.uniform
+            # pozostałe typy krzyżowania to wbudowane operatory PyGAD
+
+        # Tworzenie obiektu konfiguracji
+        return GeneticAlgorithmConfig(**{k: v for k, v in config_json.items() if k != 'name'})
+
+    @staticmethod
+    def sweep_configs(spec):
+        """
+        Rozwija specyfikację przeglądu w generator konfiguracji; przy
+        successive_halving najpierw odrzuca słabe konfiguracje na krótkich przebiegach
+        """
+        sweep = Sweep(spec)
+
+        def configurations():
+            for name, params in sweep:
+                try:
+                    yield {'name': name, 'config': ConfigLoader.config_from_json(params)}
+                except Exception as e:
+                    logging.error(f"Pominięto konfigurację {name}: {str(e)}")
+
+        if not sweep.successive_halving:
+            return configurations()
+
+        halving = SuccessiveHalving(run_configuration, seed=sweep.seed, **sweep.successive_halving)
+
+        def survivors():
+            yield from halving.select(configurations())
+
+        return survivors()
+
     @staticmethod
     def save_default_config(filename='configs.json'):
         """
-        Zapisuje domyślną konfigurację do pliku JSON
+        Zapisuje domyślną konfigurację do pliku JSON (specyfikacja przeglądu:
+        dwie reprezentacje x trzy zestawy operatorów)
         """
-        default_configs = [
-            {
-                'name': 'Real repr. + Tournament + Single-Point + Random',
-                'num_generations': 50,
-                'sol_per_pop': 50,
-                'num_parents_mating': 25,
-                'num_genes': 2,
-                'init_range_low': -20,
-                'init_range_high': 20,
-                'gene_type': 'float',
-                'parent_selection_type': 'tournament',
-                'crossover_type': 'single_point',
-                'mutation_type': 'random',
-                'is_binary': False
-            },
-            {
-                'name': 'Real repr. + RWS + Two-Points + Swap',
-                'num_generations': 50,
-                'sol_per_pop': 50,
-                'num_parents_mating': 25,
-                'num_genes': 2,
-                'init_range_low': -20,
-                'init_range_high': 20,
-                'gene_type': 'float',
-                'parent_selection_type': 'rws',
-                'crossover_type': 'two_points',
-                'mutation_type': 'swap',
-                'is_binary': False
-            },
-            {
-                'name': 'Real repr. + Random + Uniform + Gaussian',
-                'num_generations': 50,
-                'sol_per_pop': 50,
-                'num_parents_mating': 25,
-                'num_genes': 2,
-                'init_range_low': -20,
-                'init_range_high': 20,
-                'gene_type': 'float',
-                'parent_selection_type': 'random',
-                'crossover_type': 'uniform',
-                'mutation_type': 'gaussian',
-                'is_binary': False
-            },
-            {
-                'name': 'Binary repr. + Tournament + Single-Point + Random',
-                'num_generations': 50,
-                'sol_per_pop': 50,
-                'num_parents_mating': 25,
-                'num_genes': 2,
-                'init_range_low': -20,
-                'init_range_high': 20,
-                'gene_type': 'int',
-                'parent_selection_type': 'tournament',
-                'crossover_type': 'single_point',
-                'mutation_type': 'random',
-                'bits_per_gene': 20,
-                'is_binary': True
-            },
-            {
-                'name': 'Binary repr. + RWS + Two-Points + Swap',
+        default_configs = {
+            'base': {
                 'num_generations': 50,
                 'sol_per_pop': 50,
                 'num_parents_mating': 25,
                 'num_genes': 2,
                 'init_range_low': -20,
-                'init_range_high': 20,
-                'gene_type': 'int',
-                'parent_selection_type': 'rws',
-                'crossover_type': 'two_points',
-                'mutation_type': 'swap',
-                'bits_per_gene': 20,
-                'is_binary': True
+                'init_range_high': 20
             },
-            {
-                'name': 'Binary repr. + Random + Uniform + Gaussian',
-                'num_generations': 50,
-                'sol_per_pop': 50,
-                'num_parents_mating': 25,
-                'num_genes': 2,
-                'init_range_low': -20,
-                'init_range_high': 20,
-                'gene_type': 'int',
-                'parent_selection_type': 'random',
-                'crossover_type': 'uniform',
-                'mutation_type': 'gaussian',
-                'bits_per_gene': 20,
-                'is_binary': True
+            'grid': {
+                'representation': [
+                    {'label': 'Real repr.', 'gene_type': 'float', 'is_binary': False},
+                    {'label': 'Binary repr.', 'gene_type': 'int', 'bits_per_gene': 20, 'is_binary': True}
+                ],
+                'operators': [
+                    {'label': 'Tournament + Single-Point + Random', 'parent_selection_type': 'tournament',
+                     'crossover_type': 'single_point', 'mutation_type': 'random'},
+                    {'label': 'RWS + Two-Points + Swap', 'parent_selection_type': 'rws',
+                     'crossover_type': 'two_points', 'mutation_type': 'swap'},
+                    {'label': 'Random + Uniform + Gaussian', 'parent_selection_type': 'random',
+                     'crossover_type': 'uniform', 'mutation_type': 'gaussian'}
+                ]
             }
-        ]
+        }
 
         try:
             with open(filename, 'w') as f:
@@ -158,28 +166,55 @@ class ConfigLoader:
             logging.error(f"Błąd podczas zapisywania domyślnej konfiguracji: {str(e)}")
 
 
+def operator_name(operator):
+    """
+    Nazwa operatora do zapisu w JSON (string PyGAD lub nazwa własnej funkcji)
+    """
+    if callable(operator):
+        return operator.__qualname__
+    return str(operator)
+
+
+def result_record(name, stats):
+    """
+    Zwięzły rekord przebiegu do zapisu w pliku wyników (bez historii i trajektorii)
+    """
+    solution = stats['decoded_solution'] if 'decoded_solution' in stats else stats['best_solution']
+    return {
+        'name': name,
+        'function_value': float(stats['function_value']),
+        'generations': int(stats['generations']),
+        'stop_reason': stats['stop_reason'],
+        'random_seed': stats['random_seed'],
+        'objective': stats['objective'],
+        'crossover_type': operator_name(stats['crossover_type']),
+        'mutation_type': operator_name(stats['mutation_type']),
+        'parent_selection_type': operator_name(stats['parent_selection_type']),
+        'wall_time': float(stats['wall_time']),
+        'fitness_evaluations': int(stats['fitness_evaluations']),
+        'solution': [float(value) for value in solution]
+    }
+
+
 class BestConfigSelector:
     """
     Klasa do wybierania najlepszej konfiguracji na podstawie wyników
     """
 
     @staticmethod
-    def select_best_config(results):
+    def select_best_from_summary(summary):
         """
-        Wybiera najlepszą konfigurację na podstawie wartości funkcji celu
+        Wybiera najlepszą konfigurację na podstawie statystyk z wielu przebiegów:
+        najwyższy odsetek sukcesów, a przy remisie najniższa mediana funkcji celu
         """
-        best_name = None
-        best_value = float('inf')
-
-        for name, stats in results.items():
-            if stats['function_value'] < best_value:
-                best_value = stats['function_value']
-                best_name = name
+        if not summary:
+            return None, None
 
-        return best_name, results[best_name] if best_name else None
+        best = min(summary, key=lambda entry: (-entry['success_rate'], entry['function_value_median']))
+        return best['name'], best
 
     @staticmethod
-    def save_best_config(best_name, best_stats, filename='best_config.json'):
+    def save_best_config(best_name, best_stats, filename='best_config.json', statistics=None):
         """
         Zapisuje najlepszą konfigurację do pliku JSON
         """
@@ -187,9 +222,10 @@ class BestConfigSelector:
             'name': best_name,
             'function_value': float(best_stats['function_value']),
             'generations': int(best_stats['generations']),
-            'crossover_type': best_stats['crossover_type'],
-            'mutation_type': str(best_stats['mutation_type']),
-            'parent_selection_type': best_stats['parent_selection_type']
+            'stop_reason': best_stats['stop_reason'],
+            'crossover_type': operator_name(best_stats['crossover_type']),
+            'mutation_type': operator_name(best_stats['mutation_type']),
+            'parent_selection_type': operator_name(best_stats['parent_selection_type'])
         }
 
         if 'decoded_solution' in best_stats:
@@ -197,6 +233,9 @@ class BestConfigSelector:
         else:
             best_config['solution'] = best_stats['best_solution'].tolist()
 
+        if statistics is not None:
+            best_config['statistics'] = statistics
+
         try:
             with open(filename, 'w') as f:
                 json.dump(best_config, f, indent=2)
@@ -205,9 +244,35 @@ class BestConfigSelector:
             logging.error(f"Błąd podczas zapisywania najlepszej konfiguracji: {str(e)}")
 
 
+def run_configuration(config, seed=None, visualize=True):
+    """
+    Uruchamia jedną konfigurację. Używana również w procesach roboczych,
+    dlatego przy visualize=False zwraca tylko dane dające się zserializować
+    (statystyki oraz historię kolejnych generacji).
+    """
+    if seed is not None:
+        config = copy.copy(config)
+        config.random_seed = seed
+        # Własne operatory korzystają z globalnego generatora NumPy
+        np.random.seed(seed)
+
+    ga = IslandModel(config) if config.islands > 1 else GeneticAlgorithm(config)
+    ga.setup()
+    return ga.run(visualize=visualize)
+
+
 class Main:
     @staticmethod
-    def run(config_file='configs.json'):
+    def spawn_seeds(count, seed=None):
+        """
+        Tworzy niezależne ziarna generatora dla kolejnych konfiguracji
+        """
+        seed_sequence = np.random.SeedSequence(seed)
+        return [int(child.generate_state(1)[0]) for child in seed_sequence.spawn(count)]
+
+    @staticmethod
+    def run(config_file='configs.json', parallel=False, max_workers=None, seed=None,
+            plots=True, headless=False, results_file='results.jsonl', skip_completed=False):
         # Inicjalizacja logowania
         logging.basicConfig(level=logging.INFO,
                             format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
@@ -221,54 +286,129 @@ class Main:
         # Wczytanie konfiguracji z pliku
         configurations = ConfigLoader.load_configs(config_file)
 
-        if not configurations:
+        # Przegląd jest generatorem, więc pustość sprawdzana jest po pierwszym elemencie
+        configurations = iter(configurations)
+        first = next(configurations, None)
+        if first is None:
             logger.error("Nie udało się wczytać konfiguracji. Używanie konfiguracji domyślnych...")
             # Tutaj można dodać domyślne konfiguracje jak w pierwotnym kodzie
             # lub wyjść z programu
             return
-
-        results = {}
-
-        # Testy
-        for config_data in configurations:
-            logger.info(f"\n\n=== Testing configuration: {config_data['name']} ===")
-            ga = GeneticAlgorithm(config_data['config'])
-            ga.setup()
-            stats = ga.run()
-            results[config_data['name']] = stats
-
-        logger.info("\n\n=== Comparison of all configurations ===")
-        for name, stats in results.items():
-            if 'decoded_solution' in stats:
-                solution_str = f"Decoded: {stats['decoded_solution']}"
-            else:
-                solution_str = f"Solution: {stats['best_solution']}"
+        configurations = itertools.chain([first], configurations)
+
+        # Ziarna: własne z konfiguracji, a w trybie równoległym (lub przy podanym
+        # ziarnie głównym) brakujące są generowane osobno dla każdej konfiguracji.
+        # Kolejne spawn(1) dają te same ziarna co spawn_seeds, ale bez znajomości
+        # liczby konfiguracji (przegląd może być generatorem)
+        seed_sequence = np.random.SeedSequence(seed) if parallel or seed is not None else None
+
+        def with_seeds():
+            for config_data in configurations:
+                config_seed = config_data['config'].random_seed
+                if seed_sequence is not None:
+                    spawned = int(seed_sequence.spawn(1)[0].generate_state(1)[0])
+                    config_seed = spawned if config_seed is None else config_seed
+                yield config_data, config_seed
+
+        # Wyniki zapisywane po każdym przebiegu; opcjonalnie pomijane są
+        # konfiguracje, które mają już wynik w pliku
+        sink = ResultSink.open(results_file)
+        completed = set()
+        # Najlepszy dotychczasowy wynik (także z wcześniej zapisanych przebiegów)
+        best_record = None
+        if skip_completed:
+            records = sink.records()
+            completed = {record['name'] for record in records}
+            best_record = ResultSink.best(records)
+            del records
+            if completed:
+                logger.info(f"Pomijanie {len(completed)} konfiguracji z wynikami w pliku {results_file}")
+        pending = ((config_data, config_seed) for config_data, config_seed in with_seeds()
+                   if config_data['name'] not in completed)
+
+        if plots and headless:
+            Visualizer.set_headless()
+
+        # W pamięci zostają tylko nazwy przebiegów do etapu rysowania; rekordy
+        # są w pliku wyników
+        rendered = []
+
+        def finish(name, stats):
+            """
+            Zapisuje wynik przebiegu zaraz po jego zakończeniu; pełne statystyki
+            (historia, trajektoria) nie są przechowywane w pamięci do końca
+            całego przeglądu, tylko dane wykresów trafiają na dysk
+            """
+            nonlocal best_record
+            record = result_record(name, stats)
+            sink.append(record)
 
             logger.info(f"Configuration: {name}")
-            logger.info(f"{solution_str}")
+            logger.info(f"Solution: {record['solution']}")
             logger.info(f"Function value: {stats['function_value']}")
-            logger.info(f"Generations: {stats['generations']}")
+            logger.info(f"Generations: {stats['generations']} (stop reason: {stats['stop_reason']})")
             logger.info("---")
 
-        # Wybór najlepszej konfiguracji
-        best_name, best_stats = BestConfigSelector.select_best_config(results)
+            # Wykresy powstają dopiero po całym przeglądzie; tu zapisywane są tylko ich dane
+            if plots:
+                Visualizer.save_run(stats, name)
+                rendered.append(name)
 
-        if best_name:
-            logger.info("\n\n=== Best configuration ===")
-            logger.info(f"Configuration: {best_name}")
+            if best_record is None or record['function_value'] < best_record['function_value']:
+                best_record = record
+                BestConfigSelector.save_best_config(name, stats)
 
-            if 'decoded_solution' in best_stats:
-                logger.info(f"Decoded solution: {best_stats['decoded_solution']}")
+        # Testy
+        try:
+            if parallel:
+                logger.info(f"\n\n=== Testing configurations in parallel "
+                            f"(max_workers={max_workers}) ===")
+                # Ograniczona liczba zadań w locie, żeby przy tysiącach konfiguracji
+                # nie przechowywać wyników wszystkich zakończonych przebiegów.
+                # Wyniki są przekazywane do finish w kolejności konfiguracji (bufor
+                # przebiegów zakończonych przed wcześniejszymi), więc plik wyników
+                # i wybór najlepszej konfiguracji nie zależą od kolejności zakończenia
+                window = 2 * (max_workers or os.cpu_count() or 1)
+                queued = enumerate(pending)
+                with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                    in_flight = {}
+                    buffered = {}
+                    next_index = 0
+                    while True:
+                        free = window - len(in_flight) - len(buffered)
+                        for index, (config_data, config_seed) in itertools.islice(queued, max(free, 0)):
+                            future = executor.submit(run_configuration, config_data['config'], config_seed, False)
+                            in_flight[future] = (index, config_data['name'])
+                        if not in_flight:
+                            break
+                        done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                        for future in done:
+                            index, name = in_flight.pop(future)
+                            buffered[index] = (name, future.result())
+                        while next_index in buffered:
+                            finish(*buffered.pop(next_index))
+                            next_index += 1
             else:
-                logger.info(f"Solution: {best_stats['best_solution']}")
-
-            logger.info(f"Function value: {best_stats['function_value']}")
-            logger.info(f"Generations: {best_stats['generations']}")
-
-            # Zapisanie najlepszej konfiguracji do pliku
-            BestConfigSelector.save_best_config(best_name, best_stats)
+                for config_data, config_seed in pending:
+                    logger.info(f"\n\n=== Testing configuration: {config_data['name']} ===")
+                    finish(config_data['name'], run_configuration(config_data['config'], config_seed,
+                                                                  visualize=False))
+        finally:
+            sink.close()
+
+        # Rysowanie jako osobny etap, po zakończeniu wszystkich przebiegów
+        if plots:
+            Visualizer.render_results(rendered)
+
+        if best_record:
+            logger.info("\n\n=== Best configuration ===")
+            logger.info(f"Configuration: {best_record['name']}")
+            logger.info(f"Solution: {best_record['solution']}")
+            logger.info(f"Function value: {best_record['function_value']}")
+            logger.info(f"Generations: {best_record['generations']}")
 
-        return results
+        # Pełne rekordy wszystkich przebiegów są w pliku results_file
+        return best_record
 
 
 if __name__ == "__main__":
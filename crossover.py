@@ -1,74 +1,71 @@
 import numpy as np
 
+
+def _parent_pairs(parents, offspring_size):
+    """
+    Zwraca macierze pierwszych i drugich rodziców dla całego potomstwa
+    (potomek k powstaje z rodziców k i k+1, cyklicznie). Obie macierze są
+    widokami jednej kopii rodziców przesuniętymi o jeden wiersz.
+    """
+    rows = np.take(parents, np.arange(offspring_size[0] + 1) % parents.shape[0], axis=0)
+    return rows[:-1], rows[1:]
+
+
+def _random_bool_mask(shape):
+    """
+    Losowa maska True/False (p=0.5) tworzona z losowych bajtów: jedno losowanie
+    daje 8 genów zamiast jednego.
+    """
+    size = int(np.prod(shape))
+    random_bytes = np.frombuffer(np.random.bytes((size + 7) // 8), dtype=np.uint8)
+    return np.unpackbits(random_bytes, count=size).view(bool).reshape(shape)
+
+
 class Crossover:
     @staticmethod
     def single_point(parents, offspring_size, ga_instance):
         """
         Implementacja krzyżowania jednopunktowego.
         """
-        offspring = []
-        idx = 0
-        while len(offspring) != offspring_size[0]:
-            parent1 = parents[idx % parents.shape[0], :].copy()
-            parent2 = parents[(idx + 1) % parents.shape[0], :].copy()
-
-            # Wybierz losowy punkt podziału
-            random_split_point = np.random.choice(range(offspring_size[1]))
+        parent1, parent2 = _parent_pairs(parents, offspring_size)
 
-            # Stwórz potomka
-            parent1[random_split_point:] = parent2[random_split_point:]
-            offspring.append(parent1)
+        # Losowy punkt podziału dla każdego potomka
+        split_points = np.random.randint(0, offspring_size[1], size=offspring_size[0])
 
-            idx += 1
+        # Geny od punktu podziału pochodzą od drugiego rodzica
+        mask = np.arange(offspring_size[1]) >= split_points[:, None]
 
-        return np.array(offspring)
+        return np.where(mask, parent2, parent1)
 
     @staticmethod
     def two_points(parents, offspring_size, ga_instance):
         """
         Implementacja krzyżowania dwupunktowego.
         """
-        offspring = []
-        idx = 0
+        parent1, parent2 = _parent_pairs(parents, offspring_size)
 
-        while len(offspring) != offspring_size[0]:
-            parent1 = parents[idx % parents.shape[0], :].copy()
-            parent2 = parents[(idx + 1) % parents.shape[0], :].copy()
+        # Dwa różne punkty podziału dla każdego potomka
+        gene_length = offspring_size[1]
+        point_a = np.random.randint(0, gene_length, size=offspring_size[0])
+        point_b = np.random.randint(0, gene_length - 1, size=offspring_size[0])
+        point_b += point_b >= point_a
+        point1 = np.minimum(point_a, point_b)
+        point2 = np.maximum(point_a, point_b)
 
-            # Wybierz dwa losowe punkty podziału
-            gene_length = offspring_size[1]
-            point1, point2 = np.sort(np.random.choice(range(gene_length), size=2, replace=False))
+        # Fragment [point1, point2) pochodzi od drugiego rodzica
+        genes = np.arange(gene_length)
+        mask = (genes >= point1[:, None]) & (genes < point2[:, None])
 
-            # Stwórz potomka
-            temp = parent1[point1:point2].copy()
-            parent1[point1:point2] = parent2[point1:point2]
-            parent2[point1:point2] = temp
-
-            offspring.append(parent1)
-
-            idx += 1
-
-        return np.array(offspring)
+        return np.where(mask, parent2, parent1)
 
     @staticmethod
     def uniform(parents, offspring_size, ga_instance):
         """
         Implementacja krzyżowania jednorodnego.
         """
-        offspring = []
-        idx = 0
-
-        while len(offspring) != offspring_size[0]:
-            parent1 = parents[idx % parents.shape[0], :].copy()
-            parent2 = parents[(idx + 1) % parents.shape[0], :].copy()
-
-            # Dla każdego genu, losowo wybierz rodzica
-            for gene_idx in range(offspring_size[1]):
-                if np.random.random() < 0.5:
-                    parent1[gene_idx] = parent2[gene_idx]
-
-            offspring.append(parent1)
+        parent1, parent2 = _parent_pairs(parents, offspring_size)
 
-            idx += 1
+        # Dla każdego genu, losowo wybierz rodzica
+        mask = _random_bool_mask(offspring_size)
 
-        return np.array(offspring)
\ No newline at end of file
+        return np.where(mask, parent2, parent1)
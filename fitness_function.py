@@ -1,4 +1,66 @@
 import numpy as np
+from collections import OrderedDict
+from functools import lru_cache
+import objectives
+
+
+class FitnessCache:
+    """
+    Ograniczona pamięć podręczna LRU wartości dopasowania chromosomów binarnych.
+    Kluczem są bity chromosomu spakowane przez np.packbits.
+    """
+
+    # Prefiksy rozdzielające klucze bitowe od kluczy z surowych bajtów
+    _BITS_TAG = b'b'
+    _RAW_TAG = b'r'
+
+
+    def __init__(self, max_size):
+        self.max_size = max_size
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def keys(solutions):
+        """
+        Klucze dla wierszy macierzy rozwiązań. Wiersze zawierające wartości
+        spoza {0, 1} (np. po mutacji Gaussa albo bajty spakowanych bitów) są
+        kluczowane pełnymi bajtami z typem tablicy. Oba rodzaje kluczy mają
+        różne prefiksy, więc np. wiersze uint8 [1] i [128] (ten sam bajt po
+        spakowaniu bitów i jako surowy bajt) nie dzielą wpisu.
+        """
+        solutions = np.atleast_2d(solutions)
+        packed = np.packbits(solutions != 0, axis=1)
+        is_binary = ((solutions == 0) | (solutions == 1)).all(axis=1)
+        raw_tag = FitnessCache._RAW_TAG + solutions.dtype.str.encode()
+        return [FitnessCache._BITS_TAG + packed[i].tobytes() if is_binary[i]
+                else raw_tag + solutions[i].tobytes()
+                for i in range(solutions.shape[0])]
+
+    def get(self, key):
+        """
+        Zwraca zapamiętaną wartość (lub None) i aktualizuje liczniki
+        """
+        value = self.entries.get(key)
+        if value is None:
+            self.misses += 1
+            return None
+        self.entries.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def put(self, key, value):
+        """
+        Zapamiętuje wartość, usuwając najdawniej używany wpis po przekroczeniu limitu
+        """
+        self.entries[key] = value
+        self.entries.move_to_end(key)
+        if len(self.entries) > self.max_size:
+            self.entries.popitem(last=False)
+
+    def stats(self):
+        return {'cache_hits': self.hits, 'cache_misses': self.misses, 'cache_size': len(self.entries)}
 
 class FitnessFunction:
     @staticmethod
@@ -7,17 +69,21 @@ class FitnessFunction:
         Funkcja Martina i Gaddy: f(x1,x2) = (x1-x2)^2 + ((x1+x2-10)/3)^2
         Minimum globalne: f(5,5) = 0
         """
-        term1 = (x1 - x2) ** 2
-        term2 = ((x1 + x2 - 10) / 3) ** 2
-        return term1 + term2
+        return objectives.martin_gaddy(x1, x2)
+
+    @staticmethod
+    def objective(ga_instance):
+        """
+        Funkcja celu wybrana w konfiguracji (domyślnie funkcja Martina i Gaddy)
+        """
+        return getattr(ga_instance, 'objective', None) or objectives.get_objective('martin_gaddy')
 
     @staticmethod
     def fitness_func_real(ga_instance, solution, solution_idx):
         """
         Funkcja dopasowania dla reprezentacji rzeczywistej.
         """
-        x1, x2 = solution[0], solution[1]
-        result = FitnessFunction.martin_gaddy(x1, x2)
+        result = FitnessFunction.objective(ga_instance)(solution)
 
         return 1.0 / (result + 1e-10)
 
@@ -26,46 +92,165 @@ class FitnessFunction:
         """
         Funkcja dopasowania dla reprezentacji binarnej.
         """
-        bits_per_gene = ga_instance.bits_per_gene
-        gene_range_low = ga_instance.gene_range_low
-        gene_range_high = ga_instance.gene_range_high
-        num_genes = ga_instance.num_genes_original
+        cache = getattr(ga_instance, 'fitness_cache', None)
+        if cache is not None:
+            key = FitnessCache.keys(solution)[0]
+            fitness = cache.get(key)
+            if fitness is None:
+                fitness = FitnessFunction._binary_fitness(ga_instance, solution)
+                cache.put(key, fitness)
+            return fitness
+
+        return FitnessFunction._binary_fitness(ga_instance, solution)
 
+    @staticmethod
+    def _binary_fitness(ga_instance, solution):
+        """
+        Dopasowanie pojedynczego chromosomu binarnego (bez pamięci podręcznej).
+        """
         # Dekodowanie
-        decoded = FitnessFunction.decode_binary(
-            solution,
-            gene_range_high,
-            gene_range_low,
-            num_genes,
-            bits_per_gene
-        )
+        decoded = FitnessFunction.decode_population(ga_instance, solution)[0]
 
-        x1, x2 = decoded[0], decoded[1]
-        result = FitnessFunction.martin_gaddy(x1, x2)
+        result = FitnessFunction.objective(ga_instance)(decoded)
 
         # Minimalizacja, więc zwracamy odwrotność
         return 1.0 / (result + 1e-10)
 
     @staticmethod
-    def decode_binary(binary_solution, max_val, min_val, num_genes, bits_per_gene):
+    def fitness_func_real_batch(ga_instance, solutions, solutions_idx):
+        """
+        Wsadowa funkcja dopasowania dla reprezentacji rzeczywistej.
+        Liczy dopasowanie całej macierzy rozwiązań jednym przebiegiem NumPy.
+        """
+        result = FitnessFunction.objective(ga_instance)(solutions)
+
+        return 1.0 / (result + 1e-10)
+
+    @staticmethod
+    def fitness_func_binary_batch(ga_instance, solutions, solutions_idx):
+        """
+        Wsadowa funkcja dopasowania dla reprezentacji binarnej.
+        Przy włączonej pamięci podręcznej liczone są tylko brakujące chromosomy.
+        """
+        cache = getattr(ga_instance, 'fitness_cache', None)
+        if cache is None:
+            return FitnessFunction._binary_fitness_batch(ga_instance, solutions)
+
+        keys = FitnessCache.keys(solutions)
+        fitness = np.empty(len(keys))
+        missing = []
+        for i, key in enumerate(keys):
+            value = cache.get(key)
+            if value is None:
+                missing.append(i)
+            else:
+                fitness[i] = value
+
+        if missing:
+            missing_fitness = FitnessFunction._binary_fitness_batch(ga_instance, np.asarray(solutions)[missing])
+            fitness[missing] = missing_fitness
+            for i, value in zip(missing, missing_fitness):
+                cache.put(keys[i], float(value))
+
+        return fitness
+
+    @staticmethod
+    def _binary_fitness_batch(ga_instance, solutions):
+        """
+        Dopasowanie macierzy chromosomów binarnych (bez pamięci podręcznej).
+        """
+        decoded = FitnessFunction.decode_population(ga_instance, solutions)
+        result = FitnessFunction.objective(ga_instance)(decoded)
+
+        return 1.0 / (result + 1e-10)
+
+    @staticmethod
+    def decode_population(ga_instance, population):
+        """
+        Dekoduje chromosomy binarne instancji pygad.GA zgodnie z jej ustawieniami
+        (zakres genów, kodowanie i sposób przechowywania bitów)
+        """
+        return FitnessFunction.decode_binary_population(
+            np.atleast_2d(population),
+            ga_instance.gene_range_high,
+            ga_instance.gene_range_low,
+            ga_instance.num_genes_original,
+            ga_instance.bits_per_gene,
+            encoding=getattr(ga_instance, 'binary_encoding', 'plain'),
+            packed=getattr(ga_instance, 'bit_storage', 'unpacked') == 'packed'
+        )
+
+    @staticmethod
+    def decode_binary(binary_solution, max_val, min_val, num_genes, bits_per_gene, encoding='plain', packed=False):
         """
         Dekoduje reprezentację binarną do wartości rzeczywistych
         """
-        decoded_solution = np.zeros(num_genes)
-        for i in range(num_genes):
-            # Pobranie bitów
-            start_idx = i * bits_per_gene
-            end_idx = start_idx + bits_per_gene
-            gene_bits = binary_solution[start_idx:end_idx]
+        return FitnessFunction.decode_binary_population(
+            np.atleast_2d(binary_solution),
+            max_val,
+            min_val,
+            num_genes,
+            bits_per_gene,
+            encoding,
+            packed
+        )[0]
+
+    @staticmethod
+    def decode_binary_population(binary_population, max_val, min_val, num_genes, bits_per_gene,
+                                 encoding='plain', packed=False):
+        """
+        Dekoduje całą macierz (pop, num_genes * bits_per_gene) do macierzy
+        (pop, num_genes) wartości rzeczywistych.
+
+        Do 53 bitów na gen wartość całkowita jest iloczynem bitów i wektora
+        potęg dwójki (dokładnym w float64), dla 54-64 bitów bity są pakowane
+        przez np.packbits i odczytywane jako uint64.
+
+        Gen o wartości różnej od zera jest traktowany jako bit 1 we wszystkich
+        wariantach. Dla genów 0/1 wynik jest taki sam jak w pierwotnym dekoderze
+        z pętlą po bitach; inne wartości (np. po mutacji Gaussa) pętla mnożyła
+        przez wagę bitu.
+
+        packed=True oznacza bity spakowane po 8 w bajcie (np.packbits),
+        encoding='gray' - kod Graya, zamieniany na binarny przez skumulowany XOR
+        kolejnych bitów genu.
+        """
+        bits = np.asarray(binary_population)
+        if packed:
+            bits = np.unpackbits(bits.astype(np.uint8, copy=False), axis=1, count=num_genes * bits_per_gene)
+        # Każdy niezerowy gen jest bitem 1 (jak w np.packbits), więc wartości spoza
+        # {0, 1} po mutacji Gaussa dekodują się tak samo przy każdej liczbie bitów
+        bits = bits.reshape(bits.shape[0], num_genes, bits_per_gene) != 0
+
+        if encoding == 'gray':
+            bits = np.bitwise_xor.accumulate(bits, axis=-1)
+        elif encoding != 'plain':
+            raise ValueError(f"Nieznane kodowanie binarne '{encoding}'. Dostępne: plain, gray")
+
+        if bits_per_gene <= 24:
+            # Bity mnożone w float32 (dokładnie do 24 bitów) bez kopii float64
+            decimal_values = (bits @ _bit_weights(bits_per_gene, np.float32)).astype(float)
+        elif bits_per_gene <= 53:
+            decimal_values = bits @ _bit_weights(bits_per_gene)
+        elif bits_per_gene <= 64:
+            # Dopełnienie zerami z lewej do 64 bitów i odczyt jako big-endian uint64
+            padded = np.zeros(bits.shape[:2] + (64,), dtype=np.uint8)
+            padded[..., 64 - bits_per_gene:] = bits
+            packed = np.packbits(padded, axis=-1)
+            decimal_values = packed.view('>u8')[..., 0].astype(float)
+        else:
+            raise ValueError(f"bits_per_gene={bits_per_gene} przekracza maksymalne 64 bity")
 
-            # Konwersja
-            decimal_value = 0
-            for bit_idx, bit in enumerate(gene_bits):
-                decimal_value += bit * (2 ** (bits_per_gene - bit_idx - 1))
+        # Mapowanie na zakres
+        max_decimal = 2 ** bits_per_gene - 1
+        return min_val + ((max_val - min_val) * decimal_values) / max_decimal
 
-            # Mapowanie na zakres
-            max_decimal = 2 ** bits_per_gene - 1
-            gene_value = min_val + ((max_val - min_val) * decimal_value) / max_decimal
-            decoded_solution[i] = gene_value
 
-        return decoded_solution
\ No newline at end of file
+@lru_cache(maxsize=None)
+def _bit_weights(bits_per_gene, dtype=np.float64):
+    """
+    Wektor wag 2^(bits_per_gene-1), ..., 2, 1 (najstarszy bit pierwszy).
+    """
+    weights = (2.0 ** np.arange(bits_per_gene - 1, -1, -1)).astype(dtype)
+    weights.flags.writeable = False
+    return weights
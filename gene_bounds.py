@@ -0,0 +1,67 @@
+import numpy as np
+
+
+class GeneBounds:
+    """
+    Zakres genów jako tablice low/high (skalary dla wspólnego zakresu, wektory
+    długości num_genes dla zakresów poszczególnych genów) albo zbiór wartości
+    dyskretnych wspólny dla wszystkich genów (np. [0, 1] dla bitów), zamiast
+    listy słowników gene_space z osobnym wpisem dla każdego genu.
+    Losowanie i przycinanie działają od razu na wszystkich wskazanych genach.
+    """
+
+    def __init__(self, low, high, values=None):
+        self.low = np.asarray(low, dtype=float)
+        self.high = np.asarray(high, dtype=float)
+        self.values = None if values is None else np.asarray(values)
+
+    @staticmethod
+    def from_config(config):
+        """
+        Zakres genów w postaci przechowywanej przez algorytm: bity (0/1 lub
+        bajty spakowanych bitów) albo zakres init_range_low/init_range_high
+        """
+        if not config.is_binary:
+            return GeneBounds(config.init_range_low, config.init_range_high)
+        if config.bit_storage == 'packed':
+            return GeneBounds(0, 255, np.arange(256))
+        return GeneBounds(0, 1, np.array([0, 1]))
+
+    @property
+    def is_global(self):
+        return self.low.ndim == 0 and self.high.ndim == 0
+
+    def gene_space(self):
+        """
+        gene_space dla pygad.GA: jedna lista wartości wspólna dla wszystkich
+        genów albo None dla zakresu ciągłego
+        """
+        return None if self.values is None else self.values.tolist()
+
+    def at(self, genes):
+        """
+        Granice dla tablicy indeksów genów (skalary przy wspólnym zakresie)
+        """
+        if self.is_global:
+            return self.low, self.high
+        return np.take(self.low, genes), np.take(self.high, genes)
+
+    def sample(self, genes, dtype=float):
+        """
+        Losowe wartości genów o podanych indeksach (globalny np.random)
+        """
+        genes = np.asarray(genes)
+        if self.values is not None:
+            return self.values[np.random.randint(0, len(self.values), size=genes.shape)].astype(dtype)
+        low, high = self.at(genes)
+        return np.random.uniform(low, high, size=genes.shape).astype(dtype, copy=False)
+
+    def clip(self, values, genes):
+        """
+        Przycina w miejscu wartości genów o podanych indeksach do ich zakresu
+        """
+        low, high = self.at(genes)
+        return np.clip(values, low, high, out=values)
+
+    def attach(self, ga_instance):
+        ga_instance.gene_bounds = self
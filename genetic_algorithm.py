@@ -1,8 +1,22 @@
+import os
+import time
+import numpy as np
 import pygad
 from visualizer import Visualizer
-from fitness_function import FitnessFunction
+from fitness_function import FitnessFunction, FitnessCache
+from objectives import Objective, get_objective
+from async_fitness import AsyncEvaluator, SubprocessEvaluation
+from checkpoint import Checkpoint
+from stopping import EarlyStopping
+from telemetry import Telemetry, profile_call
+from history import History
+from surrogate import SurrogateScreening, true_evaluations
+from numpy_ga import NumpyGA
 import logging
-from mutation import on_generation
+from mutation import Mutation, on_generation
+from crossover import Crossover
+from gene_bounds import GeneBounds
+from packed_bits import PackedCrossover, PackedMutation, packed_size
 
 logging.basicConfig(level=logging.INFO,
                     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
@@ -13,115 +27,388 @@ class GeneticAlgorithm:
     def __init__(self, config):
         self.config = config
         self.ga_instance = None
+        self.telemetry = None
+        self.history = None
         self.result_stats = {}
+        self.objective = get_objective(config.objective)
+        self.evaluator = None
+        self.surrogate = None
+        if config.objective_command:
+            # Wartości liczy zewnętrzny program, opis problemu pochodzi z rejestru
+            self.evaluator = AsyncEvaluator(SubprocessEvaluation(config.objective_command),
+                                            config.evaluation_workers, config.evaluation_timeout,
+                                            config.evaluation_penalty)
+            self.objective = Objective(self.objective.name, self.evaluator, self.objective.optimum_value,
+                                       self.objective.optimum_point, self.objective.domain,
+                                       self.objective.dimensions)
+
+        # Zakres genów: wspólny lub wektorowy, bez listy wpisów dla każdego genu
+        self.gene_bounds = GeneBounds.from_config(config)
 
         # Dodaj atrybuty potrzebne dla reprezentacji binarnej
         if config.is_binary:
             self.bits_per_gene = config.bits_per_gene
-            self.gene_space = [[0, 1]] * (config.num_genes * config.bits_per_gene)
-            self.num_genes_actual = config.num_genes * config.bits_per_gene
+        self.num_genes_actual = GeneticAlgorithm.chromosome_length(config)
+
+    @staticmethod
+    def chromosome_length(config):
+        """
+        Liczba genów chromosomu pygad: zmienne, bity albo bajty spakowanych bitów
+        """
+        if not config.is_binary:
+            return config.num_genes
+        num_bits = config.num_genes * config.bits_per_gene
+        return packed_size(num_bits) if config.bit_storage == 'packed' else num_bits
+
+    def _fitness_settings(self):
+        """
+        Zwraca funkcję dopasowania i rozmiar wsadu dla pygad.GA.
+        Domyślnie cała populacja jest oceniana jednym wywołaniem.
+        """
+        batch_size = self.config.fitness_batch_size
+        if batch_size is None:
+            batch_size = self.config.sol_per_pop
+
+        if batch_size == 1:
+            if self.config.is_binary:
+                return FitnessFunction.fitness_func_binary, None
+            return FitnessFunction.fitness_func_real, None
+
+        if self.config.is_binary:
+            fitness_func = FitnessFunction.fitness_func_binary_batch
         else:
-            self.gene_space = [{'low': config.init_range_low, 'high': config.init_range_high}] * config.num_genes
-            self.num_genes_actual = config.num_genes
+            fitness_func = FitnessFunction.fitness_func_real_batch
+
+        if self.config.surrogate:
+            # Model zastępczy wybiera, które rozwiązania wsadu ocenić prawdziwą funkcją
+            self.surrogate = SurrogateScreening(fitness_func, self.config.num_genes,
+                                                self.config.surrogate_archive_size,
+                                                self.config.surrogate_neighbors, self.config.surrogate_fraction)
+            return self.surrogate, batch_size
+        return fitness_func, batch_size
 
     def setup(self):
-        # Dla reprezentacji binarnej
+        engine = NumpyGA if self.config.backend == 'numpy' else pygad.GA
+        self.ga_instance = engine(**self._ga_arguments())
+        self.is_binary = self.config.is_binary
+
         if self.config.is_binary:
-            self.is_binary = True
-            self.bits_per_gene = self.config.bits_per_gene
-            self.gene_range_low = self.config.init_range_low
-            self.gene_range_high = self.config.init_range_high
-            self.num_genes_original = self.config.num_genes
-
-            self.ga_instance = pygad.GA(
-                num_generations=self.config.num_generations,
-                num_parents_mating=self.config.num_parents_mating,
-                sol_per_pop=self.config.sol_per_pop,
-                num_genes=self.config.num_genes * self.config.bits_per_gene,
+            self._set_binary_parameters()
+        self._set_problem_parameters()
+        self._resume()
+
+    def _ga_arguments(self):
+        """
+        Argumenty pygad.GA: parametry wspólne z konfiguracji oraz zależne od reprezentacji
+        (liczba i typ genów, zakres, operatory)
+        """
+        config = self.config
+        fitness_func, fitness_batch_size = self._fitness_settings()
+        arguments = dict(
+            num_generations=config.num_generations,
+            num_parents_mating=config.num_parents_mating,
+            sol_per_pop=config.sol_per_pop,
+            parent_selection_type=config.parent_selection_type,
+            K_tournament=config.K_tournament,
+            keep_elitism=config.keep_elitism,
+            keep_parents=config.keep_parents,
+            crossover_probability=config.crossover_probability,
+            mutation_probability=config.mutation_probability,
+            mutation_percent_genes=config.mutation_percent_genes,
+            mutation_by_replacement=config.mutation_by_replacement,
+            random_mutation_min_val=config.random_mutation_min_val,
+            random_mutation_max_val=config.random_mutation_max_val,
+            on_generation=on_generation,
+            fitness_func=fitness_func,
+            fitness_batch_size=fitness_batch_size,
+            parallel_processing=config.parallel_processing,
+            save_solutions=config.save_solutions,
+            save_best_solutions=config.save_best_solutions,
+            suppress_warnings=config.suppress_warnings,
+            random_seed=config.random_seed
+        )
+
+        if not config.is_binary:
+            arguments.update(
+                num_genes=config.num_genes,
+                init_range_low=config.init_range_low,
+                init_range_high=config.init_range_high,
+                gene_type=self._gene_type(),
+                crossover_type=config.crossover_type,
+                mutation_type=config.mutation_type
+            )
+        elif config.bit_storage == 'packed':
+            # Geny pygad to bajty z 8 spakowanymi bitami; operatory działają bitowo
+            crossover_type, mutation_type = self._packed_operators()
+            arguments.update(
+                num_genes=self.num_genes_actual,
                 init_range_low=0,
-                init_range_high=2,
-                gene_type=int,
-                parent_selection_type=self.config.parent_selection_type,
-                crossover_type=self.config.crossover_type,
-                mutation_type=self.config.mutation_type,
-                mutation_percent_genes=10,
-                keep_elitism=5,
-                on_generation=on_generation,
-                gene_space=[0, 1],
-                fitness_func=FitnessFunction.fitness_func_binary
+                init_range_high=256,
+                gene_type=np.uint8,
+                gene_space=self.gene_bounds.gene_space(),
+                crossover_type=crossover_type,
+                mutation_type=mutation_type
             )
-
-            self.ga_instance.is_binary = self.is_binary
-            self.ga_instance.bits_per_gene = self.bits_per_gene
-            self.ga_instance.gene_range_low = self.gene_range_low
-            self.ga_instance.gene_range_high = self.gene_range_high
-            self.ga_instance.num_genes_original = self.num_genes_original
         else:
-            # Dla reprezentacji rzeczywistej
-            self.ga_instance = pygad.GA(
-                num_generations=self.config.num_generations,
-                num_parents_mating=self.config.num_parents_mating,
-                sol_per_pop=self.config.sol_per_pop,
-                num_genes=self.config.num_genes,
-                init_range_low=self.config.init_range_low,
-                init_range_high=self.config.init_range_high,
-                gene_type=self.config.gene_type,
-                parent_selection_type=self.config.parent_selection_type,
-                crossover_type=self.config.crossover_type,
-                mutation_type=self.config.mutation_type,
-                mutation_percent_genes=10,
-                keep_elitism=5,
-                on_generation=on_generation,
-                fitness_func=FitnessFunction.fitness_func_real
+            arguments.update(
+                num_genes=self.num_genes_actual,
+                init_range_low=0,
+                init_range_high=2,
+                gene_type=self._gene_type(),
+                gene_space=self.gene_bounds.gene_space(),
+                crossover_type=config.crossover_type,
+                mutation_type=config.mutation_type
             )
-            self.is_binary = False
+        return arguments
+
+    def _gene_type(self):
+        """
+        Typ genów reprezentacji rzeczywistej lub niespakowanych bitów. Polityka
+        'compact' zmniejsza populację: float32 zamiast float64 i int8 zamiast int64
+        (typ ze znakiem, bo mutacja Gaussa może dać bit -1); operatory, funkcja
+        celu i historia zachowują ten typ.
+        """
+        compact = self.config.dtype_policy == 'compact'
+        if self.config.is_binary:
+            return np.int8 if compact else int
+        if compact and np.dtype(self.config.gene_type) == np.float64:
+            return np.float32
+        return self.config.gene_type
+
+    def _set_binary_parameters(self):
+        """
+        Przekazuje parametry dekodowania reprezentacji binarnej do instancji pygad.GA
+        """
+        self.bits_per_gene = self.config.bits_per_gene
+        # Zakres zdekodowanych genów: wspólny lub osobny dla każdego genu
+        self.gene_range_low = np.asarray(self.config.init_range_low, dtype=float)
+        self.gene_range_high = np.asarray(self.config.init_range_high, dtype=float)
+        self.num_genes_original = self.config.num_genes
+
+        self.ga_instance.is_binary = True
+        self.ga_instance.num_bits = self.config.num_genes * self.config.bits_per_gene
+        self.ga_instance.binary_encoding = self.config.binary_encoding
+        self.ga_instance.bit_storage = self.config.bit_storage
+        # Odpowiednik mutacji 'random' dla bitów: mutation_percent_genes losowanych
+        # genów dostaje losową wartość 0/1, więc zmienia się co drugi z nich
+        self.ga_instance.bit_flip_rate = self.config.mutation_percent_genes / 100 / 2
+        self.ga_instance.bits_per_gene = self.bits_per_gene
+        self.ga_instance.gene_range_low = self.gene_range_low
+        self.ga_instance.gene_range_high = self.gene_range_high
+        self.ga_instance.num_genes_original = self.num_genes_original
+        self.ga_instance.fitness_cache = (FitnessCache(self.config.fitness_cache_size)
+                                          if self.config.fitness_cache_size else None)
+
+    def _packed_operators(self):
+        """
+        Operatory krzyżowania i mutacji działające na spakowanych bitach
+        """
+        crossover_operators = {
+            'single_point': PackedCrossover.single_point,
+            'two_points': PackedCrossover.two_points,
+            'uniform': PackedCrossover.uniform,
+            Crossover.single_point: PackedCrossover.single_point,
+            Crossover.two_points: PackedCrossover.two_points,
+            Crossover.uniform: PackedCrossover.uniform,
+        }
+        crossover_type = self.config.crossover_type
+        if crossover_type not in crossover_operators:
+            raise ValueError(f"Krzyżowanie {crossover_type} nie jest dostępne dla bit_storage='packed'")
+        if self.config.mutation_type not in ('random', Mutation.random, PackedMutation.bit_flip):
+            raise ValueError(f"Mutacja {self.config.mutation_type} nie jest dostępna dla bit_storage='packed' "
+                             f"(dostępna: random)")
+        return crossover_operators[crossover_type], PackedMutation.bit_flip
+
+    def _set_problem_parameters(self):
+        """
+        Przekazuje funkcję celu i parametry własnych operatorów do instancji pygad.GA
+        """
+        self.ga_instance.objective = self.objective
+        self.ga_instance.total_generations = self.config.num_generations
+        self._set_mutation_parameters()
+        self._set_logging_parameters()
+        self._set_checkpoint_parameters()
+        self._set_stopping_parameters()
+        self._set_surrogate()
+        self._set_telemetry()
+        self._set_history()
+
+    def _set_mutation_parameters(self):
+        """
+        Przekazuje parametry własnych operatorów mutacji do instancji pygad.GA
+        """
+        self.ga_instance.mutation_rate = self.config.mutation_rate
+        self.ga_instance.adaptive_mutation_rate = self.config.adaptive_mutation_rate
+        self.ga_instance.mutation_sigma = self.config.mutation_sigma
+        self.gene_bounds.attach(self.ga_instance)
+
+    def _set_logging_parameters(self):
+        """
+        Przekazuje ustawienia logowania postępu do callbacku on_generation
+        """
+        log_level = self.config.log_level
+        if isinstance(log_level, str):
+            log_level = logging.getLevelName(log_level.upper())
+        self.ga_instance.log_interval = self.config.log_interval
+        self.ga_instance.log_level = log_level
 
-    def run(self):
+    def _set_checkpoint_parameters(self):
+        """
+        Przekazuje ustawienia punktów kontrolnych do callbacku on_generation
+        """
+        self.ga_instance.checkpoint_path = self.config.checkpoint_path
+        self.ga_instance.checkpoint_interval = self.config.checkpoint_interval
+
+    def _set_stopping_parameters(self):
+        """
+        Przekazuje kryteria wcześniejszego zatrzymania do callbacku on_generation
+        """
+        self.ga_instance.target_value = self.config.target_value
+        self.ga_instance.stagnation_window = self.config.stagnation_window
+        self.ga_instance.stagnation_tolerance = self.config.stagnation_tolerance
+        self.ga_instance.min_diversity = self.config.min_diversity
+        self.ga_instance.max_time = self.config.max_time
+        self.ga_instance.stop_reason = EarlyStopping.NUM_GENERATIONS
+
+    def _set_surrogate(self):
+        """
+        Udostępnia model zastępczy telemetrii (liczba prawdziwych ocen, korelacja rang)
+        """
+        self.ga_instance.surrogate = None
+        if self.surrogate is not None:
+            self.surrogate.attach(self.ga_instance)
+
+    def _set_telemetry(self):
+        """
+        Włącza pomiary generacji, jeśli podano telemetry_path
+        """
+        self.ga_instance.telemetry = None
+        if self.config.telemetry_path:
+            self.telemetry = Telemetry(self.config.num_generations)
+            self.telemetry.attach(self.ga_instance)
+
+    def _set_history(self):
+        """
+        Tworzy ograniczoną historię najlepszych rozwiązań dla wykresów
+        """
+        self.ga_instance.history = None
+        if self.config.history_size:
+            # Rozwiązania binarne są zapisywane po dekodowaniu, więc jako float64
+            dtype = float if self.config.is_binary else self.ga_instance.population.dtype
+            self.history = History(self.config.history_size, self.config.num_genes,
+                                   self.config.history_stride, self.config.history_path, dtype)
+            self.history.attach(self.ga_instance)
+
+    def _resume(self):
+        """
+        Wznawia przebieg z punktu kontrolnego resume_from (jeśli plik istnieje).
+        pygad kontynuuje numerację od generations_completed, więc num_generations
+        to liczba generacji pozostałych do wykonania.
+        """
+        resume_from = self.config.resume_from
+        if not resume_from:
+            return
+        if not os.path.exists(resume_from):
+            logger.info(f"Brak punktu kontrolnego {resume_from}, przebieg startuje od początku")
+            return
+
+        generations_completed = Checkpoint.restore(self.ga_instance, Checkpoint.load(resume_from))
+        self.ga_instance.num_generations = max(0, self.config.num_generations - generations_completed)
+        logger.info(f"Wznowiono z {resume_from} po {generations_completed} generacjach")
+
+    def run(self, visualize=True):
         """
         Uruchamia algorytm genetyczny i wizualizuje wyniki.
+        Przy visualize=False wykresy nie są rysowane (np. w procesach roboczych).
         """
-        self.ga_instance.run()
+        start_time = time.perf_counter()
+        profile_call(self.ga_instance.run, self.config.profile, self.config.profile_path)
+        wall_time = time.perf_counter() - start_time
 
         # Najlepsze rozwiązanie
-        solution, solution_fitness, solution_idx = self.ga_instance.best_solution()
+        solution, solution_fitness, solution_idx = self.ga_instance.best_solution(
+            pop_fitness=self.ga_instance.last_generation_fitness)
         actual_fitness = 1.0 / solution_fitness
 
         self.result_stats = {
             "best_solution": solution,
             "function_value": actual_fitness,
             "generations": self.ga_instance.generations_completed,
+            "stop_reason": self.ga_instance.stop_reason,
             "crossover_type": self.config.crossover_type,
             "mutation_type": self.config.mutation_type,
-            "parent_selection_type": self.config.parent_selection_type
+            "parent_selection_type": self.config.parent_selection_type,
+            "objective": self.config.objective,
+            "backend": self.config.backend,
+            "random_seed": self.config.random_seed,
+            "wall_time": wall_time,
+            # Tylko oceny prawdziwą funkcją; przewidywania modelu zastępczego
+            # są podawane osobno jako surrogate_predictions
+            "fitness_evaluations": (getattr(self.ga_instance, 'total_fitness_evaluations', 0)
+                                    + true_evaluations(self.ga_instance)),
+            "fitness_history": np.asarray(self.ga_instance.best_solutions_fitness),
+            "trajectory": self._trajectory(solution)
         }
 
+        if self.history is not None:
+            self.history.flush()
+
+        if self.telemetry is not None:
+            self.telemetry.save(self.config.telemetry_path)
+            self.result_stats["telemetry"] = self.telemetry.data()
+            self.result_stats["phase_times"] = self.telemetry.summary()
+
+        if self.evaluator is not None:
+            self.result_stats.update(self.evaluator.stats())
+
+        if self.surrogate is not None:
+            self.result_stats.update(self.surrogate.stats())
+
+        if getattr(self.ga_instance, 'fitness_cache', None) is not None:
+            self.result_stats.update(self.ga_instance.fitness_cache.stats())
+
+        optimum = self.objective.optimum(self.config.num_genes)
+
         if self.config.is_binary:
-            decoded_solution = FitnessFunction.decode_binary(
-                solution,
-                self.config.init_range_high,
-                self.config.init_range_low,
-                self.config.num_genes,
-                self.config.bits_per_gene
-            )
+            decoded_solution = FitnessFunction.decode_population(self.ga_instance, solution)[0]
             self.result_stats["decoded_solution"] = decoded_solution
 
             logger.info("\n=== Results ===")
             logger.info(f"Best solution (binary): {solution}")
             logger.info(f"Decoded solution: {decoded_solution}")
             logger.info(f"Function value: {actual_fitness}")
-            logger.info(f"Number of generations: {self.ga_instance.generations_completed}")
-            logger.info(f"Global optimum should be at [5.0, 5.0] with value 0.0")
+            logger.info(f"Number of generations: {self.ga_instance.generations_completed} "
+                        f"(stop reason: {self.ga_instance.stop_reason})")
+            logger.info(f"Global optimum should be at {optimum} with value {self.objective.optimum_value}")
         else:
             logger.info("\n=== Results ===")
             logger.info(f"Best solution: {solution}")
             logger.info(f"Function value: {actual_fitness}")
-            logger.info(f"Number of generations: {self.ga_instance.generations_completed}")
-            logger.info(f"Global optimum should be at [5.0, 5.0] with value 0.0")
+            logger.info(f"Number of generations: {self.ga_instance.generations_completed} "
+                        f"(stop reason: {self.ga_instance.stop_reason})")
+            logger.info(f"Global optimum should be at {optimum} with value {self.objective.optimum_value}")
+
+        if not visualize:
+            return self.result_stats
 
         title_prefix = "Binary Representation: " if self.config.is_binary else "Real Representation: "
+        Visualizer.render(self.result_stats, title_prefix)
 
-        Visualizer.plot_fitness_history(self.ga_instance, title_prefix)
-        Visualizer.plot_solution_trajectory(self.ga_instance, title_prefix)
-        Visualizer.plot_3d_function_surface(self.ga_instance, title_prefix)
+        return self.result_stats
 
-        return self.result_stats
\ No newline at end of file
+    def _trajectory(self, best_solution):
+        """
+        Zwraca trajektorię najlepszych rozwiązań w przestrzeni zmiennych: z historii
+        (history.py, już zdekodowaną), a bez niej z best_solutions pygad
+        lub samo najlepsze rozwiązanie.
+        """
+        if self.history is not None and self.history.count:
+            return np.array(self.history.trajectory())
+
+        solutions = np.asarray(self.ga_instance.best_solutions)
+        if solutions.ndim != 2 or solutions.shape[1] != self.num_genes_actual:
+            solutions = np.atleast_2d(best_solution)
+
+        if self.config.is_binary:
+            return FitnessFunction.decode_population(self.ga_instance, solutions)
+        return solutions.astype(float)
@@ -1,28 +1,252 @@
+import numpy as np
+from objectives import get_objective
+
+
 class GeneticAlgorithmConfig:
     def __init__(self,
                  num_generations=100,
                  sol_per_pop=50,
                  num_parents_mating=25,
                  num_genes=2,
-                 init_range_low=0,
-                 init_range_high=2,
+                 init_range_low=None,
+                 init_range_high=None,
                  gene_type=int,
                  parent_selection_type="tournament",
                  crossover_type="single_point",
                  mutation_type="random",
                  K_tournament=3,
                  bits_per_gene=20,
-                 is_binary=False):
+                 is_binary=False,
+                 fitness_batch_size=None,
+                 random_seed=None,
+                 mutation_rate=0.1,
+                 adaptive_mutation_rate=0.2,
+                 mutation_sigma=1.0,
+                 log_interval=10,
+                 log_level='INFO',
+                 fitness_cache_size=0,
+                 objective='martin_gaddy',
+                 checkpoint_path=None,
+                 checkpoint_interval=10,
+                 resume_from=None,
+                 target_value=None,
+                 stagnation_window=None,
+                 stagnation_tolerance=0.0,
+                 min_diversity=None,
+                 max_time=None,
+                 islands=1,
+                 migration_interval=10,
+                 migration_size=2,
+                 migration_topology='ring',
+                 telemetry_path=None,
+                 profile=None,
+                 profile_path=None,
+                 binary_encoding='plain',
+                 bit_storage='unpacked',
+                 mutation_percent_genes=10,
+                 keep_elitism=5,
+                 keep_parents=None,
+                 crossover_probability=None,
+                 mutation_probability=None,
+                 mutation_by_replacement=False,
+                 random_mutation_min_val=-1.0,
+                 random_mutation_max_val=1.0,
+                 parallel_processing=None,
+                 save_solutions=False,
+                 save_best_solutions=False,
+                 suppress_warnings=False,
+                 history_size=1000,
+                 history_stride=1,
+                 history_path=None,
+                 objective_command=None,
+                 evaluation_workers=4,
+                 evaluation_timeout=None,
+                 evaluation_penalty=1e10,
+                 backend='pygad',
+                 dtype_policy='default',
+                 surrogate=None,
+                 surrogate_archive_size=2000,
+                 surrogate_neighbors=5,
+                 surrogate_fraction=0.3):
         self.num_generations = num_generations
         self.sol_per_pop = sol_per_pop
         self.num_parents_mating = num_parents_mating
         self.num_genes = num_genes
-        self.init_range_low = init_range_low
-        self.init_range_high = init_range_high
+        # Funkcja celu z rejestru (objectives.py); brak zakresu oznacza jej dziedzinę
+        self.objective = objective
+        objective_entry = get_objective(objective)
+        objective_entry.check_dimensions(num_genes)
+        # Zakres może być wspólny (liczba) lub osobny dla każdego genu (lista długości num_genes)
+        self.init_range_low = objective_entry.domain[0] if init_range_low is None else init_range_low
+        self.init_range_high = objective_entry.domain[1] if init_range_high is None else init_range_high
         self.gene_type = gene_type
         self.parent_selection_type = parent_selection_type
         self.crossover_type = crossover_type
         self.mutation_type = mutation_type
         self.K_tournament = K_tournament
         self.bits_per_gene = bits_per_gene
-        self.is_binary = is_binary
\ No newline at end of file
+        self.is_binary = is_binary
+        # None oznacza ocenę całej populacji w jednym wywołaniu
+        self.fitness_batch_size = fitness_batch_size
+        self.random_seed = random_seed
+        # Parametry własnych operatorów mutacji (mutation.py)
+        self.mutation_rate = mutation_rate
+        self.adaptive_mutation_rate = adaptive_mutation_rate
+        self.mutation_sigma = mutation_sigma
+        # Logowanie postępu co log_interval generacji (0 lub None wyłącza)
+        self.log_interval = log_interval
+        self.log_level = log_level
+        # Rozmiar pamięci podręcznej dopasowania (tylko binarna; 0 wyłącza)
+        self.fitness_cache_size = fitness_cache_size
+        # Punkty kontrolne (.npz) co checkpoint_interval generacji; resume_from wznawia przebieg
+        self.checkpoint_path = checkpoint_path
+        self.checkpoint_interval = checkpoint_interval
+        self.resume_from = resume_from
+        # Wcześniejsze zatrzymanie (None wyłącza kryterium): docelowa wartość funkcji celu,
+        # brak poprawy o więcej niż stagnation_tolerance przez stagnation_window generacji,
+        # minimalna różnorodność populacji i limit czasu w sekundach
+        self.target_value = target_value
+        self.stagnation_window = stagnation_window
+        self.stagnation_tolerance = stagnation_tolerance
+        self.min_diversity = min_diversity
+        self.max_time = max_time
+        # Model wyspowy (islands.py): liczba wysp (1 wyłącza) i parametry migracji
+        self.islands = islands
+        self.migration_interval = migration_interval
+        self.migration_size = migration_size
+        self.migration_topology = migration_topology
+        # Telemetria generacji do pliku JSON Lines (None wyłącza) i profiler
+        # przebiegu ('cprofile', 'pyinstrument' lub None)
+        self.telemetry_path = telemetry_path
+        self.profile = profile
+        self.profile_path = profile_path
+        # Reprezentacja binarna: kodowanie 'plain' lub 'gray' oraz przechowywanie
+        # bitów jako osobnych genów ('unpacked') lub po 8 w bajcie ('packed')
+        if binary_encoding not in ('plain', 'gray'):
+            raise ValueError(f"Nieznane kodowanie binarne '{binary_encoding}'. Dostępne: plain, gray")
+        if bit_storage not in ('unpacked', 'packed'):
+            raise ValueError(f"Nieznany sposób przechowywania bitów '{bit_storage}'. Dostępne: unpacked, packed")
+        self.binary_encoding = binary_encoding
+        self.bit_storage = bit_storage
+        # Parametry pygad.GA przekazywane bez zmian (opis w dokumentacji PyGAD)
+        self.mutation_percent_genes = mutation_percent_genes
+        self.keep_elitism = keep_elitism
+        self.keep_parents = keep_parents
+        self.crossover_probability = crossover_probability
+        self.mutation_probability = mutation_probability
+        self.mutation_by_replacement = mutation_by_replacement
+        self.random_mutation_min_val = random_mutation_min_val
+        self.random_mutation_max_val = random_mutation_max_val
+        # Równoległa ocena dopasowania w pygad: None, liczba wątków albo ['thread'|'process', liczba]
+        self.parallel_processing = parallel_processing
+        # Historie pygad (save_solutions, save_best_solutions) rosną z każdą generacją;
+        # wykresy korzystają z ograniczonej historii poniżej
+        self.save_solutions = save_solutions
+        self.save_best_solutions = save_best_solutions
+        self.suppress_warnings = suppress_warnings
+        # Historia najlepszych rozwiązań (history.py): ostatnie history_size wpisów
+        # zapisywanych co history_stride generacji, opcjonalnie w pliku .npy
+        # mapowanym do pamięci (0 wyłącza historię)
+        self.history_size = history_size
+        self.history_stride = history_stride
+        self.history_path = history_path
+        # Zewnętrzna funkcja celu (async_fitness.py): polecenie oceniające jedno
+        # rozwiązanie, liczba ocen wykonywanych naraz, limit czasu jednej oceny w sekundach
+        # i wartość funkcji celu przypisywana ocenie przerwanej lub zakończonej błędem.
+        # objective nadal opisuje dziedzinę, optimum i wykresy.
+        self.objective_command = objective_command
+        self.evaluation_workers = evaluation_workers
+        self.evaluation_timeout = evaluation_timeout
+        self.evaluation_penalty = evaluation_penalty
+        # Silnik algorytmu: 'pygad' (pygad.GA) lub 'numpy' (numpy_ga.py)
+        self.backend = backend
+        # Typy genów: 'default' (gene_type, int dla bitów) lub 'compact'
+        # (float32 dla genów rzeczywistych, int8 dla bitów)
+        self.dtype_policy = dtype_policy
+        # Wstępna ocena potomków modelem zastępczym (surrogate.py): 'knn' lub None.
+        # Prawdziwą funkcją oceniana jest część surrogate_fraction najlepiej
+        # przewidzianych, model korzysta z ostatnich surrogate_archive_size ocen
+        self.surrogate = surrogate
+        self.surrogate_archive_size = surrogate_archive_size
+        self.surrogate_neighbors = surrogate_neighbors
+        self.surrogate_fraction = surrogate_fraction
+        self.validate()
+
+    def validate(self):
+        """
+        Sprawdza zakresy parametrów przekazywanych do pygad.GA, żeby błędna
+        konfiguracja została odrzucona przy wczytaniu, a nie w trakcie przebiegu
+        """
+        if not 0 < self.num_parents_mating <= self.sol_per_pop:
+            raise ValueError(f"num_parents_mating musi być z przedziału [1, sol_per_pop={self.sol_per_pop}], "
+                             f"podano {self.num_parents_mating}")
+        if not 0 <= self.keep_elitism <= self.sol_per_pop:
+            raise ValueError(f"keep_elitism musi być z przedziału [0, sol_per_pop={self.sol_per_pop}], "
+                             f"podano {self.keep_elitism}")
+        if self.keep_parents is not None and not -1 <= self.keep_parents <= self.num_parents_mating:
+            raise ValueError(f"keep_parents musi być z przedziału [-1, num_parents_mating="
+                             f"{self.num_parents_mating}], podano {self.keep_parents}")
+        for bound in (self.init_range_low, self.init_range_high):
+            if np.ndim(bound) > 1 or (np.ndim(bound) == 1 and len(bound) != self.num_genes):
+                raise ValueError(f"init_range_low i init_range_high muszą być liczbami lub listami "
+                                 f"długości num_genes={self.num_genes}, podano {bound}")
+        if not 1 <= self.K_tournament <= self.sol_per_pop:
+            raise ValueError(f"K_tournament musi być z przedziału [1, sol_per_pop={self.sol_per_pop}], "
+                             f"podano {self.K_tournament}")
+        if not 0 < self.mutation_percent_genes <= 100:
+            raise ValueError(f"mutation_percent_genes musi być z przedziału (0, 100], "
+                             f"podano {self.mutation_percent_genes}")
+        for name in ('crossover_probability', 'mutation_probability'):
+            value = getattr(self, name)
+            if value is not None and not 0 <= value <= 1:
+                raise ValueError(f"{name} musi być z przedziału [0, 1] lub null, podano {value}")
+        if self.random_mutation_min_val > self.random_mutation_max_val:
+            raise ValueError("random_mutation_min_val nie może być większe niż random_mutation_max_val")
+
+        parallel_processing = self.parallel_processing
+        if isinstance(parallel_processing, (list, tuple)):
+            if (len(parallel_processing) != 2 or parallel_processing[0] not in ('thread', 'process')
+                    or not (parallel_processing[1] is None or
+                            (isinstance(parallel_processing[1], int) and parallel_processing[1] >= 0))):
+                raise ValueError(f"parallel_processing musi mieć postać ['thread'|'process', liczba], "
+                                 f"podano {parallel_processing}")
+        elif parallel_processing is not None and not (isinstance(parallel_processing, int)
+                                                      and parallel_processing >= 0):
+            raise ValueError(f"parallel_processing musi być null, liczbą wątków lub "
+                             f"['thread'|'process', liczba], podano {parallel_processing}")
+
+        if self.backend not in ('pygad', 'numpy'):
+            raise ValueError(f"Nieznany silnik '{self.backend}'. Dostępne: pygad, numpy")
+        if self.backend == 'numpy' and (self.parallel_processing is not None or self.save_solutions):
+            raise ValueError("Silnik numpy nie obsługuje parallel_processing ani save_solutions")
+
+        if self.dtype_policy not in ('default', 'compact'):
+            raise ValueError(f"Nieznana polityka typów '{self.dtype_policy}'. Dostępne: default, compact")
+
+        if self.surrogate not in (None, 'knn'):
+            raise ValueError(f"Nieznany model zastępczy '{self.surrogate}'. Dostępne: knn")
+        if self.surrogate is not None:
+            if not 1 <= self.surrogate_neighbors <= self.surrogate_archive_size:
+                raise ValueError(f"surrogate_neighbors musi być z przedziału [1, surrogate_archive_size="
+                                 f"{self.surrogate_archive_size}], podano {self.surrogate_neighbors}")
+            if not 0 < self.surrogate_fraction <= 1:
+                raise ValueError(f"surrogate_fraction musi być z przedziału (0, 1], podano {self.surrogate_fraction}")
+            if self.fitness_batch_size is not None:
+                raise ValueError("Model zastępczy porządkuje całą populację naraz, więc wymaga fitness_batch_size null")
+
+        if self.history_size < 0 or self.history_stride < 1:
+            raise ValueError(f"history_size musi być nieujemne, a history_stride dodatnie, "
+                             f"podano {self.history_size} i {self.history_stride}")
+
+        if self.objective_command is not None and (isinstance(self.objective_command, str)
+                                                   or not self.objective_command):
+            raise ValueError("objective_command musi być niepustą listą argumentów, np. "
+                             "[\"python\", \"objectives.py\", \"sphere\"]")
+        if self.evaluation_workers < 1:
+            raise ValueError(f"evaluation_workers musi być dodatnie, podano {self.evaluation_workers}")
+        if self.evaluation_timeout is not None and self.evaluation_timeout <= 0:
+            raise ValueError(f"evaluation_timeout musi być dodatni lub null, podano {self.evaluation_timeout}")
+
+        for name in ('save_solutions', 'save_best_solutions', 'suppress_warnings', 'mutation_by_replacement'):
+            if not isinstance(getattr(self, name), bool):
+                raise ValueError(f"{name} musi być wartością logiczną, podano {getattr(self, name)}")
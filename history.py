@@ -0,0 +1,79 @@
+import numpy as np
+
+
+def history_dtype(num_genes, solution_dtype=np.float64):
+    return np.dtype([
+        ('generation', np.int64),
+        ('fitness', np.float64),
+        ('solution', solution_dtype, (num_genes,)),
+    ])
+
+
+class History:
+    """
+    Historia najlepszych rozwiązań kolejnych generacji w prealokowanym buforze
+    cyklicznym o stałym rozmiarze (opcjonalnie w pliku .npy mapowanym do pamięci).
+    Zapisywana jest co stride-ta generacja, a rozwiązania binarne są
+    dekodowane raz, przy zapisie. dtype to typ zapisywanych rozwiązań
+    (np. float32 przy polityce typów 'compact').
+    """
+
+    def __init__(self, capacity, num_genes, stride=1, path=None, dtype=np.float64):
+        if capacity < 1 or stride < 1:
+            raise ValueError("Rozmiar historii i krok zapisu muszą być dodatnie")
+        self.stride = stride
+        if path:
+            self.records = np.lib.format.open_memmap(path, mode='w+', dtype=history_dtype(num_genes, dtype),
+                                                     shape=(capacity,))
+        else:
+            self.records = np.zeros(capacity, dtype=history_dtype(num_genes, dtype))
+        self.count = 0
+
+    def attach(self, ga_instance):
+        ga_instance.history = self
+
+    def append(self, generation, solution, fitness):
+        row = self.records[self.count % len(self.records)]
+        row['generation'] = generation
+        row['fitness'] = fitness
+        row['solution'] = solution
+        self.count += 1
+
+    def record(self, ga_instance):
+        """
+        Zapisuje najlepsze rozwiązanie bieżącej generacji (dopasowanie jest już policzone)
+        """
+        generation = ga_instance.generations_completed
+        if generation % self.stride != 0:
+            return
+
+        fitness = ga_instance.last_generation_fitness
+        best_idx = int(np.argmax(fitness))
+        solution = ga_instance.population[best_idx]
+        if getattr(ga_instance, 'is_binary', False):
+            from fitness_function import FitnessFunction
+            solution = FitnessFunction.decode_population(ga_instance, solution)[0]
+        self.append(generation, solution, fitness[best_idx])
+
+    def data(self):
+        """
+        Zapisane wpisy od najstarszego; po zapełnieniu bufora najstarsze
+        wpisy są nadpisywane
+        """
+        capacity = len(self.records)
+        if self.count <= capacity:
+            return self.records[:self.count]
+        return np.roll(self.records, -(self.count % capacity))
+
+    def trajectory(self):
+        return self.data()['solution']
+
+    def flush(self):
+        if isinstance(self.records, np.memmap):
+            self.records.flush()
+
+    @staticmethod
+    def on_generation(ga_instance):
+        history = getattr(ga_instance, 'history', None)
+        if history is not None:
+            history.record(ga_instance)
@@ -0,0 +1,251 @@
+import copy
+import logging
+import multiprocessing
+import os
+import queue
+import threading
+import time
+from multiprocessing import shared_memory
+import numpy as np
+from genetic_algorithm import GeneticAlgorithm
+from mutation import on_generation
+from visualizer import Visualizer
+
+logger = logging.getLogger('GA_Logger')
+
+
+class MigrationChannel:
+    """
+    Bufor migracji we współdzielonej pamięci: dla każdej wyspy M najlepszych
+    osobników (geny i dopasowanie). Wyspy synchronizują się barierą, więc
+    migranci nie są przesyłani przez pickle. Geny są przechowywane jako float64,
+    co dokładnie mieści także bity i bajty spakowanych bitów.
+    """
+
+    def __init__(self, shm_name, islands, migration_size, num_genes, barrier, topology, topology_seed):
+        self.shm_name = shm_name
+        self.islands = islands
+        self.migration_size = migration_size
+        self.num_genes = num_genes
+        self.barrier = barrier
+        self.topology = topology
+        self.topology_seed = topology_seed
+        self._shm = None
+
+    @staticmethod
+    def buffer_size(islands, migration_size, num_genes):
+        return islands * migration_size * (num_genes + 1) * np.dtype(np.float64).itemsize
+
+    def attach(self):
+        """
+        Podłącza bufor w procesie wyspy; zwraca widoki (geny, dopasowanie)
+        """
+        self._shm = shared_memory.SharedMemory(name=self.shm_name)
+        data = np.ndarray((self.islands, self.migration_size, self.num_genes + 1),
+                          dtype=np.float64, buffer=self._shm.buf)
+        return data[..., :-1], data[..., -1]
+
+    def close(self):
+        if self._shm is not None:
+            self._shm.close()
+            self._shm = None
+
+    def source(self, island_index, epoch):
+        """
+        Indeks wyspy, od której dana wyspa przyjmuje migrantów w danej migracji:
+        pierścień (poprzednia wyspa) lub losowy pierścień wspólny dla wszystkich wysp
+        """
+        if self.topology == 'ring':
+            return (island_index - 1) % self.islands
+        order = np.random.default_rng([self.topology_seed, epoch]).permutation(self.islands)
+        position = int(np.flatnonzero(order == island_index)[0])
+        return int(order[position - 1])
+
+
+class Island:
+    """
+    Callback on_generation wyspy: zwykły callback (logowanie, punkty kontrolne,
+    wcześniejsze zatrzymanie), a co migration_interval generacji wymiana
+    najlepszych osobników przez MigrationChannel.
+    """
+
+    STOPPED = 'island_stopped'
+
+    def __init__(self, island_index, channel, migration_interval):
+        self.island_index = island_index
+        self.channel = channel
+        self.migration_interval = migration_interval
+        self.genes, self.fitness = channel.attach()
+
+    def on_generation(self, ga_instance):
+        if on_generation(ga_instance) == "stop":
+            # Pozostałe wyspy zatrzymają się przy najbliższej migracji
+            self.channel.barrier.abort()
+            return "stop"
+
+        if ga_instance.generations_completed % self.migration_interval != 0:
+            return None
+
+        try:
+            self.migrate(ga_instance)
+        except threading.BrokenBarrierError:
+            ga_instance.stop_reason = Island.STOPPED
+            return "stop"
+        return None
+
+    def migrate(self, ga_instance):
+        """
+        Zapisuje M najlepszych osobników do bufora i zastępuje M najgorszych
+        migrantami z wyspy źródłowej (razem z ich dopasowaniem, bez ponownej oceny)
+        """
+        fitness = ga_instance.last_generation_fitness
+        size = self.channel.migration_size
+        order = np.argsort(fitness)
+        best, worst = order[-size:], order[:size]
+
+        self.genes[self.island_index] = ga_instance.population[best]
+        self.fitness[self.island_index] = fitness[best]
+        self.channel.barrier.wait()
+
+        source = self.channel.source(self.island_index, ga_instance.generations_completed)
+        ga_instance.population[worst] = self.genes[source].astype(ga_instance.population.dtype)
+        fitness[worst] = self.fitness[source]
+        # Bufor może być nadpisany dopiero, gdy wszystkie wyspy odczytają migrantów
+        self.channel.barrier.wait()
+
+
+def _island_path(path, island_index):
+    if not path:
+        return path
+    root, ext = os.path.splitext(path)
+    return f'{root}_island{island_index}{ext}'
+
+
+def _run_island(config, island_index, seed, channel, migration_interval, results):
+    """
+    Proces roboczy jednej wyspy
+    """
+    config = copy.copy(config)
+    config.random_seed = seed
+    config.checkpoint_path = _island_path(config.checkpoint_path, island_index)
+    config.resume_from = _island_path(config.resume_from, island_index)
+    config.telemetry_path = _island_path(config.telemetry_path, island_index)
+    config.history_path = _island_path(config.history_path, island_index)
+    config.profile_path = _island_path(config.profile_path, island_index)
+    np.random.seed(seed)
+
+    island = Island(island_index, channel, migration_interval)
+    try:
+        ga = GeneticAlgorithm(config)
+        ga.setup()
+        ga.ga_instance.on_generation = island.on_generation
+        stats = ga.run(visualize=False)
+    except Exception:
+        channel.barrier.abort()
+        raise
+    finally:
+        island.channel.close()
+    results.put((island_index, stats))
+
+
+class IslandModel:
+    """
+    Model wyspowy: `islands` podpopulacji z tej samej konfiguracji, każda
+    w osobnym procesie, z migracją najlepszych osobników co migration_interval
+    generacji (topologia 'ring' lub 'random').
+    """
+
+    TOPOLOGIES = ('ring', 'random')
+
+    def __init__(self, config):
+        self.config = config
+        self.result_stats = {}
+        self.island_stats = []
+
+    def setup(self):
+        config = self.config
+        if config.migration_topology not in IslandModel.TOPOLOGIES:
+            raise ValueError(f"Nieznana topologia migracji '{config.migration_topology}'. "
+                             f"Dostępne: {', '.join(IslandModel.TOPOLOGIES)}")
+        if not 0 < config.migration_size <= config.sol_per_pop:
+            raise ValueError("migration_size musi być z zakresu 1..sol_per_pop")
+        if config.islands < 2:
+            raise ValueError("Model wyspowy wymaga co najmniej dwóch wysp")
+
+    def run(self, visualize=True):
+        config = self.config
+        # Szerokość chromosomu jak w GeneticAlgorithm (przy bitach spakowanych liczba bajtów)
+        num_genes = GeneticAlgorithm.chromosome_length(config)
+        seed_sequence = np.random.SeedSequence(config.random_seed)
+        seeds = [int(child.generate_state(1)[0]) for child in seed_sequence.spawn(config.islands + 1)]
+        topology_seed = seeds.pop()
+
+        context = multiprocessing.get_context()
+        shm = shared_memory.SharedMemory(
+            create=True, size=MigrationChannel.buffer_size(config.islands, config.migration_size, num_genes))
+        channel = MigrationChannel(shm.name, config.islands, config.migration_size, num_genes,
+                                   context.Barrier(config.islands), config.migration_topology, topology_seed)
+        results = context.Queue()
+
+        start_time = time.perf_counter()
+        try:
+            processes = [context.Process(target=_run_island,
+                                         args=(config, index, seeds[index], channel,
+                                               config.migration_interval, results))
+                         for index in range(config.islands)]
+            for process in processes:
+                process.start()
+
+            collected = {}
+            while len(collected) < config.islands:
+                if not any(process.is_alive() for process in processes) and results.empty():
+                    raise RuntimeError("Proces wyspy zakończył się błędem")
+                try:
+                    index, stats = results.get(timeout=1)
+                except queue.Empty:
+                    continue
+                collected[index] = stats
+            for process in processes:
+                process.join()
+        finally:
+            shm.close()
+            shm.unlink()
+        wall_time = time.perf_counter() - start_time
+
+        self.island_stats = [collected[index] for index in range(config.islands)]
+        self.result_stats = self.merge(self.island_stats, wall_time)
+        self.result_stats['random_seed'] = config.random_seed
+
+        logger.info("\n=== Island model results ===")
+        logger.info(f"Islands: {config.islands}, function values: {self.result_stats['island_function_values']}")
+        logger.info(f"Function value: {self.result_stats['function_value']}")
+
+        if not visualize:
+            return self.result_stats
+
+        title_prefix = "Binary Representation: " if config.is_binary else "Real Representation: "
+        Visualizer.render(self.result_stats, title_prefix)
+        return self.result_stats
+
+    @staticmethod
+    def merge(island_stats, wall_time):
+        """
+        Łączy statystyki wysp w jeden słownik o kształcie result_stats:
+        rozwiązanie i trajektoria najlepszej wyspy, historia dopasowania jako
+        maksimum po wyspach, sumaryczna liczba ocen.
+        """
+        best = min(island_stats, key=lambda stats: stats['function_value'])
+        length = max(len(stats['fitness_history']) for stats in island_stats)
+        histories = np.array([np.pad(stats['fitness_history'], (0, length - len(stats['fitness_history'])),
+                                     mode='edge') for stats in island_stats])
+
+        merged = dict(best)
+        merged.update({
+            "generations": max(stats['generations'] for stats in island_stats),
+            "wall_time": wall_time,
+            "fitness_evaluations": sum(stats['fitness_evaluations'] for stats in island_stats),
+            "fitness_history": histories.max(axis=0),
+            "islands": len(island_stats),
+            "island_function_values": [float(stats['function_value']) for stats in island_stats]
+        })
+        return merged
@@ -1,16 +1,45 @@
+import argparse
 import logging
 from config_loader import Main
+from config_benchmark import ConfigBenchmark
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Eksperymenty algorytmu genetycznego")
+    parser.add_argument('--config', default='configs.json', help="plik z konfiguracjami")
+    parser.add_argument('--parallel', action='store_true',
+                        help="uruchamia konfiguracje równolegle w osobnych procesach")
+    parser.add_argument('--max-workers', type=int, default=None,
+                        help="maksymalna liczba procesów roboczych (domyślnie liczba rdzeni)")
+    parser.add_argument('--seed', type=int, default=None, help="ziarno główne generatora liczb losowych")
+    parser.add_argument('--headless', action='store_true',
+                        help="zapisuje wykresy do plików bez otwierania okien (backend Agg)")
+    parser.add_argument('--no-plots', action='store_true', help="pomija etap rysowania wykresów")
+    parser.add_argument('--results', default='results.jsonl',
+                        help="plik wyników dopisywanych po każdym przebiegu (.jsonl lub .db dla SQLite)")
+    parser.add_argument('--skip-completed', action='store_true',
+                        help="pomija konfiguracje, które mają już wyniki w pliku --results")
+    parser.add_argument('--benchmark', type=int, default=None, metavar='N',
+                        help="uruchamia każdą konfigurację N razy i wybiera najlepszą na podstawie statystyk")
+    parser.add_argument('--threshold', type=float, default=1e-4,
+                        help="próg wartości funkcji celu uznawany za sukces w benchmarku")
+    args = parser.parse_args()
+
     # Konfiguracja logowania
     logging.basicConfig(level=logging.INFO,
                         format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
     logger = logging.getLogger('GA_Logger')
 
     logger.info("Rozpoczynanie eksperymentów algorytmu genetycznego")
-    logger.info("Wczytywanie konfiguracji z pliku configs.json")
+    logger.info(f"Wczytywanie konfiguracji z pliku {args.config}")
 
     # Uruchomienie eksperymentów
-    results = Main.run('configs.json')
+    if args.benchmark:
+        results = ConfigBenchmark.run(args.config, repeats=args.benchmark,
+                                      seed=args.seed if args.seed is not None else 0,
+                                      max_workers=args.max_workers, threshold=args.threshold)
+    else:
+        results = Main.run(args.config, parallel=args.parallel, max_workers=args.max_workers, seed=args.seed,
+                           plots=not args.no_plots, headless=args.headless,
+                           results_file=args.results, skip_completed=args.skip_completed)
 
     logger.info("Eksperymenty zakończone")
\ No newline at end of file
@@ -1,24 +1,66 @@
 import numpy as np
 import logging
+from checkpoint import Checkpoint
+from stopping import EarlyStopping
+from telemetry import Telemetry
+from history import History
 
 logging.basicConfig(level=logging.INFO,
                     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 logger = logging.getLogger('GA_Logger')
 
 
+def _mutation_positions(size, rate):
+    """
+    Losuje pozycje (indeksy w spłaszczonej tablicy) genów do mutacji, gdzie
+    każdy gen jest wybierany niezależnie z prawdopodobieństwem `rate`.
+    Odstępy między kolejnymi pozycjami mają rozkład geometryczny, więc koszt
+    zależy od liczby mutowanych genów, a nie od rozmiaru tablicy.
+    """
+    if rate <= 0 or size == 0:
+        return np.empty(0, dtype=np.intp)
+    if rate >= 1:
+        return np.arange(size)
+
+    expected = size * rate
+    chunk = int(expected + 6 * np.sqrt(expected * (1 - rate)) + 16)
+    positions = np.cumsum(np.random.geometric(rate, size=chunk)) - 1
+    while positions[-1] < size:
+        more = positions[-1] + np.cumsum(np.random.geometric(rate, size=chunk))
+        positions = np.concatenate([positions, more])
+
+    return positions[:np.searchsorted(positions, size)]
+
+
+def _add_gaussian_noise(offspring, rate, scale):
+    """
+    Dodaje szum N(0, scale) do genów wybranych z prawdopodobieństwem `rate`.
+    Dla genów całkowitych wynik jest przycinany do zakresu typu tablicy (bez
+    przepełnienia np. int8) i obcinany do liczby całkowitej (jak przy
+    przypisaniu pojedynczej wartości).
+    """
+    offspring = np.ascontiguousarray(offspring)
+    flat = offspring.reshape(-1)
+    positions = _mutation_positions(flat.size, rate)
+    values = flat[positions] + np.random.normal(0, scale, size=positions.size)
+    if np.issubdtype(flat.dtype, np.integer):
+        limits = np.iinfo(flat.dtype)
+        np.clip(values, limits.min, limits.max, out=values)
+    flat[positions] = values
+    return offspring
+
+
 class Mutation:
     @staticmethod
     def gaussian(offspring, ga_instance):
         """
         Implementacja mutacji Gaussa.
         """
-        for chromosome_idx in range(offspring.shape[0]):
-            for gene_idx in range(offspring.shape[1]):
-                if np.random.random() < 0.1:
-                    # Dodaj losowe zaburzenie z rozkładu normalnego
-                    offspring[chromosome_idx, gene_idx] += np.random.normal(0, 1)
+        rate = getattr(ga_instance, 'mutation_rate', 0.1)
+        sigma = getattr(ga_instance, 'mutation_sigma', 1.0)
 
-        return offspring
+        # Dodaj losowe zaburzenie z rozkładu normalnego
+        return _add_gaussian_noise(offspring, rate, sigma)
 
     @staticmethod
     def adaptive_gaussian(offspring, ga_instance):
@@ -26,14 +68,39 @@ class Mutation:
         Implementacja adaptacyjnej mutacji Gaussa (skala maleje z czasem).
         """
         generation = ga_instance.generations_completed
-        max_gen = ga_instance.num_generations
-        scale = max(0.1, 1 - generation / max_gen)
+        # Po wznowieniu num_generations to liczba pozostałych generacji
+        max_gen = getattr(ga_instance, 'total_generations', ga_instance.num_generations)
+        sigma = getattr(ga_instance, 'mutation_sigma', 1.0)
+        scale = sigma * max(0.1, 1 - generation / max_gen)
+
+        rate = getattr(ga_instance, 'adaptive_mutation_rate', 0.2)
+        return _add_gaussian_noise(offspring, rate, scale)
 
-        for chromosome_idx in range(offspring.shape[0]):
-            for gene_idx in range(offspring.shape[1]):
-                if np.random.random() < 0.2:
-                    offspring[chromosome_idx, gene_idx] += np.random.normal(0, scale)
+    @staticmethod
+    def random(offspring, ga_instance):
+        """
+        Wektorowy odpowiednik mutacji 'random' PyGAD z zakresem genów z gene_bounds.
+        Każdy gen jest mutowany z prawdopodobieństwem mutation_rate (jak w
+        pozostałych operatorach z tego modułu): dostaje losową wartość ze
+        zbioru wartości lub zakresu (mutation_by_replacement) albo przesunięcie
+        z [random_mutation_min_val, random_mutation_max_val), przycinane do zakresu.
+        """
+        rate = getattr(ga_instance, 'mutation_rate', 0.1)
+        bounds = getattr(ga_instance, 'gene_bounds', None)
+        offspring = np.ascontiguousarray(offspring)
+        flat = offspring.reshape(-1)
+        positions = _mutation_positions(flat.size, rate)
+        genes = positions % offspring.shape[1]
 
+        if bounds is not None and (bounds.values is not None or ga_instance.mutation_by_replacement):
+            flat[positions] = bounds.sample(genes, flat.dtype)
+            return offspring
+
+        values = flat[positions] + np.random.uniform(ga_instance.random_mutation_min_val,
+                                                     ga_instance.random_mutation_max_val, size=positions.size)
+        if bounds is not None:
+            bounds.clip(values, genes)
+        flat[positions] = values
         return offspring
 
     @staticmethod
@@ -41,15 +108,18 @@ class Mutation:
         """
         Implementacja mutacji przez zamianę indeksów.
         """
-        for chromosome_idx in range(offspring.shape[0]):
-            if np.random.random() < 0.1:
-                # Wybieramy dwa losowe punkty
-                gene_indices = np.random.choice(range(offspring.shape[1]), size=2, replace=False)
+        rate = getattr(ga_instance, 'mutation_rate', 0.1)
+        rows = np.flatnonzero(np.random.random(offspring.shape[0]) < rate)
+
+        # Dwa różne losowe punkty dla każdego wybranego chromosomu
+        gene_a = np.random.randint(0, offspring.shape[1], size=rows.size)
+        gene_b = np.random.randint(0, offspring.shape[1] - 1, size=rows.size)
+        gene_b += gene_b >= gene_a
 
-                # Zamieniamy wartości
-                temp = offspring[chromosome_idx, gene_indices[0]]
-                offspring[chromosome_idx, gene_indices[0]] = offspring[chromosome_idx, gene_indices[1]]
-                offspring[chromosome_idx, gene_indices[1]] = temp
+        # Zamieniamy wartości
+        temp = offspring[rows, gene_a]
+        offspring[rows, gene_a] = offspring[rows, gene_b]
+        offspring[rows, gene_b] = temp
 
         return offspring
 
@@ -57,29 +127,41 @@ class Mutation:
 def on_generation(ga_instance):
     """
     Callback function called after each generation.
+    Zapisuje telemetrię (telemetry.py) i historię najlepszych rozwiązań (history.py),
+    loguje postęp, zapisuje punkt kontrolny (checkpoint.py) i sprawdza kryteria
+    wcześniejszego zatrzymania (stopping.py).
+    """
+    Telemetry.on_generation(ga_instance)
+    History.on_generation(ga_instance)
+    _log_progress(ga_instance)
+    Checkpoint.on_generation(ga_instance)
+    return EarlyStopping.on_generation(ga_instance)
+
+
+def _log_progress(ga_instance):
+    """
+    Korzysta z już policzonego dopasowania (last_generation_fitness), więc nie
+    wywołuje ponownie funkcji celu. Co ile generacji i na jakim poziomie logować
+    ustawiają atrybuty log_interval i log_level (0 lub None wyłącza logowanie).
     """
-    if ga_instance.generations_completed % 10 == 0:
-        logger = logging.getLogger('GA_Logger')
-        best_solution = ga_instance.best_solution()[0]
-        best_fitness = ga_instance.best_solution()[1]
-
-        if hasattr(ga_instance, 'is_binary') and ga_instance.is_binary:
-            from fitness_function import FitnessFunction
-            decoded = FitnessFunction.decode_binary(
-                best_solution,
-                ga_instance.gene_range_high,
-                ga_instance.gene_range_low,
-                ga_instance.num_genes_original,
-                ga_instance.bits_per_gene
-            )
-            function_value = 1.0 / best_fitness - 1e-10
-
-            logger.info(f"Generation = {ga_instance.generations_completed}")
-            logger.info(f"Decoded solution = {decoded}")
-            logger.info(f"Function value = {function_value}")
-        else:
-            function_value = 1.0 / best_fitness - 1e-10
-
-            logger.info(f"Generation = {ga_instance.generations_completed}")
-            logger.info(f"Best solution = {best_solution}")
-            logger.info(f"Function value = {function_value}")
\ No newline at end of file
+    log_interval = getattr(ga_instance, 'log_interval', 10)
+    if not log_interval or ga_instance.generations_completed % log_interval != 0:
+        return
+
+    log_level = getattr(ga_instance, 'log_level', logging.INFO)
+    if not logger.isEnabledFor(log_level):
+        return
+
+    fitness = ga_instance.last_generation_fitness
+    best_idx = int(np.argmax(fitness))
+    best_solution = ga_instance.population[best_idx]
+    function_value = 1.0 / fitness[best_idx] - 1e-10
+
+    logger.log(log_level, f"Generation = {ga_instance.generations_completed}")
+    if hasattr(ga_instance, 'is_binary') and ga_instance.is_binary:
+        from fitness_function import FitnessFunction
+        decoded = FitnessFunction.decode_population(ga_instance, best_solution)[0]
+        logger.log(log_level, f"Decoded solution = {decoded}")
+    else:
+        logger.log(log_level, f"Best solution = {best_solution}")
+    logger.log(log_level, f"Function value = {function_value}")
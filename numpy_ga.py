@@ -0,0 +1,359 @@
+import time
+import numpy as np
+from selection import rank_weights, sus_points, tournament_indices, wheel_indices
+
+SELECTION_TYPES = ('tournament', 'rws', 'sus', 'rank', 'random', 'sss')
+CROSSOVER_TYPES = ('single_point', 'two_points', 'uniform', 'scattered')
+MUTATION_TYPES = ('random',)
+
+
+class NumpyGA:
+    """
+    Własny silnik algorytmu genetycznego z interfejsem zgodnym z używaną
+    częścią pygad.GA (ten sam konstruktor, run(), best_solution(), atrybuty
+    population, last_generation_fitness, best_solutions_fitness, ...), więc
+    działają z nim callback on_generation, punkty kontrolne, telemetria i wyspy.
+
+    Populacja i dopasowanie są trzymane w dwóch prealokowanych buforach
+    zamienianych po każdej generacji. Wbudowane krzyżowanie i mutacja działają
+    w miejscu, na buforach pomocniczych wypełnianych przez numpy.random.Generator,
+    a selekcja korzysta z funkcji wektorowych z selection.py; własne
+    operatory (funkcje jak w pygad) dostają rodziców i wynik jest kopiowany
+    do bufora potomków. Elita i zachowani rodzice nie są oceniani ponownie.
+
+    Nie jest to silnik całkowicie bez alokacji: w każdej generacji powstają
+    małe tablice rozmiaru populacji (sumy skumulowane i searchsorted selekcji,
+    sortowanie przy elitaryzmie, selekcji rankingowej i sss), wyniki funkcji
+    dopasowania oraz tablice zwracane przez własne operatory. Bufory
+    prealokowane mają rozmiar populacji razy liczba genów.
+    """
+
+    def __init__(self, num_generations, num_parents_mating, fitness_func, fitness_batch_size=None,
+                 sol_per_pop=None, num_genes=None, init_range_low=-4, init_range_high=4, gene_type=float,
+                 parent_selection_type='sss', keep_parents=None, keep_elitism=1, K_tournament=3,
+                 crossover_type='single_point', crossover_probability=None,
+                 mutation_type='random', mutation_probability=None, mutation_by_replacement=False,
+                 mutation_percent_genes='default', random_mutation_min_val=-1.0, random_mutation_max_val=1.0,
+                 gene_space=None, on_generation=None, save_best_solutions=False, save_solutions=False,
+                 suppress_warnings=False, parallel_processing=None, random_seed=None):
+        if parallel_processing is not None or save_solutions:
+            raise ValueError("Silnik numpy nie obsługuje parallel_processing ani save_solutions")
+        if not (callable(parent_selection_type) or parent_selection_type in SELECTION_TYPES):
+            raise ValueError(f"Nieznana selekcja '{parent_selection_type}' dla silnika numpy. "
+                             f"Dostępne: {', '.join(SELECTION_TYPES)}")
+        if not (crossover_type is None or callable(crossover_type) or crossover_type in CROSSOVER_TYPES):
+            raise ValueError(f"Nieznane krzyżowanie '{crossover_type}' dla silnika numpy. "
+                             f"Dostępne: {', '.join(CROSSOVER_TYPES)}")
+        if not (mutation_type is None or callable(mutation_type) or mutation_type in MUTATION_TYPES):
+            raise ValueError(f"Nieznana mutacja '{mutation_type}' dla silnika numpy. "
+                             f"Dostępne: {', '.join(MUTATION_TYPES)}")
+
+        self.num_generations = num_generations
+        self.num_parents_mating = num_parents_mating
+        self.fitness_func = fitness_func
+        self.fitness_batch_size = fitness_batch_size
+        self.sol_per_pop = sol_per_pop
+        self.num_genes = num_genes
+        self.parent_selection_type = parent_selection_type
+        self.K_tournament = K_tournament
+        self.keep_elitism = keep_elitism
+        self.keep_parents = -1 if keep_parents is None else keep_parents
+        self.crossover_type = crossover_type
+        self.crossover_probability = crossover_probability
+        self.mutation_type = mutation_type
+        self.mutation_by_replacement = mutation_by_replacement
+        self.random_mutation_min_val = random_mutation_min_val
+        self.random_mutation_max_val = random_mutation_max_val
+        self.on_generation = on_generation
+        self.save_best_solutions = save_best_solutions
+        self.save_solutions = False
+        self.suppress_warnings = suppress_warnings
+        self.random_seed = random_seed
+
+        # Jak w pygad: mutation_percent_genes wybiera co najmniej jeden gen potomka;
+        # tutaj każdy gen jest mutowany niezależnie z takim prawdopodobieństwem
+        if mutation_probability is None:
+            percent = 10 if mutation_percent_genes == 'default' else mutation_percent_genes
+            mutation_probability = max(1, int(percent * num_genes / 100)) / num_genes
+        self.mutation_probability = mutation_probability
+        self.mutation_percent_genes = mutation_percent_genes
+
+        # Wartości dyskretne wspólne dla wszystkich genów (np. [0, 1]) albo przedział ciągły
+        dtype = np.dtype(gene_type)
+        self.gene_values = None if gene_space is None else np.asarray(gene_space).astype(dtype)
+        self.init_range_low = init_range_low
+        self.init_range_high = init_range_high
+        self.gene_type = gene_type
+
+        if self.keep_elitism > 0:
+            self.num_kept = self.keep_elitism
+        elif self.keep_parents == -1:
+            self.num_kept = num_parents_mating
+        else:
+            self.num_kept = self.keep_parents
+        self.num_offspring = sol_per_pop - self.num_kept
+
+        self.numpy_random_generator = np.random.default_rng(random_seed)
+
+        # Bufory: populacja i dopasowanie (bieżące i następne), rodzice, partnerzy
+        # krzyżowania, maski i liczby losowe
+        self.population = self._random_genes((sol_per_pop, num_genes), dtype)
+        self._next_population = np.empty_like(self.population)
+        self.last_generation_fitness = np.zeros(sol_per_pop)
+        self._next_fitness = np.zeros(sol_per_pop)
+        self.last_generation_parents = np.empty((num_parents_mating, num_genes), dtype=dtype)
+        self.last_generation_parents_indices = np.empty(num_parents_mating, dtype=np.intp)
+        self._partners = np.empty((self.num_offspring, num_genes), dtype=dtype)
+        self._mask = np.empty((self.num_offspring, num_genes), dtype=bool)
+        self._second_mask = np.empty((self.num_offspring, num_genes), dtype=bool)
+        self._gene_choice = np.empty((self.num_offspring, num_genes), dtype=np.intp)
+        # Liczby losowe dla każdego genu w float32, gdy geny mają co najwyżej 4 bajty
+        # (float32, int8), żeby bufor nie był kilka razy większy od populacji
+        random_dtype = np.float32 if dtype.itemsize <= 4 else np.float64
+        self._uniform = np.empty((self.num_offspring, num_genes), dtype=random_dtype)
+        self._row_uniform = np.empty(max(self.num_offspring, num_parents_mating))
+        self._row_mask = np.empty(self.num_offspring, dtype=bool)
+        self._points = np.empty((3, self.num_offspring), dtype=np.intp)
+        self._gene_index = np.arange(num_genes)
+        self._first_parent = np.arange(self.num_offspring) % num_parents_mating
+        self._second_parent = (self._first_parent + 1) % num_parents_mating
+        self._tournament_uniform = np.empty((num_parents_mating, K_tournament))
+        self._solution_indices = np.arange(sol_per_pop)
+
+        self.generations_completed = 0
+        self.num_fitness_evaluations = 0
+        self.best_solutions = []
+        self.best_solutions_fitness = []
+        self.best_solutions_generations = []
+        self.run_start_time = None
+        self.run_completed = False
+        self._fitness_pending_all = True
+
+    def _random_genes(self, shape, dtype):
+        rng = self.numpy_random_generator
+        if self.gene_values is not None:
+            return self.gene_values[rng.integers(0, len(self.gene_values), size=shape)].astype(dtype)
+        return rng.uniform(self.init_range_low, self.init_range_high, size=shape).astype(dtype)
+
+    def _random_indices(self, out, high, uniform):
+        """
+        Losowe indeksy z [0, high) zapisane do bufora out (bez nowej tablicy)
+        """
+        self.numpy_random_generator.random(out=uniform)
+        np.multiply(uniform, high, out=uniform)
+        np.copyto(out, uniform, casting='unsafe')
+        return out
+
+    def cal_pop_fitness(self):
+        """
+        Ocenia osobników bez znanego dopasowania: całą populację przed pierwszą
+        generacją, potem tylko potomków (elita i rodzice mają dopasowanie skopiowane)
+        """
+        start = 0 if self._fitness_pending_all else self.num_kept
+        fitness = self.last_generation_fitness
+        solutions = self.population[start:]
+
+        if self.fitness_batch_size is None:
+            for offset, solution in enumerate(solutions):
+                fitness[start + offset] = self.fitness_func(self, solution, start + offset)
+        else:
+            for offset in range(0, len(solutions), self.fitness_batch_size):
+                batch = solutions[offset:offset + self.fitness_batch_size]
+                first = start + offset
+                fitness[first:first + len(batch)] = self.fitness_func(
+                    self, batch, self._solution_indices[first:first + len(batch)])
+
+        self.num_fitness_evaluations += len(solutions)
+        self._fitness_pending_all = False
+        return fitness
+
+    def best_solution(self, pop_fitness=None):
+        if pop_fitness is None:
+            pop_fitness = self.last_generation_fitness
+        best_idx = int(np.argmax(pop_fitness))
+        return self.population[best_idx].copy(), pop_fitness[best_idx], best_idx
+
+    def _top_indices(self, fitness, count):
+        """
+        Indeksy count najlepszych osobników (od najlepszego)
+        """
+        if count >= len(fitness):
+            return np.argsort(-fitness, kind='stable')[:count]
+        top = np.argpartition(-fitness, count - 1)[:count]
+        return top[np.argsort(-fitness[top], kind='stable')]
+
+    def select_parents(self, fitness, num_parents):
+        """
+        Wybiera rodziców wektorowymi funkcjami z selection.py (liczby losowe
+        z generatora silnika, indeksy zapisywane do bufora)
+        """
+        selection = self.parent_selection_type
+        indices = self.last_generation_parents_indices
+        rng = self.numpy_random_generator
+        uniform = self._row_uniform[:num_parents]
+
+        if selection == 'tournament':
+            rng.random(out=self._tournament_uniform)
+            tournament_indices(fitness, self._tournament_uniform, out=indices)
+        elif selection == 'rws':
+            rng.random(out=uniform)
+            wheel_indices(fitness, uniform, out=indices)
+        elif selection == 'sus':
+            wheel_indices(fitness, sus_points(rng.random(), num_parents), out=indices)
+        elif selection == 'rank':
+            rng.random(out=uniform)
+            wheel_indices(rank_weights(fitness), uniform, out=indices)
+        elif selection == 'random':
+            self._random_indices(indices, len(fitness), uniform)
+        else:
+            indices[:] = self._top_indices(fitness, num_parents)
+
+        np.take(self.population, indices, axis=0, out=self.last_generation_parents, mode='clip')
+        return self.last_generation_parents, indices
+
+    def run_select_parents(self):
+        if callable(self.parent_selection_type):
+            parents, indices = self.parent_selection_type(self.last_generation_fitness,
+                                                          self.num_parents_mating, self)
+            self.last_generation_parents[:] = parents
+            self.last_generation_parents_indices[:] = indices
+        else:
+            self.select_parents(self.last_generation_fitness, self.num_parents_mating)
+
+    def run_crossover(self):
+        """
+        Zapisuje potomków do bufora następnej populacji (wiersze po elicie lub rodzicach)
+        """
+        offspring = self._next_population[self.num_kept:]
+        parents = self.last_generation_parents
+        if self.num_offspring == 0:
+            return
+
+        if callable(self.crossover_type):
+            offspring[:] = self.crossover_type(parents, (self.num_offspring, self.num_genes), self)
+            return
+
+        np.take(parents, self._first_parent, axis=0, out=offspring, mode='clip')
+        if self.crossover_type is None:
+            return
+
+        mask = self._mask
+        if self.crossover_type in ('uniform', 'scattered'):
+            self.numpy_random_generator.random(out=self._uniform, dtype=self._uniform.dtype)
+            np.less(self._uniform, 0.5, out=mask)
+        else:
+            # Geny od punktu podziału (lub między dwoma punktami) od drugiego rodzica
+            uniform = self._row_uniform[:self.num_offspring]
+            start, end, other = self._points
+            self._random_indices(start, self.num_genes, uniform)
+            if self.crossover_type == 'two_points':
+                self._random_indices(other, self.num_genes, uniform)
+                np.maximum(start, other, out=end)
+                np.minimum(start, other, out=start)
+                np.less(self._gene_index, end[:, None], out=self._second_mask)
+            np.greater_equal(self._gene_index, start[:, None], out=mask)
+            if self.crossover_type == 'two_points':
+                np.logical_and(mask, self._second_mask, out=mask)
+
+        if self.crossover_probability is not None:
+            uniform = self._row_uniform[:self.num_offspring]
+            self.numpy_random_generator.random(out=uniform)
+            np.less(uniform, self.crossover_probability, out=self._row_mask)
+            np.logical_and(mask, self._row_mask[:, None], out=mask)
+
+        np.take(parents, self._second_parent, axis=0, out=self._partners, mode='clip')
+        np.copyto(offspring, self._partners, where=mask)
+
+    def run_mutation(self):
+        offspring = self._next_population[self.num_kept:]
+        if self.num_offspring == 0 or self.mutation_type is None:
+            return
+
+        if callable(self.mutation_type):
+            mutated = self.mutation_type(offspring, self)
+            if mutated is not offspring:
+                offspring[:] = mutated
+            return
+
+        mask = self._mask
+        uniform = self._uniform
+        self.numpy_random_generator.random(out=uniform, dtype=uniform.dtype)
+        np.less(uniform, self.mutation_probability, out=mask)
+
+        if self.gene_values is not None:
+            # Losowa wartość z gene_space (dla [0, 1] zmienia się co drugi wybrany gen)
+            self.numpy_random_generator.random(out=uniform, dtype=uniform.dtype)
+            np.multiply(uniform, len(self.gene_values), out=uniform)
+            np.copyto(self._gene_choice, uniform, casting='unsafe')
+            np.take(self.gene_values, self._gene_choice, out=self._partners, mode='clip')
+            np.copyto(offspring, self._partners, where=mask)
+            return
+
+        self.numpy_random_generator.random(out=uniform, dtype=uniform.dtype)
+        np.multiply(uniform, self.random_mutation_max_val - self.random_mutation_min_val, out=uniform)
+        np.add(uniform, self.random_mutation_min_val, out=uniform)
+        if not self.mutation_by_replacement:
+            np.add(uniform, offspring, out=uniform)
+        np.copyto(offspring, uniform, where=mask, casting='unsafe')
+
+    def run_update_population(self):
+        """
+        Uzupełnia następną populację elitą lub rodzicami (z ich dopasowaniem)
+        i zamienia bufory
+        """
+        if self.num_kept:
+            if self.keep_elitism > 0 or self.keep_parents > 0:
+                kept = self._top_indices(self.last_generation_fitness, self.num_kept)
+            else:
+                kept = self.last_generation_parents_indices
+            np.take(self.population, kept, axis=0, out=self._next_population[:self.num_kept], mode='clip')
+            np.take(self.last_generation_fitness, kept, out=self._next_fitness[:self.num_kept], mode='clip')
+
+        self.population, self._next_population = self._next_population, self.population
+        self.last_generation_fitness, self._next_fitness = self._next_fitness, self.last_generation_fitness
+
+    def run(self):
+        """
+        Wykonuje num_generations generacji (po wznowieniu kontynuuje numerację
+        od generations_completed) z tym samym porządkiem wywołań i historią
+        najlepszego dopasowania co pygad.GA.run
+        """
+        self.num_fitness_evaluations = 0
+        self.run_start_time = time.monotonic()
+        if isinstance(self.best_solutions, np.ndarray):
+            self.best_solutions = self.best_solutions.tolist()
+
+        first_generation = self.generations_completed
+        self._fitness_pending_all = True
+        self.cal_pop_fitness()
+        best_solution, best_solution_fitness, _ = self.best_solution()
+        if self.save_best_solutions:
+            self.best_solutions.append(best_solution.tolist())
+
+        for generation in range(first_generation, first_generation + self.num_generations):
+            self.best_solutions_fitness.append(best_solution_fitness)
+            self.best_solutions_generations.append(self.generations_completed)
+
+            self.run_select_parents()
+            self.run_crossover()
+            self.run_mutation()
+            self.run_update_population()
+            self.generations_completed = generation + 1
+            self.cal_pop_fitness()
+
+            best_solution, best_solution_fitness, _ = self.best_solution()
+            if self.save_best_solutions:
+                self.best_solutions.append(best_solution.tolist())
+
+            if self.on_generation is not None:
+                result = self.on_generation(self)
+                if isinstance(result, str) and result.lower() == "stop":
+                    break
+
+        best_solution, best_solution_fitness, _ = self.best_solution()
+        if self.save_best_solutions:
+            self.best_solutions[-1] = best_solution.tolist()
+        self.best_solutions_fitness.append(best_solution_fitness)
+        self.best_solutions_generations.append(self.generations_completed)
+        self.best_solutions = np.array(self.best_solutions, dtype=self.population.dtype)
+        self.run_completed = True
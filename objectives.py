@@ -0,0 +1,122 @@
+import numpy as np
+
+
+def martin_gaddy(x1, x2):
+    """
+    Funkcja Martina i Gaddy: f(x1,x2) = (x1-x2)^2 + ((x1+x2-10)/3)^2
+    Minimum globalne: f(5,5) = 0
+    """
+    term1 = (x1 - x2) ** 2
+    term2 = ((x1 + x2 - 10) / 3) ** 2
+    return term1 + term2
+
+
+def martin_gaddy_nd(X):
+    return martin_gaddy(X[..., 0], X[..., 1])
+
+
+def sphere(X):
+    """
+    f(x) = sum(x_i^2), minimum f(0,...,0) = 0
+    """
+    return np.sum(X ** 2, axis=-1)
+
+
+def rastrigin(X):
+    """
+    f(x) = 10n + sum(x_i^2 - 10 cos(2 pi x_i)), minimum f(0,...,0) = 0
+    """
+    return 10 * X.shape[-1] + np.sum(X ** 2 - 10 * np.cos(2 * np.pi * X), axis=-1)
+
+
+def rosenbrock(X):
+    """
+    f(x) = sum(100 (x_{i+1} - x_i^2)^2 + (1 - x_i)^2), minimum f(1,...,1) = 0
+    """
+    return np.sum(100 * (X[..., 1:] - X[..., :-1] ** 2) ** 2 + (1 - X[..., :-1]) ** 2, axis=-1)
+
+
+def ackley(X):
+    """
+    Funkcja Ackleya, minimum f(0,...,0) = 0
+    """
+    n = X.shape[-1]
+    term1 = -20 * np.exp(-0.2 * np.sqrt(np.sum(X ** 2, axis=-1) / n))
+    term2 = -np.exp(np.sum(np.cos(2 * np.pi * X), axis=-1) / n)
+    return term1 + term2 + 20 + np.e
+
+
+def griewank(X):
+    """
+    f(x) = 1 + sum(x_i^2)/4000 - prod(cos(x_i / sqrt(i))), minimum f(0,...,0) = 0
+    """
+    i = np.arange(1, X.shape[-1] + 1, dtype=X.dtype)
+    return 1 + np.sum(X ** 2, axis=-1) / 4000 - np.prod(np.cos(X / np.sqrt(i)), axis=-1)
+
+
+class Objective:
+    """
+    Opis funkcji celu: wektorowa funkcja (..., n) -> (...), znane minimum,
+    dziedzina i wymiar (None oznacza dowolną liczbę zmiennych)
+    """
+
+    def __init__(self, name, function, optimum_value, optimum_point, domain, dimensions=None):
+        self.name = name
+        self.function = function
+        self.optimum_value = optimum_value
+        # Współrzędna minimum (ta sama dla każdego wymiaru) lub pełny punkt
+        self.optimum_point = optimum_point
+        self.domain = domain
+        self.dimensions = dimensions
+
+    def __call__(self, X):
+        # float32 (polityka typów 'compact') jest liczone bez rzutowania na float64
+        X = np.asarray(X)
+        return self.function(X if X.dtype == np.float32 else X.astype(float, copy=False))
+
+    def optimum(self, num_genes):
+        """
+        Punkt minimum globalnego dla danej liczby zmiennych
+        """
+        point = np.asarray(self.optimum_point, dtype=float)
+        if point.ndim == 0:
+            return np.full(num_genes, float(point))
+        return point
+
+    def check_dimensions(self, num_genes):
+        if self.dimensions is not None and num_genes != self.dimensions:
+            raise ValueError(f"Funkcja celu '{self.name}' wymaga num_genes={self.dimensions}, podano {num_genes}")
+        if num_genes < 1:
+            raise ValueError("num_genes musi być dodatnie")
+
+
+OBJECTIVES = {
+    'martin_gaddy': Objective('martin_gaddy', martin_gaddy_nd, 0.0, [5.0, 5.0], (-20, 20), dimensions=2),
+    'sphere': Objective('sphere', sphere, 0.0, 0.0, (-5.12, 5.12)),
+    'rastrigin': Objective('rastrigin', rastrigin, 0.0, 0.0, (-5.12, 5.12)),
+    'rosenbrock': Objective('rosenbrock', rosenbrock, 0.0, 1.0, (-5, 10)),
+    'ackley': Objective('ackley', ackley, 0.0, 0.0, (-32.768, 32.768)),
+    'griewank': Objective('griewank', griewank, 0.0, 0.0, (-600, 600)),
+}
+
+
+def get_objective(name):
+    """
+    Zwraca funkcję celu z rejestru po nazwie
+    """
+    if name not in OBJECTIVES:
+        raise ValueError(f"Nieznana funkcja celu '{name}'. Dostępne: {', '.join(OBJECTIVES)}")
+    return OBJECTIVES[name]
+
+
+if __name__ == "__main__":
+    # Lokalny zamiennik zewnętrznego symulatora dla objective_command:
+    # python objectives.py <nazwa> [opóźnienie w sekundach]
+    import sys
+    import time
+
+    objective = get_objective(sys.argv[1])
+    delay = float(sys.argv[2]) if len(sys.argv) > 2 else 0.0
+    for line in sys.stdin:
+        time.sleep(delay)
+        print(repr(float(objective(np.array(line.split(), dtype=float)))), flush=True)
@@ -0,0 +1,102 @@
+import numpy as np
+from crossover import _parent_pairs
+from mutation import _mutation_positions
+
+
+def packed_size(num_bits):
+    """
+    Liczba bajtów potrzebna na num_bits bitów
+    """
+    return (num_bits + 7) // 8
+
+
+def pack_bits(bits):
+    """
+    Pakuje macierz bitów (pop, num_bits) po 8 w bajcie (pop, ceil(num_bits / 8))
+    """
+    return np.packbits(np.asarray(bits) != 0, axis=1)
+
+
+def unpack_bits(packed, num_bits):
+    """
+    Odwrotność pack_bits: macierz bitów (pop, num_bits) typu uint8
+    """
+    return np.unpackbits(np.asarray(packed, dtype=np.uint8), axis=1, count=num_bits)
+
+
+def _tail_mask(points, num_bytes):
+    """
+    Maska bajtów z ustawionymi bitami od pozycji points (włącznie) do końca
+    chromosomu; bity w bajcie są w kolejności np.packbits (najstarszy pierwszy).
+    """
+    byte_index = np.arange(num_bytes)
+    split_byte = (points // 8)[:, None]
+    partial = (0xFF >> (points % 8)).astype(np.uint8)[:, None]
+    return np.where(byte_index < split_byte, np.uint8(0),
+                    np.where(byte_index > split_byte, np.uint8(0xFF), partial)).astype(np.uint8)
+
+
+def _num_bits(ga_instance, num_bytes):
+    return getattr(ga_instance, 'num_bits', num_bytes * 8)
+
+
+class PackedCrossover:
+    """
+    Krzyżowanie chromosomów przechowywanych jako spakowane bity (uint8):
+    potomek = (rodzic1 & ~maska) | (rodzic2 & maska), z punktami podziału
+    na poziomie pojedynczych bitów.
+    """
+
+    @staticmethod
+    def _combine(parents, offspring_size, mask):
+        parent1, parent2 = _parent_pairs(parents, offspring_size)
+        return (parent1 & ~mask) | (parent2 & mask)
+
+    @staticmethod
+    def single_point(parents, offspring_size, ga_instance):
+        num_bits = _num_bits(ga_instance, offspring_size[1])
+        points = np.random.randint(0, num_bits, size=offspring_size[0])
+        return PackedCrossover._combine(parents, offspring_size, _tail_mask(points, offspring_size[1]))
+
+    @staticmethod
+    def two_points(parents, offspring_size, ga_instance):
+        num_bits = _num_bits(ga_instance, offspring_size[1])
+        point_a = np.random.randint(0, num_bits, size=offspring_size[0])
+        point_b = np.random.randint(0, num_bits - 1, size=offspring_size[0])
+        point_b += point_b >= point_a
+        point1 = np.minimum(point_a, point_b)
+        point2 = np.maximum(point_a, point_b)
+
+        # Bity [point1, point2) od drugiego rodzica
+        mask = _tail_mask(point1, offspring_size[1]) & ~_tail_mask(point2, offspring_size[1])
+        return PackedCrossover._combine(parents, offspring_size, mask)
+
+    @staticmethod
+    def uniform(parents, offspring_size, ga_instance):
+        # Losowe bajty są od razu spakowaną maską (p=0.5 dla każdego bitu)
+        mask = np.frombuffer(np.random.bytes(offspring_size[0] * offspring_size[1]),
+                             dtype=np.uint8).reshape(offspring_size)
+        return PackedCrossover._combine(parents, offspring_size, mask)
+
+
+class PackedMutation:
+    """
+    Mutacja chromosomów przechowywanych jako spakowane bity
+    """
+
+    @staticmethod
+    def bit_flip(offspring, ga_instance):
+        """
+        Odwraca każdy bit niezależnie z prawdopodobieństwem bit_flip_rate
+        (XOR z maską, bez rozpakowywania).
+        """
+        rate = getattr(ga_instance, 'bit_flip_rate', 0.05)
+        offspring = np.ascontiguousarray(offspring)
+        num_bytes = offspring.shape[1]
+        num_bits = _num_bits(ga_instance, num_bytes)
+
+        positions = _mutation_positions(offspring.shape[0] * num_bits, rate)
+        rows, bits = np.divmod(positions, num_bits)
+        flat = offspring.reshape(-1)
+        np.bitwise_xor.at(flat, rows * num_bytes + bits // 8, (0x80 >> (bits % 8)).astype(flat.dtype))
+        return offspring
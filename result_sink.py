@@ -0,0 +1,107 @@
+import json
+import logging
+import os
+import sqlite3
+
+logger = logging.getLogger('GA_Logger')
+
+
+class JsonlResultSink:
+    """
+    Wyniki dopisywane do pliku JSON Lines (jeden rekord na przebieg)
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._file = open(path, 'a+b')
+        self._repair_last_line()
+
+    def _repair_last_line(self):
+        """
+        Obcina niepełną ostatnią linię (zapis przerwany w trakcie), żeby kolejny
+        rekord nie został do niej doklejony
+        """
+        end = self._file.seek(0, os.SEEK_END)
+        position = end
+        while position > 0:
+            start = max(0, position - 4096)
+            self._file.seek(start)
+            chunk = self._file.read(position - start)
+            newline = chunk.rfind(b'\n')
+            if newline >= 0:
+                position = start + newline + 1
+                break
+            position = start
+        if position < end:
+            logger.warning(f"Obcięto niepełny ostatni rekord w pliku {self.path}")
+            self._file.truncate(position)
+
+    def records(self):
+        """
+        Wczytuje zapisane rekordy; niepełna ostatnia linia (przerwany zapis) jest pomijana
+        """
+        if not os.path.exists(self.path):
+            return []
+        records = []
+        with open(self.path, 'r') as f:
+            for line in f:
+                try:
+                    records.append(json.loads(line))
+                except json.JSONDecodeError:
+                    logger.warning(f"Pominięto uszkodzony rekord w pliku {self.path}")
+        return records
+
+    def append(self, record):
+        self._file.write((json.dumps(record) + '\n').encode())
+        self._file.flush()
+
+    def close(self):
+        self._file.close()
+
+
+class SqliteResultSink:
+    """
+    Wyniki dopisywane do tabeli SQLite (rekord jako JSON i kolumny do zapytań)
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._connection = sqlite3.connect(path)
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS results "
+            "(id INTEGER PRIMARY KEY, name TEXT, function_value REAL, record TEXT)")
+        self._connection.commit()
+
+    def records(self):
+        rows = self._connection.execute("SELECT record FROM results ORDER BY id")
+        return [json.loads(record) for record, in rows]
+
+    def append(self, record):
+        self._connection.execute("INSERT INTO results (name, function_value, record) VALUES (?, ?, ?)",
+                                 (record['name'], record['function_value'], json.dumps(record)))
+        self._connection.commit()
+
+    def close(self):
+        self._connection.close()
+
+
+class ResultSink:
+    """
+    Strumieniowy zapis wyników z przyrostowym wyborem najlepszego przebiegu
+    """
+
+    @staticmethod
+    def open(path):
+        """
+        Otwiera plik wyników: SQLite dla rozszerzeń .db/.sqlite, w przeciwnym razie JSON Lines
+        """
+        if os.path.splitext(path)[1] in ('.db', '.sqlite', '.sqlite3'):
+            return SqliteResultSink(path)
+        return JsonlResultSink(path)
+
+    @staticmethod
+    def best(records):
+        """
+        Rekord z najniższą wartością funkcji celu (None dla pustej listy)
+        """
+        return min(records, key=lambda record: record['function_value'], default=None)
@@ -0,0 +1,80 @@
+import numpy as np
+
+
+def tournament_indices(fitness, uniform, out=None):
+    """
+    Zwycięzcy turniejów: uniform to macierz (liczba rodziców, K) liczb z [0, 1),
+    z której powstaje macierz indeksów uczestników; wygrywa najlepszy w wierszu.
+    """
+    contestants = (uniform * len(fitness)).astype(np.intp)
+    winners = np.argmax(np.take(fitness, contestants), axis=1)
+    winners += np.arange(len(winners)) * contestants.shape[1]
+    return np.take(contestants.reshape(-1), winners, out=out)
+
+
+def wheel_indices(weights, uniform, out=None):
+    """
+    Ruletka: indeksy, w których dystrybuanta wag przekracza uniform * suma
+    (np.cumsum + np.searchsorted zamiast pętli po osobnikach)
+    """
+    cumulative = np.cumsum(weights)
+    indices = np.searchsorted(cumulative, uniform * cumulative[-1], side='right')
+    return np.minimum(indices, len(weights) - 1, out=out)
+
+
+def sus_points(start, num_parents):
+    """
+    Punkty stochastycznego próbkowania uniwersalnego: jeden losowy start z [0, 1)
+    i num_parents równych odstępów
+    """
+    return (start + np.arange(num_parents)) / num_parents
+
+
+def rank_weights(fitness):
+    """
+    Wagi selekcji rankingowej: 1 dla najgorszego, n dla najlepszego osobnika
+    """
+    weights = np.empty(len(fitness))
+    weights[np.argsort(fitness, kind='stable')] = np.arange(1, len(fitness) + 1)
+    return weights
+
+
+def _parents(ga_instance, indices):
+    return ga_instance.population[indices].copy(), indices
+
+
+class Selection:
+    """
+    Wektorowa selekcja rodziców z sygnaturą własnych operatorów pygad
+    (fitness, num_parents, ga_instance) -> (rodzice, indeksy).
+    Korzysta z globalnego np.random, jak operatory z crossover.py i mutation.py.
+    """
+
+    @staticmethod
+    def tournament(fitness, num_parents, ga_instance):
+        """
+        Wszystkie turnieje naraz jako macierz (num_parents, K_tournament) indeksów
+        """
+        k = getattr(ga_instance, 'K_tournament', 3)
+        return _parents(ga_instance, tournament_indices(fitness, np.random.random((num_parents, k))))
+
+    @staticmethod
+    def rws(fitness, num_parents, ga_instance):
+        """
+        Selekcja ruletkowa (prawdopodobieństwo proporcjonalne do dopasowania)
+        """
+        return _parents(ga_instance, wheel_indices(fitness, np.random.random(num_parents)))
+
+    @staticmethod
+    def sus(fitness, num_parents, ga_instance):
+        """
+        Stochastyczne próbkowanie uniwersalne: ruletka z równo rozmieszczonymi wskaźnikami
+        """
+        return _parents(ga_instance, wheel_indices(fitness, sus_points(np.random.random(), num_parents)))
+
+    @staticmethod
+    def rank(fitness, num_parents, ga_instance):
+        """
+        Selekcja rankingowa (prawdopodobieństwo proporcjonalne do rangi)
+        """
+        return _parents(ga_instance, wheel_indices(rank_weights(fitness), np.random.random(num_parents)))
@@ -0,0 +1,76 @@
+import time
+import numpy as np
+
+
+class EarlyStopping:
+    """
+    Kryteria wcześniejszego zatrzymania sprawdzane po każdej generacji
+    na już policzonym dopasowaniu (bez dodatkowych wywołań funkcji celu).
+    Parametry są atrybutami instancji pygad.GA; None wyłącza kryterium.
+    """
+
+    TARGET_VALUE = 'target_value'
+    STAGNATION = 'stagnation'
+    DIVERSITY = 'diversity'
+    TIME_BUDGET = 'time_budget'
+    NUM_GENERATIONS = 'num_generations'
+
+    @staticmethod
+    def function_value(fitness):
+        """
+        Wartość funkcji celu odpowiadająca dopasowaniu 1/(f+1e-10)
+        """
+        return 1.0 / fitness - 1e-10
+
+    @staticmethod
+    def diversity(ga_instance):
+        """
+        Różnorodność populacji: średnie odchylenie standardowe zmiennych
+        (dla reprezentacji binarnej po zdekodowaniu)
+        """
+        population = ga_instance.population
+        if getattr(ga_instance, 'is_binary', False):
+            from fitness_function import FitnessFunction
+            population = FitnessFunction.decode_population(ga_instance, population)
+        return float(np.mean(np.std(population, axis=0)))
+
+    @staticmethod
+    def check(ga_instance):
+        """
+        Zwraca powód zatrzymania lub None, jeśli przebieg ma trwać dalej
+        """
+        best_value = EarlyStopping.function_value(np.max(ga_instance.last_generation_fitness))
+
+        target_value = getattr(ga_instance, 'target_value', None)
+        if target_value is not None and best_value <= target_value:
+            return EarlyStopping.TARGET_VALUE
+
+        # best_solutions_fitness zawiera generacje 0..n-1, bieżąca (n) nie jest jeszcze dopisana
+        window = getattr(ga_instance, 'stagnation_window', None)
+        history = ga_instance.best_solutions_fitness
+        if window and len(history) >= window:
+            previous_value = EarlyStopping.function_value(history[-window])
+            if previous_value - best_value <= getattr(ga_instance, 'stagnation_tolerance', 0.0):
+                return EarlyStopping.STAGNATION
+
+        min_diversity = getattr(ga_instance, 'min_diversity', None)
+        if min_diversity is not None and EarlyStopping.diversity(ga_instance) < min_diversity:
+            return EarlyStopping.DIVERSITY
+
+        max_time = getattr(ga_instance, 'max_time', None)
+        if max_time is not None and time.monotonic() - ga_instance.run_start_time >= max_time:
+            return EarlyStopping.TIME_BUDGET
+
+        return None
+
+    @staticmethod
+    def on_generation(ga_instance):
+        """
+        Zapamiętuje powód zatrzymania i zwraca "stop" dla pygad, jeśli
+        któreś z kryteriów jest spełnione
+        """
+        reason = EarlyStopping.check(ga_instance)
+        if reason is None:
+            return None
+        ga_instance.stop_reason = reason
+        return "stop"
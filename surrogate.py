@@ -0,0 +1,148 @@
+import numpy as np
+
+
+def rank_correlation(x, y):
+    """
+    Współczynnik korelacji rang Spearmana (nan dla mniej niż dwóch punktów
+    lub stałych wartości)
+    """
+    if len(x) < 2 or np.ptp(x) == 0 or np.ptp(y) == 0:
+        return np.nan
+    rank_x = np.argsort(np.argsort(x))
+    rank_y = np.argsort(np.argsort(y))
+    return float(np.corrcoef(rank_x, rank_y)[0, 1])
+
+
+def true_evaluations(ga_instance):
+    """
+    Liczba ocen prawdziwą funkcją celu w bieżącym przebiegu (bez dopasowań
+    przewidzianych przez model zastępczy)
+    """
+    surrogate = getattr(ga_instance, 'surrogate', None)
+    if surrogate is None:
+        return ga_instance.num_fitness_evaluations
+    return surrogate.true_evaluations
+
+
+class KNNSurrogate:
+    """
+    Model zastępczy dopasowania: średnia ważona odwrotnością odległości
+    z k najbliższych ocenionych rozwiązań. Archiwum ocen jest prealokowanym
+    buforem cyklicznym o stałym rozmiarze (najstarsze wpisy są nadpisywane).
+    """
+
+    def __init__(self, capacity, num_genes, neighbors=5):
+        if capacity < neighbors or neighbors < 1:
+            raise ValueError("Archiwum modelu zastępczego musi mieć co najmniej tyle wpisów, ilu sąsiadów")
+        self.neighbors = neighbors
+        self.features = np.zeros((capacity, num_genes))
+        self.squared_norms = np.zeros(capacity)
+        self.fitness = np.zeros(capacity)
+        self.count = 0
+
+    @property
+    def size(self):
+        return min(self.count, len(self.fitness))
+
+    def add(self, features, fitness):
+        """
+        Dopisuje ocenione rozwiązania do archiwum
+        """
+        capacity = len(self.fitness)
+        features, fitness = features[-capacity:], fitness[-capacity:]
+        rows = (self.count + np.arange(len(fitness))) % capacity
+        self.features[rows] = features
+        self.squared_norms[rows] = np.einsum('ij,ij->i', features, features)
+        self.fitness[rows] = fitness
+        self.count += len(fitness)
+
+    def predict(self, features):
+        """
+        Przewidywane dopasowanie wierszy macierzy features
+        """
+        size = self.size
+        archive = self.features[:size]
+        # |x - a|^2 = |x|^2 - 2 x.a + |a|^2 dla całej macierzy odległości naraz
+        distances = (np.einsum('ij,ij->i', features, features)[:, None] - 2 * features @ archive.T
+                     + self.squared_norms[:size])
+        np.maximum(distances, 0, out=distances)
+        k = min(self.neighbors, size)
+        nearest = np.argpartition(distances, k - 1, axis=1)[:, :k]
+        weights = 1.0 / (np.sqrt(np.take_along_axis(distances, nearest, axis=1)) + 1e-12)
+        return np.sum(weights * self.fitness[:size][nearest], axis=1) / np.sum(weights, axis=1)
+
+
+class SurrogateScreening:
+    """
+    Wsadowa funkcja dopasowania z sygnaturą pygad (ga_instance, solutions, indices),
+    która ocenia prawdziwą funkcją tylko część rozwiązań. Model zastępczy
+    porządkuje wsad, a prawdziwą funkcję dostaje najlepsza część
+    fraction. Reszta dostaje przewidywane dopasowanie, ale nie wyższe od
+    najsłabszego prawdziwie ocenionego rozwiązania tego wsadu, więc najlepsze
+    rozwiązanie populacji ma zawsze prawdziwą wartość. Prawdziwe oceny trafiają
+    do archiwum modelu; dopóki jest w nim mniej wpisów niż sąsiadów,
+    oceniany jest cały wsad.
+    """
+
+    def __init__(self, fitness_func, num_genes, archive_size=2000, neighbors=5, fraction=0.3):
+        self.fitness_func = fitness_func
+        self.model = KNNSurrogate(archive_size, num_genes, neighbors)
+        self.fraction = fraction
+        self.true_evaluations = 0
+        self.predictions = 0
+        self.rank_correlation = np.nan
+        self._correlations = []
+
+    def __call__(self, ga_instance, solutions, solutions_idx):
+        solutions = np.atleast_2d(solutions)
+        solutions_idx = np.atleast_1d(solutions_idx)
+        features = self._features(ga_instance, solutions)
+        self.rank_correlation = np.nan
+
+        if self.model.size < self.model.neighbors:
+            fitness = np.asarray(self.fitness_func(ga_instance, solutions, solutions_idx), dtype=float)
+            self._record(features, fitness)
+            return fitness
+
+        predicted = self.model.predict(features)
+        num_true = max(1, int(np.ceil(self.fraction * len(solutions))))
+        order = np.argsort(-predicted, kind='stable')
+        chosen, rest = order[:num_true], order[num_true:]
+
+        true_fitness = np.asarray(self.fitness_func(ga_instance, solutions[chosen], solutions_idx[chosen]),
+                                  dtype=float)
+        fitness = np.empty(len(solutions))
+        fitness[chosen] = true_fitness
+        fitness[rest] = np.minimum(predicted[rest], true_fitness.min())
+
+        self.rank_correlation = rank_correlation(predicted[chosen], true_fitness)
+        if not np.isnan(self.rank_correlation):
+            self._correlations.append(self.rank_correlation)
+        self.predictions += len(rest)
+        self._record(features[chosen], true_fitness)
+        return fitness
+
+    def _features(self, ga_instance, solutions):
+        """
+        Zmienne rozwiązań (chromosomy binarne po dekodowaniu)
+        """
+        if getattr(ga_instance, 'is_binary', False):
+            from fitness_function import FitnessFunction
+            return FitnessFunction.decode_population(ga_instance, solutions)
+        return np.asarray(solutions, dtype=float)
+
+    def _record(self, features, fitness):
+        self.true_evaluations += len(fitness)
+        self.model.add(features, fitness)
+
+    def attach(self, ga_instance):
+        ga_instance.surrogate = self
+
+    def stats(self):
+        total = self.true_evaluations + self.predictions
+        return {
+            'surrogate_true_evaluations': self.true_evaluations,
+            'surrogate_predictions': self.predictions,
+            'surrogate_savings': self.predictions / total if total else 0.0,
+            'surrogate_rank_correlation': float(np.mean(self._correlations)) if self._correlations else np.nan,
+        }
@@ -0,0 +1,186 @@
+import copy
+import itertools
+import logging
+import math
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+
+logger = logging.getLogger('GA_Logger')
+
+SAMPLING_METHODS = ('grid', 'random', 'lhs')
+
+
+class Parameter:
+    """
+    Zakres wartości jednego parametru przeglądu:
+    - lista wartości (słowniki z kluczem 'label' to grupy parametrów ustawianych razem),
+    - {"range": [start, stop, step]} - ciąg arytmetyczny z końcem włącznie,
+    - {"low": a, "high": b, "log": bool, "integer": bool, "num": n} - przedział ciągły
+      (dla siatki wymaga "num" punktów).
+    """
+
+    def __init__(self, key, spec):
+        self.key = key
+        self.values = None
+        self.low = self.high = None
+        self.log = False
+        self.integer = False
+
+        if isinstance(spec, list):
+            if not spec:
+                raise ValueError(f"Parametr '{key}' nie ma żadnych wartości")
+            self.values = spec
+        elif isinstance(spec, dict) and 'range' in spec:
+            start, stop, step = spec['range']
+            count = int(math.floor((stop - start) / step + 1e-9)) + 1
+            self.values = [start + i * step for i in range(count)]
+        elif isinstance(spec, dict) and 'low' in spec and 'high' in spec:
+            self.low, self.high = spec['low'], spec['high']
+            self.log = spec.get('log', False)
+            self.integer = spec.get('integer', False)
+            if 'num' in spec:
+                space = np.geomspace if self.log else np.linspace
+                self.values = [self._cast(value) for value in space(self.low, self.high, spec['num'])]
+        else:
+            self.values = [spec]
+
+    def _cast(self, value):
+        return int(round(value)) if self.integer else float(value)
+
+    def grid_values(self):
+        if self.values is None:
+            raise ValueError(f"Parametr ciągły '{self.key}' wymaga 'num' przy przeglądzie siatki")
+        return self.values
+
+    def sample(self, u):
+        """
+        Wartość odpowiadająca kwantylowi u z [0, 1)
+        """
+        if self.values is not None:
+            return self.values[min(int(u * len(self.values)), len(self.values) - 1)]
+        if self.log:
+            return self._cast(math.exp(math.log(self.low) + u * (math.log(self.high) - math.log(self.low))))
+        return self._cast(self.low + u * (self.high - self.low))
+
+    def apply(self, value, params, name_parts):
+        """
+        Ustawia wartość w słowniku konfiguracji i dopisuje fragment nazwy
+        """
+        if isinstance(value, dict):
+            group = dict(value)
+            name_parts.append(str(group.pop('label', self.key)))
+            params.update(group)
+        else:
+            params[self.key] = value
+            name_parts.append(f"{self.key}={value:g}" if isinstance(value, float) else f"{self.key}={value}")
+
+
+class Sweep:
+    """
+    Specyfikacja przeglądu parametrów rozwijana leniwie w konfiguracje:
+    {"name": ..., "base": {...}, "grid": {parametr: zakres}, "sampling": "grid"|"random"|"lhs",
+     "samples": n, "seed": s, "successive_halving": {"min_generations": r, "eta": 3}}
+    """
+
+    def __init__(self, spec):
+        self.name = spec.get('name')
+        self.base = spec.get('base', {})
+        self.parameters = [Parameter(key, value) for key, value in spec.get('grid', {}).items()]
+        self.sampling = spec.get('sampling', 'grid')
+        self.samples = spec.get('samples')
+        self.seed = spec.get('seed')
+        self.successive_halving = spec.get('successive_halving')
+
+        if self.sampling not in SAMPLING_METHODS:
+            raise ValueError(f"Nieznana metoda próbkowania '{self.sampling}'. "
+                             f"Dostępne: {', '.join(SAMPLING_METHODS)}")
+        if self.sampling != 'grid' and not self.samples:
+            raise ValueError(f"Próbkowanie '{self.sampling}' wymaga liczby próbek 'samples'")
+        if self.sampling == 'grid':
+            for parameter in self.parameters:
+                parameter.grid_values()
+
+    def __iter__(self):
+        """
+        Kolejne konfiguracje (nazwa, słownik parametrów), bez budowania całego iloczynu
+        """
+        for values in self._value_tuples():
+            params = dict(self.base)
+            name_parts = []
+            for parameter, value in zip(self.parameters, values):
+                parameter.apply(value, params, name_parts)
+
+            if params.get('num_parents_mating', 0) > params.get('sol_per_pop', float('inf')):
+                logger.debug(f"Pominięto konfigurację {name_parts}: num_parents_mating > sol_per_pop")
+                continue
+
+            name = " + ".join(name_parts)
+            if self.name:
+                name = f"{self.name}: {name}" if name else self.name
+            yield name, params
+
+    def _value_tuples(self):
+        if self.sampling == 'grid':
+            return itertools.product(*(parameter.grid_values() for parameter in self.parameters))
+
+        rng = np.random.default_rng(self.seed)
+        if self.sampling == 'random':
+            return (tuple(parameter.sample(u) for parameter, u in zip(self.parameters, rng.random(len(self.parameters))))
+                    for _ in range(self.samples))
+
+        # Latin hypercube: każdy parametr dostaje po jednej próbce z każdego z `samples` przedziałów
+        strata = np.array([rng.permutation(self.samples) for _ in self.parameters]).reshape(-1, self.samples)
+        quantiles = (strata + rng.random(strata.shape)) / self.samples
+        return (tuple(parameter.sample(u) for parameter, u in zip(self.parameters, quantiles[:, index]))
+                for index in range(self.samples))
+
+
+class SuccessiveHalving:
+    """
+    Odrzucanie słabych konfiguracji na krótkich przebiegach: każda runda uruchamia
+    pozostałe konfiguracje z budżetem generacji mnożonym przez eta i zostawia
+    najlepszą 1/eta z nich. Ocalałe konfiguracje są zwracane z pełnym num_generations.
+    """
+
+    def __init__(self, run_function, min_generations=5, eta=3, max_workers=None, seed=None):
+        if eta < 2:
+            raise ValueError("eta musi być co najmniej 2")
+        self.run_function = run_function
+        self.min_generations = min_generations
+        self.eta = eta
+        self.max_workers = max_workers
+        self.seed = seed
+
+    def select(self, configurations):
+        # Rundy wymagają całego zbioru kandydatów (nazwy i obiekty konfiguracji)
+        candidates = list(configurations)
+        if not candidates:
+            return candidates
+
+        max_generations = max(config_data['config'].num_generations for config_data in candidates)
+        seed_sequence = np.random.SeedSequence(self.seed)
+        budget = self.min_generations
+
+        while len(candidates) > 1 and budget < max_generations:
+            # Wspólne ziarno rundy, więc konfiguracje są porównywane na tych samych losowaniach
+            rung_seed = int(seed_sequence.spawn(1)[0].generate_state(1)[0])
+            configs = []
+            for config_data in candidates:
+                config = copy.copy(config_data['config'])
+                config.num_generations = min(budget, config.num_generations)
+                config.checkpoint_path = config.resume_from = config.telemetry_path = config.history_path = None
+                configs.append(config)
+            seeds = [config.random_seed if config.random_seed is not None else rung_seed for config in configs]
+
+            with ProcessPoolExecutor(max_workers=self.max_workers) as executor:
+                values = [stats['function_value'] for stats in
+                          executor.map(self.run_function, configs, seeds, [False] * len(configs))]
+
+            keep = max(1, math.ceil(len(candidates) / self.eta))
+            order = np.argsort(values, kind='stable')[:keep]
+            logger.info(f"Successive halving: {len(candidates)} konfiguracji po {budget} generacjach, "
+                        f"zostaje {keep}")
+            candidates = [candidates[index] for index in order]
+            budget *= self.eta
+
+        return candidates
@@ -0,0 +1,180 @@
+import cProfile
+import json
+import logging
+import time
+import numpy as np
+from stopping import EarlyStopping
+from surrogate import true_evaluations
+
+logger = logging.getLogger('GA_Logger')
+
+TELEMETRY_DTYPE = np.dtype([
+    ('generation', np.int64),
+    ('selection_time', np.float64),
+    ('crossover_time', np.float64),
+    ('mutation_time', np.float64),
+    ('fitness_time', np.float64),
+    ('generation_time', np.float64),
+    ('evaluations', np.int64),
+    ('true_evaluations', np.int64),
+    ('rank_correlation', np.float64),
+    ('best_fitness', np.float64),
+    ('mean_fitness', np.float64),
+    ('std_fitness', np.float64),
+    ('diversity', np.float64),
+])
+
+# Etapy generacji pygad.GA mierzone przez opakowanie metod instancji
+_PHASES = {
+    'run_select_parents': 'selection_time',
+    'run_crossover': 'crossover_time',
+    'run_mutation': 'mutation_time',
+    'cal_pop_fitness': 'fitness_time',
+}
+
+
+class Telemetry:
+    """
+    Pomiary każdej generacji (czasy etapów, liczba ocen, statystyki dopasowania,
+    różnorodność) zapisywane do prealokowanej tablicy strukturalnej NumPy
+    i eksportowane do pliku JSON Lines.
+    """
+
+    def __init__(self, capacity):
+        self.records = np.zeros(capacity, dtype=TELEMETRY_DTYPE)
+        self.count = 0
+        self.initial_fitness_time = 0.0
+        self._phase_times = dict.fromkeys(_PHASES.values(), 0.0)
+        self._generation_start = None
+        self._evaluations = 0
+        self._true_evaluations = 0
+
+    def attach(self, ga_instance):
+        """
+        Opakowuje metody etapów generacji pomiarem czasu i podpina telemetrię
+        pod callback on_generation (atrybut ga_instance.telemetry)
+        """
+        for method_name, field in _PHASES.items():
+            setattr(ga_instance, method_name, self._timed(getattr(ga_instance, method_name), field))
+        ga_instance.telemetry = self
+
+    def _timed(self, method, field):
+        def timed(*args, **kwargs):
+            start = time.perf_counter()
+            result = method(*args, **kwargs)
+            end = time.perf_counter()
+            self._phase_times[field] += end - start
+            if self._generation_start is None and field == 'fitness_time':
+                # Ocena populacji początkowej, przed pierwszą generacją
+                self.initial_fitness_time = self._phase_times[field]
+                self._phase_times[field] = 0.0
+                self._evaluations = method.__self__.num_fitness_evaluations
+                self._true_evaluations = true_evaluations(method.__self__)
+                self._generation_start = end
+            return result
+        return timed
+
+    def record(self, ga_instance):
+        """
+        Zapisuje pomiary bieżącej generacji (dopasowanie jest już policzone)
+        """
+        if self.count >= len(self.records):
+            return
+
+        now = time.perf_counter()
+        fitness = ga_instance.last_generation_fitness
+        evaluations = ga_instance.num_fitness_evaluations
+        evaluated = true_evaluations(ga_instance)
+        surrogate = getattr(ga_instance, 'surrogate', None)
+
+        row = self.records[self.count]
+        row['generation'] = ga_instance.generations_completed
+        for field, elapsed in self._phase_times.items():
+            row[field] = elapsed
+        row['generation_time'] = now - self._generation_start
+        row['evaluations'] = evaluations - self._evaluations
+        # Oceny prawdziwą funkcją i korelacja rang przewidywań modelu zastępczego
+        # z prawdziwymi wartościami (nan bez modelu)
+        row['true_evaluations'] = evaluated - self._true_evaluations
+        row['rank_correlation'] = np.nan if surrogate is None else surrogate.rank_correlation
+        row['best_fitness'] = np.max(fitness)
+        row['mean_fitness'] = np.mean(fitness)
+        row['std_fitness'] = np.std(fitness)
+        row['diversity'] = EarlyStopping.diversity(ga_instance)
+
+        self.count += 1
+        self._phase_times = dict.fromkeys(self._phase_times, 0.0)
+        self._evaluations = evaluations
+        self._true_evaluations = evaluated
+        self._generation_start = time.perf_counter()
+
+    def data(self):
+        """
+        Zapisane rekordy (bez niewykorzystanej części bufora)
+        """
+        return self.records[:self.count]
+
+    def summary(self):
+        """
+        Łączny czas każdego etapu
+        """
+        data = self.data()
+        totals = {field: float(data[field].sum()) for field in _PHASES.values()}
+        totals['initial_fitness_time'] = self.initial_fitness_time
+        totals['generation_time'] = float(data['generation_time'].sum())
+        return totals
+
+    def save(self, path):
+        """
+        Zapisuje rekordy do pliku JSON Lines (jeden obiekt na generację);
+        brakujące wartości (nan, np. rank_correlation bez modelu zastępczego)
+        są zapisywane jako null
+        """
+        names = TELEMETRY_DTYPE.names
+        try:
+            with open(path, 'w') as f:
+                for values in self.data().tolist():
+                    record = {name: None if isinstance(value, float) and np.isnan(value) else value
+                              for name, value in zip(names, values)}
+                    f.write(json.dumps(record, allow_nan=False) + '\n')
+            logger.info(f"Telemetria zapisana do pliku {path}")
+        except OSError as e:
+            logger.error(f"Błąd podczas zapisywania telemetrii: {str(e)}")
+
+    @staticmethod
+    def on_generation(ga_instance):
+        telemetry = getattr(ga_instance, 'telemetry', None)
+        if telemetry is not None:
+            telemetry.record(ga_instance)
+
+
+def profile_call(function, profiler=None, path=None):
+    """
+    Wywołuje function pod profilerem ('cprofile' lub 'pyinstrument'; None
+    wyłącza) i zapisuje wynik do path (statystyki pstats lub raport HTML).
+    """
+    if profiler is None:
+        return function()
+
+    if profiler == 'cprofile':
+        profile = cProfile.Profile()
+        result = profile.runcall(function)
+        profile.dump_stats(path or 'ga_profile.prof')
+        return result
+
+    if profiler == 'pyinstrument':
+        try:
+            from pyinstrument import Profiler
+        except ImportError:
+            raise ImportError("Profilowanie 'pyinstrument' wymaga pakietu pyinstrument")
+        profile = Profiler()
+        profile.start()
+        try:
+            result = function()
+        finally:
+            profile.stop()
+        with open(path or 'ga_profile.html', 'w') as f:
+            f.write(profile.output_html())
+        return result
+
+    raise ValueError(f"Nieznany profiler '{profiler}'. Dostępne: cprofile, pyinstrument")
@@ -0,0 +1,55 @@
+import numpy as np
+import pytest
+from fitness_function import FitnessFunction
+
+
+def reference_decode(binary_solution, max_val, min_val, num_genes, bits_per_gene):
+    """
+    Pierwotny dekoder z pętlą po bitach (liczby całkowite Pythona, bez przepełnienia)
+    """
+    decoded_solution = np.zeros(num_genes)
+    for i in range(num_genes):
+        gene_bits = binary_solution[i * bits_per_gene:(i + 1) * bits_per_gene]
+        decimal_value = 0
+        for bit_idx, bit in enumerate(gene_bits):
+            decimal_value += int(bit) * (2 ** (bits_per_gene - bit_idx - 1))
+        max_decimal = 2 ** bits_per_gene - 1
+        decoded_solution[i] = min_val + ((max_val - min_val) * decimal_value) / max_decimal
+    return decoded_solution
+
+
+@pytest.mark.parametrize('bits_per_gene', [1, 8, 20, 24, 25, 53, 54, 64])
+def test_matches_reference_decoder_on_bits(bits_per_gene):
+    rng = np.random.default_rng(bits_per_gene)
+    num_genes = 3
+    population = rng.integers(0, 2, size=(20, num_genes * bits_per_gene))
+    # Skrajne wartości: same zera i same jedynki
+    population[0] = 0
+    population[1] = 1
+
+    decoded = FitnessFunction.decode_binary_population(population, 20, -20, num_genes, bits_per_gene)
+    expected = np.array([reference_decode(row, 20, -20, num_genes, bits_per_gene) for row in population])
+
+    np.testing.assert_allclose(decoded, expected, rtol=1e-12, atol=1e-12)
+
+
+@pytest.mark.parametrize('bits_per_gene', [5, 20, 64])
+def test_packed_storage_matches_unpacked(bits_per_gene):
+    rng = np.random.default_rng(0)
+    population = rng.integers(0, 2, size=(10, 2 * bits_per_gene))
+    packed = np.packbits(population.astype(np.uint8), axis=1)
+
+    for encoding in ('plain', 'gray'):
+        np.testing.assert_array_equal(
+            FitnessFunction.decode_binary_population(packed, 5, -5, 2, bits_per_gene, encoding, packed=True),
+            FitnessFunction.decode_binary_population(population, 5, -5, 2, bits_per_gene, encoding))
+
+
+def test_gray_matches_reference_after_conversion():
+    rng = np.random.default_rng(1)
+    gray = rng.integers(0, 2, size=(10, 2 * 12))
+    plain = np.bitwise_xor.accumulate(gray.reshape(10, 2, 12), axis=-1).reshape(10, -1)
+
+    decoded = FitnessFunction.decode_binary_population(gray, 1, 0, 2, 12, encoding='gray')
+    expected = np.array([reference_decode(row, 1, 0, 2, 12) for row in plain])
+    np.testing.assert_allclose(decoded, expected, rtol=1e-12, atol=1e-12)
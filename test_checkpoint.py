@@ -0,0 +1,34 @@
+import numpy as np
+import pytest
+from config_loader import ConfigLoader, run_configuration
+
+CONFIGS = {
+    'real_pygad': {'gene_type': 'float', 'is_binary': False, 'parent_selection_type': 'tournament',
+                   'crossover_type': 'single_point', 'mutation_type': 'random'},
+    'binary_gaussian': {'gene_type': 'int', 'is_binary': True, 'bits_per_gene': 20,
+                        'parent_selection_type': 'random', 'crossover_type': 'uniform',
+                        'mutation_type': 'gaussian'},
+    'real_numpy': {'gene_type': 'float', 'is_binary': False, 'parent_selection_type': 'tournament',
+                   'crossover_type': 'uniform', 'mutation_type': 'random', 'backend': 'numpy'},
+}
+
+
+def make_config(name, num_generations, **options):
+    return ConfigLoader.config_from_json({
+        'num_generations': num_generations, 'sol_per_pop': 30, 'num_parents_mating': 15, 'num_genes': 2,
+        'init_range_low': -20, 'init_range_high': 20, 'log_interval': 0, **CONFIGS[name], **options})
+
+
+@pytest.mark.parametrize('name', sorted(CONFIGS))
+def test_resume_matches_uninterrupted_run(name, tmp_path):
+    path = str(tmp_path / 'run.npz')
+    full = run_configuration(make_config(name, 30), seed=11, visualize=False)
+
+    # Przebieg przerwany po 12 generacjach i wznowiony z punktu kontrolnego
+    run_configuration(make_config(name, 12, checkpoint_path=path, checkpoint_interval=12), seed=11, visualize=False)
+    resumed = run_configuration(make_config(name, 30, resume_from=path), seed=11, visualize=False)
+
+    np.testing.assert_array_equal(resumed['fitness_history'], full['fitness_history'])
+    np.testing.assert_array_equal(resumed['best_solution'], full['best_solution'])
+    assert resumed['function_value'] == full['function_value']
+    assert resumed['generations'] == full['generations']
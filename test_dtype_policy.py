@@ -0,0 +1,33 @@
+import numpy as np
+from config_loader import ConfigLoader, run_configuration
+from mutation import _add_gaussian_noise
+
+
+def binary_gaussian_config(dtype_policy):
+    return ConfigLoader.config_from_json({
+        'num_generations': 30, 'sol_per_pop': 40, 'num_parents_mating': 20, 'num_genes': 2,
+        'init_range_low': -20, 'init_range_high': 20, 'gene_type': 'int', 'is_binary': True,
+        'bits_per_gene': 20, 'parent_selection_type': 'random', 'crossover_type': 'uniform',
+        'mutation_type': 'gaussian', 'mutation_sigma': 3.0, 'log_interval': 0,
+        'dtype_policy': dtype_policy})
+
+
+def test_gaussian_noise_is_clipped_to_integer_range():
+    np.random.seed(0)
+    # Szum o obu znakach na granicach zakresu typu: bez przycięcia wartości zawijają się
+    low = _add_gaussian_noise(np.zeros((50, 20), dtype=np.uint8), 1.0, 3.0)
+    high = _add_gaussian_noise(np.full((50, 20), 127, dtype=np.int8), 1.0, 3.0)
+    assert low.min() == 0 and low.max() < 20
+    assert high.max() == 127 and high.min() > 100
+
+
+def test_compact_binary_gaussian_matches_default():
+    results = {policy: run_configuration(binary_gaussian_config(policy), seed=7, visualize=False)
+               for policy in ('default', 'compact')}
+
+    np.testing.assert_array_equal(results['compact']['decoded_solution'], results['default']['decoded_solution'])
+    assert results['compact']['function_value'] == results['default']['function_value']
+    for stats in results.values():
+        assert np.all(stats['decoded_solution'] >= -20) and np.all(stats['decoded_solution'] <= 20)
+        trajectory = np.atleast_2d(stats['trajectory'])
+        assert np.all(trajectory >= -20) and np.all(trajectory <= 20)
@@ -0,0 +1,21 @@
+import numpy as np
+from fitness_function import FitnessCache
+
+
+def test_bit_and_raw_keys_do_not_collide():
+    # Wiersz 0/1 jest kluczowany spakowanymi bitami, bajt 128 surowymi bajtami: oba to 0x80
+    keys = FitnessCache.keys(np.array([[1], [128]], dtype=np.uint8))
+    assert keys[0] != keys[1]
+
+
+def test_raw_keys_depend_on_dtype():
+    keys = FitnessCache.keys(np.array([[2, 0]], dtype=np.int8)) + FitnessCache.keys(np.array([[2]], dtype=np.int16))
+    assert keys[0] != keys[1]
+
+
+def test_cache_returns_distinct_values_for_colliding_rows():
+    cache = FitnessCache(10)
+    first, second = FitnessCache.keys(np.array([[1], [128]], dtype=np.uint8))
+    cache.put(first, 1.0)
+    assert cache.get(second) is None
+    assert cache.stats() == {'cache_hits': 0, 'cache_misses': 1, 'cache_size': 1}
@@ -0,0 +1,19 @@
+import numpy as np
+import pytest
+from config_loader import ConfigLoader, run_configuration
+
+
+@pytest.mark.parametrize('bit_storage', ['unpacked', 'packed'])
+def test_binary_islands_migrate(bit_storage):
+    config = ConfigLoader.config_from_json({
+        'num_generations': 12, 'sol_per_pop': 20, 'num_parents_mating': 10, 'num_genes': 2,
+        'init_range_low': -20, 'init_range_high': 20, 'gene_type': 'int', 'is_binary': True,
+        'bits_per_gene': 20, 'bit_storage': bit_storage, 'parent_selection_type': 'tournament',
+        'crossover_type': 'single_point', 'mutation_type': 'random', 'log_interval': 0,
+        'islands': 2, 'migration_interval': 3, 'migration_size': 2})
+
+    stats = run_configuration(config, seed=5, visualize=False)
+
+    assert stats['generations'] == 12
+    assert len(stats['island_function_values']) == 2
+    assert np.all(np.abs(stats['decoded_solution']) <= 20)
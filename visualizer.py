@@ -1,9 +1,46 @@
 import os
 from datetime import datetime
+from functools import lru_cache
 import matplotlib.pyplot as plt
 import numpy as np
+from objectives import get_objective
+
+
+@lru_cache(maxsize=None)
+def _function_grid(objective_name, num_genes, points):
+    """
+    Siatka wartości funkcji celu w dziedzinie dwóch pierwszych zmiennych
+    (pozostałe ustalone w punkcie optimum), liczona raz dla danej rozdzielczości.
+    """
+    objective = get_objective(objective_name)
+    low, high = objective.domain
+    x = np.linspace(low, high, points)
+    y = np.linspace(low, high, points)
+    X, Y = np.meshgrid(x, y)
+
+    grid_points = np.broadcast_to(objective.optimum(num_genes), X.shape + (num_genes,)).copy()
+    grid_points[..., 0] = X
+    grid_points[..., 1] = Y
+    Z = objective(grid_points)
+
+    for array in (X, Y, Z):
+        array.flags.writeable = False
+    return X, Y, Z
+
 
 class Visualizer:
+    # W trybie bez okien (headless) wykresy są tylko zapisywane do plików
+    headless = False
+
+    @staticmethod
+    def set_headless(headless=True):
+        """
+        Włącza tryb bez okien: backend Agg i brak plt.show()
+        """
+        Visualizer.headless = headless
+        if headless:
+            plt.switch_backend('Agg')
+
     @staticmethod
     def create_output_folder(config_name):
         """
@@ -22,55 +59,90 @@ class Visualizer:
         return config_dir
 
     @staticmethod
-    def plot_fitness_history(ga_instance, title_prefix=""):
+    def _finish(fig, output_name, file_prefix):
+        """
+        Zapisuje wykres i wyświetla go (poza trybem headless)
+        """
+        output_dir = Visualizer.create_output_folder(output_name)
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        filename = f'{file_prefix}_{timestamp}.png'
+        fig.savefig(os.path.join(output_dir, filename))
+        if not Visualizer.headless:
+            plt.show()
+        plt.close(fig)
+
+    @staticmethod
+    def render(stats, title_prefix="", output_name=None):
+        """
+        Rysuje wszystkie wykresy na podstawie zapisanej historii przebiegu
+        (stats zwracane przez GeneticAlgorithm.run).
+        """
+        output_name = output_name or title_prefix.strip(": ")
+        objective_name = stats.get('objective', 'martin_gaddy')
+        Visualizer.plot_fitness_history(stats['fitness_history'], title_prefix, output_name)
+
+        # Wykresy w przestrzeni zmiennych wymagają co najmniej dwóch wymiarów
+        if np.atleast_2d(stats['trajectory']).shape[1] < 2:
+            return
+        Visualizer.plot_solution_trajectory(stats['trajectory'], title_prefix, output_name, objective_name)
+        Visualizer.plot_3d_function_surface(stats['trajectory'], title_prefix, output_name, objective_name)
+
+    @staticmethod
+    def save_run(stats, output_name):
+        """
+        Zapisuje dane do wykresów przebiegu (historia dopasowania, trajektoria,
+        funkcja celu) w folderze wyników, żeby narysować je po zakończeniu przeglądu
+        """
+        path = os.path.join(Visualizer.create_output_folder(output_name), 'plot_data.npz')
+        np.savez(path, fitness_history=np.asarray(stats['fitness_history']),
+                 trajectory=np.atleast_2d(stats['trajectory']),
+                 objective=stats.get('objective', 'martin_gaddy'),
+                 binary='decoded_solution' in stats)
+        return path
+
+    @staticmethod
+    def render_results(names):
+        """
+        Osobny etap rysowania po zakończeniu wszystkich przebiegów, na podstawie
+        danych zapisanych przez save_run
+        """
+        for name in names:
+            path = os.path.join(Visualizer.create_output_folder(name), 'plot_data.npz')
+            with np.load(path) as data:
+                stats = {'fitness_history': data['fitness_history'],
+                         'trajectory': data['trajectory'],
+                         'objective': str(data['objective'])}
+                binary = bool(data['binary'])
+            title_prefix = "Binary Representation: " if binary else "Real Representation: "
+            Visualizer.render(stats, title_prefix, output_name=name)
+
+    @staticmethod
+    def plot_fitness_history(fitness_history, title_prefix="", output_name=None):
         """
         Plots the fitness history throughout generations.
         """
-        plt.figure(figsize=(10, 6))
-        plt.plot(ga_instance.best_solutions_fitness, color='blue', linewidth=2)
+        fig = plt.figure(figsize=(10, 6))
+        plt.plot(fitness_history, color='blue', linewidth=2)
         plt.title(f'{title_prefix}Fitness History')
         plt.xlabel('Generation')
         plt.ylabel('Fitness Value')
         plt.grid(True, alpha=0.3)
         plt.tight_layout()
 
-        output_dir = Visualizer.create_output_folder(title_prefix.strip(": "))
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        filename = f'fitness_history_{timestamp}.png'
-        plt.savefig(os.path.join(output_dir, filename))
-        plt.show()
+        Visualizer._finish(fig, output_name or title_prefix.strip(": "), 'fitness_history')
 
     @staticmethod
-    def plot_solution_trajectory(ga_instance, title_prefix=""):
+    def plot_solution_trajectory(trajectory, title_prefix="", output_name=None, objective_name='martin_gaddy'):
         """
         Rysuje trajektorię najlepszych rozwiązań na płaszczyźnie funkcji celu.
         """
-        plt.figure(figsize=(10, 8))
-
-        solutions = np.array(ga_instance.best_solutions)
-
-        if solutions.ndim == 1 or (solutions.ndim == 2 and solutions.shape[1] == 1):
-            best_solution = ga_instance.best_solution()[0]
-            solutions = np.array([best_solution])
-
-        if hasattr(ga_instance, 'is_binary') and ga_instance.is_binary:
-            from fitness_function import FitnessFunction
-            decoded_solutions = []
-            for solution in solutions:
-                decoded = FitnessFunction.decode_binary(
-                    solution,
-                    ga_instance.gene_range_high,
-                    ga_instance.gene_range_low,
-                    ga_instance.num_genes_original,
-                    ga_instance.bits_per_gene
-                )
-                decoded_solutions.append(decoded)
-            solutions = np.array(decoded_solutions)
-
-        x = np.linspace(-20, 20, 100)
-        y = np.linspace(-20, 20, 100)
-        X, Y = np.meshgrid(x, y)
-        Z = (X - Y) ** 2 + ((X + Y - 10) / 3) ** 2
+        fig = plt.figure(figsize=(10, 8))
+
+        solutions = np.atleast_2d(trajectory)
+        objective = get_objective(objective_name)
+        optimum = objective.optimum(solutions.shape[1])
+
+        X, Y, Z = _function_grid(objective_name, solutions.shape[1], 100)
 
         contour = plt.contourf(X, Y, Z, levels=50, cmap='Blues')
         plt.colorbar(contour, label='Function Value')
@@ -82,8 +154,8 @@ class Visualizer:
             plt.plot(solutions[0][0], solutions[0][1], 'o', color='royalblue',
                      markersize=8, alpha=0.7, label='Best Solution')
 
-        plt.scatter([5], [5], c='yellow', s=250, marker='*',
-                    edgecolors='black', linewidth=1, label='Global Optimum [5,5]')
+        plt.scatter([optimum[0]], [optimum[1]], c='yellow', s=250, marker='*',
+                    edgecolors='black', linewidth=1, label=f'Global Optimum [{optimum[0]:g},{optimum[1]:g}]')
 
         plt.title(f'{title_prefix}Trajectory of Best Solutions')
         plt.xlabel('x₁')
@@ -92,77 +164,46 @@ class Visualizer:
         plt.grid(True, alpha=0.3)
         plt.tight_layout()
 
-        output_dir = Visualizer.create_output_folder(title_prefix.strip(": "))
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        filename = f'solution_trajectory_{timestamp}.png'
-        plt.savefig(os.path.join(output_dir, filename))
-        plt.show()
+        Visualizer._finish(fig, output_name or title_prefix.strip(": "), 'solution_trajectory')
 
     @staticmethod
-    def plot_3d_function_surface(ga_instance, title_prefix=""):
+    def plot_3d_function_surface(trajectory, title_prefix="", output_name=None, objective_name='martin_gaddy'):
         """
         Rysuje powierzchnię funkcji celu w 3D z trajektorią najlepszych rozwiązań.
         """
         fig = plt.figure(figsize=(14, 8))
         ax = fig.add_subplot(111, projection='3d')
 
-        # Pobierz najlepsze rozwiązania z każdej generacji
-        solutions = np.array(ga_instance.best_solutions)
-
-        # Sprawdź wymiary tablicy rozwiązań i przekształć ją w razie potrzeby
-        if solutions.ndim == 1 or (solutions.ndim == 2 and solutions.shape[1] == 1):
-            best_solution = ga_instance.best_solution()[0]
-            solutions = np.array([best_solution])
-
-        if hasattr(ga_instance, 'is_binary') and ga_instance.is_binary:
-            from fitness_function import FitnessFunction
-            decoded_solutions = []
-            for solution in solutions:
-                decoded = FitnessFunction.decode_binary(
-                    solution,
-                    ga_instance.gene_range_high,
-                    ga_instance.gene_range_low,
-                    ga_instance.num_genes_original,
-                    ga_instance.bits_per_gene
-                )
-                decoded_solutions.append(decoded)
-            solutions = np.array(decoded_solutions)
-
-        x = np.linspace(-20, 20, 50)
-        y = np.linspace(-20, 20, 50)
-        X, Y = np.meshgrid(x, y)
-        Z = (X - Y) ** 2 + ((X + Y - 10) / 3) ** 2
+        # Najlepsze rozwiązania z historii przebiegu (history.py, już zdekodowane)
+        solutions = np.atleast_2d(trajectory)
+        objective = get_objective(objective_name)
+        optimum = objective.optimum(solutions.shape[1])
+
+        X, Y, Z = _function_grid(objective_name, solutions.shape[1], 50)
 
         surf = ax.plot_surface(X, Y, Z, cmap='coolwarm', alpha=0.6)
         fig.colorbar(surf, shrink=0.5, aspect=5)
 
-        def martin_gaddy(solution):
-            x1, x2 = solution[0], solution[1]
-            return (x1 - x2) ** 2 + ((x1 + x2 - 10) / 3) ** 2
+        values = objective(solutions)
 
         if len(solutions) > 1:
-            ax.scatter(solutions[:, 0], solutions[:, 1],
-                      [martin_gaddy(s) for s in solutions],
+            ax.scatter(solutions[:, 0], solutions[:, 1], values,
                       c='blue', s=30, depthshade=False, alpha=0.5,
                       label='Solutions Trajectory')
         else:
-            ax.scatter(solutions[0][0], solutions[0][1],
-                      martin_gaddy(solutions[0]),
+            ax.scatter(solutions[0][0], solutions[0][1], values[0],
                       c='blue', s=50, depthshade=False,
                       label='Best Solution')
 
-        ax.scatter([5], [5], [0], c='yellow', s=200, marker='*',
-                  edgecolors='black', label='Global Optimum [5,5,0]')
+        ax.scatter([optimum[0]], [optimum[1]], [objective.optimum_value], c='yellow', s=200, marker='*',
+                  edgecolors='black',
+                  label=f'Global Optimum [{optimum[0]:g},{optimum[1]:g},{objective.optimum_value:g}]')
 
-        ax.set_title(f'{title_prefix}Martin and Gaddy Function Surface with Optimization Trajectory')
+        ax.set_title(f'{title_prefix}{objective.name} Function Surface with Optimization Trajectory')
         ax.set_xlabel('x₁')
         ax.set_ylabel('x₂')
         ax.set_zlabel('Function Value')
         ax.legend(bbox_to_anchor=(1.1, 1), loc='upper left')
         plt.tight_layout()
 
-        output_dir = Visualizer.create_output_folder(title_prefix.strip(": "))
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        filename = f'3d_surface_{timestamp}.png'
-        plt.savefig(os.path.join(output_dir, filename))
-        plt.show()
\ No newline at end of file
+        Visualizer._finish(fig, output_name or title_prefix.strip(": "), '3d_surface')